@@ -1,6 +1,9 @@
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from sqlalchemy.orm.attributes import set_committed_value
+from typing import Dict, List, Optional
 from app.models.comment import Comment
+from app.models.post import Post
+from app.utils.dataloader import get_loader
 
 def create_comment(db: Session, content: str, post_id: int) -> Comment:
     """
@@ -57,6 +60,47 @@ def get_comments_for_post(db: Session, post_id: int, skip: int = 0, limit: int =
     )
 
 
+def comments_by_post(db: Session, post_ids: List[int]) -> Dict[int, List[Comment]]:
+    """
+    Batch function for the comment loader: comments of many posts in one query.
+
+    Args:
+        db (Session): Database session.
+        post_ids (List[int]): Post IDs to resolve.
+
+    Returns:
+        Dict[int, List[Comment]]: Comments per post ID, oldest first.
+    """
+    comments: Dict[int, List[Comment]] = {post_id: [] for post_id in post_ids}
+    rows = (
+        db.query(Comment)
+        .filter(Comment.post_id.in_(post_ids))
+        .order_by(Comment.id)
+        .all()
+    )
+    for comment in rows:
+        comments[comment.post_id].append(comment)
+    return comments
+
+
+def load_comments(db: Session, posts: List[Post]) -> List[Post]:
+    """
+    Fill post.comments for a whole page of posts with one query.
+
+    Args:
+        db (Session): Database session.
+        posts (List[Post]): Posts about to be serialized.
+
+    Returns:
+        List[Post]: The same posts, comments loaded.
+    """
+    comments = get_loader(db, comments_by_post).load_many(post.id for post in posts)
+    for post, post_comments in zip(posts, comments):
+        # Mark the relationship as loaded so serialization doesn't query again
+        set_committed_value(post, "comments", post_comments)
+    return posts
+
+
 def delete_comment(db: Session, comment_id: int) -> Optional[Comment]:
     """
     Delete a comment by ID.
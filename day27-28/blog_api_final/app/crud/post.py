@@ -1,7 +1,11 @@
-from sqlalchemy.orm import Session, selectinload
-from typing import List, Optional
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
+from typing import Dict, List, Optional
 from app.models.post import Post
 from app.models.user import User
+from app.crud.comment import load_comments
+from app.crud.search import search_condition
+from app.utils.dataloader import get_loader
 
 def create_post(db: Session, title: str, content: str, user_id: int) -> Post:
     """
@@ -38,26 +42,47 @@ def get_posts(
     if user_id is not None:
         q = q.filter(Post.user_id == user_id)
 
-    if search:
-        q = q.filter(Post.title.ilike(f"%{search}%"))
+    if search and search.strip():
+        # Full-text match on title and content (see crud/search.py)
+        q = q.filter(search_condition(db, search))
 
     sort_col = getattr(Post, sort, None)
     if sort_col is not None:
         q = q.order_by(sort_col.desc() if desc else sort_col.asc())
 
-    return q.offset(skip).limit(limit).all()
+    return load_comments(db, q.offset(skip).limit(limit).all())
+
+
+def posts_by_user(db: Session, user_ids: List[int]) -> Dict[int, List[Post]]:
+    """
+    Batch function for the post loader: posts of many users in one query.
+    """
+    posts: Dict[int, List[Post]] = {user_id: [] for user_id in user_ids}
+    for post in db.query(Post).filter(Post.user_id.in_(user_ids)).order_by(Post.id).all():
+        posts[post.user_id].append(post)
+    return posts
+
+
+def load_posts(db: Session, users: List[User]) -> List[User]:
+    """
+    Fill user.posts (and each post's comments) for a page of users.
+    Two queries in total, however many users and posts there are.
+    """
+    posts = get_loader(db, posts_by_user).load_many(user.id for user in users)
+    for user, user_posts in zip(users, posts):
+        set_committed_value(user, "posts", user_posts)
+    load_comments(db, [post for user_posts in posts for post in user_posts])
+    return users
 
 
 def get_posts_for_user(db: Session, user_id: int) -> Optional[User]:
     """
-    Get a user and eagerly load all associated posts.
+    Get a user with all associated posts and their comments loaded.
     """
-    return (
-        db.query(User)
-        .options(selectinload(User.posts))
-        .filter(User.id == user_id)
-        .first()
-    )
+    user = db.query(User).filter(User.id == user_id).first()
+    if user:
+        load_posts(db, [user])
+    return user
 
 
 def update_post(db: Session, post_id: int, title: str, content: str) -> Optional[Post]:
@@ -1,6 +1,7 @@
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from app.models.user import User
+from app.crud.post import load_posts
 
 def create_user(db: Session, email: str, name: str) -> User:
     """
@@ -28,9 +29,9 @@ def get_user(db: Session, user_id: int) -> Optional[User]:
 
 def get_users(db: Session, skip: int = 0, limit: int = 100) -> List[User]:
     """
-    Return paginated list of users.
+    Return paginated list of users, posts and comments loaded in batches.
     """
-    return db.query(User).offset(skip).limit(limit).all()
+    return load_posts(db, db.query(User).offset(skip).limit(limit).all())
 
 
 def update_user(db: Session, user_id: int, name: str) -> Optional[User]:
@@ -6,8 +6,11 @@ from app.routers.users import router as users_router
 from app.routers.posts import router as posts_router
 from app.routers.comments import router as comments_router
 
+from app.crud.search import install_search
+
 # Create database tables
 Base.metadata.create_all(bind=engine)
+install_search(engine)
 
 # Initialize FastAPI application
 app = FastAPI(
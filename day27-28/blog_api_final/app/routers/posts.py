@@ -2,8 +2,9 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
-from app.schemas.post import PostCreate, PostOut
+from app.schemas.post import PostCreate, PostOut, PostSearchHit
 from app.crud.post import create_post, get_post, get_posts, get_posts_for_user, update_post, delete_post
+from app.crud.search import search_posts
 from app.dependencies import get_db
 
 router = APIRouter(prefix="/posts", tags=["Posts"])
@@ -32,6 +33,20 @@ def api_get_posts(
     return get_posts(db, skip, limit, sort, desc, user_id, search)
 
 
+@router.get("/search", response_model=List[PostSearchHit])
+def api_search_posts(
+    q: str = Query(..., min_length=1, pattern=r"\S", description="Search terms"),
+    limit: int = Query(20, ge=1, le=100),
+    skip: int = Query(0, ge=0),
+    db: Session = Depends(get_db)
+):
+    """
+    Full-text search over post titles and content, ranked by relevance,
+    with highlighted titles and content snippets.
+    """
+    return search_posts(db, q, limit=limit, offset=skip)
+
+
 @router.get("/{post_id}", response_model=PostOut)
 def api_get_post(post_id: int, db: Session = Depends(get_db)):
     """
@@ -4,6 +4,7 @@ from typing import List
 
 from app.schemas.user import UserCreate, UserOut
 from app.crud.user import create_user, get_user, get_users, update_user, delete_user
+from app.crud.post import load_posts
 from app.dependencies import get_db
 
 router = APIRouter(prefix="/users", tags=["Users"])
@@ -100,7 +101,7 @@ def api_get_user(user_id: int, db: Session = Depends(get_db)):
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
-    return user
+    return load_posts(db, [user])[0]
 
 
 @router.put(
@@ -139,7 +140,7 @@ def api_update_user(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
-    return updated
+    return load_posts(db, [updated])[0]
 
 
 @router.delete(
@@ -44,3 +44,11 @@ class PostOut(PostBase):
             }
         }
     }
+
+
+class PostSearchHit(BaseModel):
+    """One full-text search result, best matches first."""
+    post: PostOut
+    rank: float = Field(..., description="Relevance score, higher is better")
+    title_highlight: str = Field(..., description="Title with matches wrapped in <mark>")
+    snippet: str = Field(..., description="Best-matching fragment of the content, matches wrapped in <mark>")
@@ -0,0 +1,58 @@
+"""
+Request-scoped batching loader for relationships.
+
+Instead of letting each post lazy-load its own comments (one query per row),
+the crud layer collects the keys of a whole page and resolves them with one
+IN query per relationship. Results are cached for the rest of the request.
+
+Loaders are stored on the session (`db.info`) and get_db opens one session
+per request, so the cache is dropped when the request ends.
+"""
+
+from typing import Any, Callable, Dict, Hashable, Iterable, List
+
+from sqlalchemy.orm import Session
+
+# (db, unique keys) -> {key: value}; keys missing from the result load as None
+BatchFn = Callable[[Session, List[Any]], Dict[Any, Any]]
+
+
+class DataLoader:
+    def __init__(self, db: Session, batch_fn: BatchFn):
+        self.db = db
+        self.batch_fn = batch_fn
+        self._cache: Dict[Hashable, Any] = {}
+
+    def load(self, key: Hashable) -> Any:
+        return self.load_many([key])[0]
+
+    def load_many(self, keys: Iterable[Hashable]) -> List[Any]:
+        """
+        Values for keys, in order. Everything not cached yet is fetched
+        in a single batch call.
+        """
+        keys = list(keys)
+        missing = [key for key in dict.fromkeys(keys) if key not in self._cache]
+        if missing:
+            found = self.batch_fn(self.db, missing)
+            for key in missing:
+                self._cache[key] = found.get(key)
+        return [self._cache[key] for key in keys]
+
+    def prime(self, key: Hashable, value: Any) -> None:
+        """Seed the cache with a value the caller already has."""
+        self._cache.setdefault(key, value)
+
+    def clear(self) -> None:
+        """Forget cached values, e.g. after the request writes to the rows they came from."""
+        self._cache.clear()
+
+
+def get_loader(db: Session, batch_fn: BatchFn) -> DataLoader:
+    """
+    The session's loader for batch_fn, created on first use.
+    """
+    loaders = db.info.setdefault("dataloaders", {})
+    if batch_fn not in loaders:
+        loaders[batch_fn] = DataLoader(db, batch_fn)
+    return loaders[batch_fn]
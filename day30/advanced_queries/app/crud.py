@@ -1,7 +1,50 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import or_, and_
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import func, select, tuple_
+from fastapi import HTTPException
 from . import models
+from .search import search_condition
 from datetime import datetime
+import base64
+import json
+
+SORTABLE = ("created_at", "title", "author", "id")
+MAX_PAGE_SIZE = 100
+
+
+def _encode_cursor(sort: str, post: models.Post) -> str:
+    value = getattr(post, sort)
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    return base64.urlsafe_b64encode(json.dumps([sort, value, post.id]).encode()).decode()
+
+
+def _decode_cursor(sort: str, cursor: str):
+    try:
+        cursor_sort, value, post_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if cursor_sort != sort:
+            raise ValueError("cursor belongs to a different sort")
+        if sort == "created_at":
+            value = datetime.fromisoformat(value)
+        return value, int(post_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _tag_filter(tags: list, tag_match: str):
+    names = set(tags)
+    if tag_match == "all":
+        # Posts carrying every requested tag: one row per post, no duplicates
+        tagged = (
+            select(models.post_tags.c.post_id)
+            .join(models.Tag, models.Tag.id == models.post_tags.c.tag_id)
+            .where(models.Tag.name.in_(names))
+            .group_by(models.post_tags.c.post_id)
+            .having(func.count(func.distinct(models.Tag.id)) == len(names))
+        )
+        return models.Post.id.in_(tagged)
+    # EXISTS rather than a join, so a post with several matching tags appears once
+    return models.Post.tags.any(models.Tag.name.in_(names))
+
 
 def get_posts(
     db: Session,
@@ -11,37 +54,56 @@ def get_posts(
     to_date: str = None,
     sort: str = "created_at",
     order: str = "desc",
-    tags: list = None
+    tags: list = None,
+    tag_match: str = "any",
+    limit: int = 20,
+    cursor: str = None,
+    include_total: bool = False
 ):
-    query = db.query(models.Post)
-
-    # Search
-    if search:
-        query = query.filter(
-            or_(
-                models.Post.title.ilike(f"%{search}%"),
-                models.Post.content.ilike(f"%{search}%")
-            )
-        )
+    """
+    One page of posts plus the cursor for the next page (None on the last page),
+    and the total number of matches when include_total is set.
+    """
+    if sort not in SORTABLE:
+        raise HTTPException(status_code=400, detail=f"sort must be one of {', '.join(SORTABLE)}")
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+
+    query = select(models.Post)
+
+    # Search (full-text index, see search.py)
+    if search and search.strip():
+        query = query.where(search_condition(db, search))
 
     # Filter by author
     if author:
-        query = query.filter(models.Post.author == author)
+        query = query.where(models.Post.author == author)
 
     # Filter by date range
     if from_date and to_date:
-        query = query.filter(
+        query = query.where(
             models.Post.created_at.between(from_date, to_date)
         )
 
     # Filter by tags
     if tags:
-        query = query.join(models.Post.tags).filter(models.Tag.name.in_(tags))
+        query = query.where(_tag_filter(tags, tag_match))
+
+    total = None
+    if include_total:
+        total = db.scalar(select(func.count()).select_from(query.subquery()))
 
-    # Sorting
-    if order == "desc":
-        query = query.order_by(getattr(models.Post, sort).desc())
+    # Keyset pagination on (sort column, id), so deep pages cost the same as the first
+    sort_col = getattr(models.Post, sort)
+    descending = order == "desc"
+    if cursor:
+        key = tuple_(sort_col, models.Post.id)
+        value, post_id = _decode_cursor(sort, cursor)
+        query = query.where(key < (value, post_id) if descending else key > (value, post_id))
+    if descending:
+        query = query.order_by(sort_col.desc(), models.Post.id.desc())
     else:
-        query = query.order_by(getattr(models.Post, sort).asc())
+        query = query.order_by(sort_col.asc(), models.Post.id.asc())
 
-    return query.all()
+    posts = db.scalars(query.options(selectinload(models.Post.tags)).limit(limit + 1)).all()
+    next_cursor = _encode_cursor(sort, posts[limit - 1]) if len(posts) > limit else None
+    return posts[:limit], next_cursor, total
@@ -1,14 +1,25 @@
 from fastapi import FastAPI, Depends, Query
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import List, Literal, Optional
 from . import models, schemas, crud, database
+from .search import install_search, search_posts
 
 app = FastAPI()
 
 # Create tables
 models.Base.metadata.create_all(bind=database.engine)
+install_search(database.engine)
 
-@app.get("/posts/", response_model=List[schemas.PostSchema])
+@app.get("/posts/search", response_model=List[schemas.SearchHitSchema])
+def search(
+    q: str = Query(..., min_length=1, pattern=r"\S"),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(database.get_db)
+):
+    return search_posts(db, q, limit=limit, offset=offset)
+
+@app.get("/posts/", response_model=schemas.PostPage)
 def read_posts(
     search: Optional[str] = None,
     author: Optional[str] = None,
@@ -17,10 +28,15 @@ def read_posts(
     sort: str = "created_at",
     order: str = "desc",
     tags: Optional[List[str]] = Query(None),
+    tag_match: Literal["any", "all"] = "any",
+    limit: int = Query(20, ge=1, le=crud.MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    include_total: bool = False,
     db: Session = Depends(database.get_db)
 ):
-    posts = crud.get_posts(
+    posts, next_cursor, total = crud.get_posts(
         db, search=search, author=author, from_date=from_date,
-        to_date=to_date, sort=sort, order=order, tags=tags
+        to_date=to_date, sort=sort, order=order, tags=tags,
+        tag_match=tag_match, limit=limit, cursor=cursor, include_total=include_total
     )
-    return posts
+    return {"items": posts, "next_cursor": next_cursor, "total": total}
@@ -16,3 +16,14 @@ class PostSchema(BaseModel):
     tags: Optional[List[TagSchema]] = []
     class Config:
         from_attributes = True
+
+class PostPage(BaseModel):
+    items: List[PostSchema]
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+
+class SearchHitSchema(BaseModel):
+    post: PostSchema
+    rank: float
+    title_highlight: str
+    snippet: str
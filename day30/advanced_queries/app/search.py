@@ -0,0 +1,129 @@
+"""
+Full-text search over posts (title + content).
+
+PostgreSQL: a generated, weighted tsvector column with a GIN index, plus a
+pg_trgm GIN index on title so misspelled titles still match.
+SQLite (local runs): an external-content FTS5 table kept in sync by triggers.
+Anything else falls back to ILIKE.
+"""
+
+from sqlalchemy import column, func, literal_column, or_, select, table, text
+from sqlalchemy.orm import Session, selectinload
+
+from . import models
+
+HIGHLIGHT_START, HIGHLIGHT_STOP = "<mark>", "</mark>"
+
+posts_fts = table("posts_fts", column("rowid"))
+
+POSTGRES_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    """
+    ALTER TABLE posts ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(content, '')), 'B')
+    ) STORED
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_posts_search_vector ON posts USING gin (search_vector)",
+    "CREATE INDEX IF NOT EXISTS ix_posts_title_trgm ON posts USING gin (title gin_trgm_ops)",
+]
+
+SQLITE_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS posts_fts USING fts5(title, content, content='posts', content_rowid='id')",
+    """
+    CREATE TRIGGER IF NOT EXISTS posts_fts_insert AFTER INSERT ON posts BEGIN
+        INSERT INTO posts_fts (rowid, title, content) VALUES (new.id, new.title, new.content);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS posts_fts_delete AFTER DELETE ON posts BEGIN
+        INSERT INTO posts_fts (posts_fts, rowid, title, content) VALUES ('delete', old.id, old.title, old.content);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS posts_fts_update AFTER UPDATE ON posts BEGIN
+        INSERT INTO posts_fts (posts_fts, rowid, title, content) VALUES ('delete', old.id, old.title, old.content);
+        INSERT INTO posts_fts (rowid, title, content) VALUES (new.id, new.title, new.content);
+    END
+    """,
+]
+
+
+def install_search(engine):
+    """Create the search column/indexes (or FTS5 table). Safe to run on every startup."""
+    with engine.begin() as conn:
+        if engine.dialect.name == "postgresql":
+            for ddl in POSTGRES_DDL:
+                conn.execute(text(ddl))
+        elif engine.dialect.name == "sqlite":
+            exists = conn.execute(text("SELECT 1 FROM sqlite_master WHERE name = 'posts_fts'")).first()
+            for ddl in SQLITE_DDL:
+                conn.execute(text(ddl))
+            if not exists:
+                # Index posts that were there before the FTS table
+                conn.execute(text("INSERT INTO posts_fts (posts_fts) VALUES ('rebuild')"))
+
+
+def _fts5_query(term: str) -> str:
+    # Quote every word so user input can't break FTS5 syntax; prefix-match each one
+    words = term.split()
+    return " ".join('"' + word.replace('"', '""') + '"*' for word in words)
+
+
+def search_condition(db: Session, term: str):
+    """WHERE clause matching posts for term, using whichever index the database has"""
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        query = func.websearch_to_tsquery("english", term)
+        return or_(
+            literal_column("posts.search_vector").op("@@")(query),
+            models.Post.title.op("%")(term),
+        )
+    if dialect == "sqlite":
+        matches = select(posts_fts.c.rowid).where(literal_column("posts_fts").op("MATCH")(_fts5_query(term)))
+        return models.Post.id.in_(matches)
+    return or_(models.Post.title.ilike(f"%{term}%"), models.Post.content.ilike(f"%{term}%"))
+
+
+def search_posts(db: Session, term: str, limit: int = 20, offset: int = 0):
+    """
+    Ranked search hits for term: (post, rank, highlighted title, content snippet).
+    Higher rank is better.
+    """
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        query = func.websearch_to_tsquery("english", term)
+        options = f"StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_STOP}, MaxWords=35, MinWords=15"
+        rank = func.ts_rank_cd(literal_column("posts.search_vector"), query) + func.similarity(models.Post.title, term)
+        stmt = select(
+            models.Post,
+            rank.label("rank"),
+            func.ts_headline("english", models.Post.title, query, f"{options}, HighlightAll=true"),
+            func.ts_headline("english", models.Post.content, query, options),
+        ).where(search_condition(db, term))
+    elif dialect == "sqlite":
+        fts = literal_column("posts_fts")
+        # bm25() is lower-is-better; negate it so rank sorts the same way everywhere
+        rank = -func.bm25(fts, 10.0, 1.0)
+        stmt = (
+            select(
+                models.Post,
+                rank.label("rank"),
+                func.highlight(fts, 0, HIGHLIGHT_START, HIGHLIGHT_STOP),
+                func.snippet(fts, 1, HIGHLIGHT_START, HIGHLIGHT_STOP, "…", 24),
+            )
+            .join(posts_fts, posts_fts.c.rowid == models.Post.id)
+            .where(fts.op("MATCH")(_fts5_query(term)))
+        )
+    else:
+        stmt = select(models.Post, literal_column("0.0").label("rank"), models.Post.title, models.Post.content).where(
+            search_condition(db, term)
+        )
+
+    stmt = stmt.options(selectinload(models.Post.tags))
+    rows = db.execute(stmt.order_by(literal_column("rank").desc(), models.Post.id.desc()).offset(offset).limit(limit))
+    return [
+        {"post": post, "rank": float(rank), "title_highlight": title, "snippet": snippet}
+        for post, rank, title, snippet in rows
+    ]
@@ -0,0 +1,30 @@
+"""Day 42: composite (user_id, id) index for paginated order history
+
+Revision ID: a41c9e7d2f10
+Revises: b2802e64ad58
+Create Date: 2026-10-19 10:12:31.204117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a41c9e7d2f10'
+down_revision: Union[str, Sequence[str], None] = 'b2802e64ad58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('orders', schema=None) as batch_op:
+        batch_op.create_index('ix_orders_user_id_id', ['user_id', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('orders', schema=None) as batch_op:
+        batch_op.drop_index('ix_orders_user_id_id')
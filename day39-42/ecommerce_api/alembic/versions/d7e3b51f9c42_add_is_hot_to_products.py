@@ -0,0 +1,30 @@
+"""Day 42: is_hot flag on products for flash-sale inventory reservations
+
+Revision ID: d7e3b51f9c42
+Revises: a41c9e7d2f10
+Create Date: 2026-10-19 11:03:54.918302
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7e3b51f9c42'
+down_revision: Union[str, Sequence[str], None] = 'a41c9e7d2f10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('products', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('is_hot', sa.Boolean(), server_default=sa.false(), nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('products', schema=None) as batch_op:
+        batch_op.drop_column('is_hot')
@@ -2,7 +2,9 @@ from decimal import Decimal
 from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import get_settings
 from app.core.security import get_current_user, get_admin_user
+from app.core.serialization import category_list_response, product_list_response
 from app.repositories import OrderRepository, ProductRepository 
 from app.database.db import get_async_session
 from app.dependencies import (
@@ -21,10 +23,12 @@ from app.schemas import (
     ProductResponse,
     OrderCreate,
     OrderResponse,
+    OrderSummaryResponse,
 )
 from app.services import CategoryService, ProductService, OrderService
 
 router = APIRouter(prefix="/v1", tags=["v1"])
+settings = get_settings()
 
 # CATEGORY ROUTES
 
@@ -72,13 +76,19 @@ async def get_all_categories(
 
     Public endpoint  no authentication required.
 
+    With FAST_SERIALIZATION enabled the list is dumped through a
+    precompiled TypeAdapter instead of validating every row.
+
     Args:
         service: CategoryService instance.
 
     Returns:
         List of all categories in the system.
     """
-    return await service.get_all_categories()
+    categories = await service.get_all_categories()
+    if settings.FAST_SERIALIZATION:
+        return category_list_response(categories)
+    return categories
 
 
 @router.get(
@@ -231,6 +241,9 @@ async def get_all_products(
     - Price range
     - Pagination
 
+    With FAST_SERIALIZATION enabled the page is dumped through a
+    precompiled TypeAdapter instead of validating every row.
+
     Args:
         search: Partial product name match.
         category_id: Filter by category.
@@ -254,7 +267,10 @@ async def get_all_products(
     if max_price:
         products = [p for p in products if p.price <= max_price]
 
-    return products[skip:skip + limit]
+    page = products[skip:skip + limit]
+    if settings.FAST_SERIALIZATION:
+        return product_list_response(page)
+    return page
 
 
 @router.get(
@@ -377,15 +393,20 @@ async def place_order(
     summary="Get current user's order history",
 )
 async def get_my_orders(
+    limit: int = Query(20, ge=1, le=100, description="Max orders to return"),
+    before_id: int | None = Query(None, gt=0, description="Return orders older than this order id"),
     current_user: User = Depends(get_current_user),
     service: OrderService = Depends(get_order_service),
 ) -> list[OrderResponse]:
     """
-    Retrieve order history for the current user.
+    Retrieve one page of order history for the current user.
 
     Orders include full item details and product snapshots.
+    Pass the id of the last order as before_id to get the next page.
 
     Args:
+        limit: Page size.
+        before_id: Cursor from the previous page.
         current_user: Authenticated user.
         service: OrderService instance.
 
@@ -395,4 +416,33 @@ async def get_my_orders(
     Raises:
         HTTPException: 401 if not authenticated.
     """
-    return await service.get_user_orders(current_user.id)
\ No newline at end of file
+    return await service.get_user_orders(current_user.id, limit, before_id)
+
+
+@router.get(
+    "/users/me/orders/summary",
+    response_model=list[OrderSummaryResponse],
+    summary="Get a lightweight page of the current user's orders",
+)
+async def get_my_order_summaries(
+    limit: int = Query(20, ge=1, le=100, description="Max orders to return"),
+    before_id: int | None = Query(None, gt=0, description="Return orders older than this order id"),
+    current_user: User = Depends(get_current_user),
+    service: OrderService = Depends(get_order_service),
+) -> list[OrderSummaryResponse]:
+    """
+    Retrieve order summaries (id, status, total, item count) for list views.
+
+    No items are loaded, so this stays cheap even for heavy buyers.
+    Pass the id of the last order as before_id to get the next page.
+
+    Args:
+        limit: Page size.
+        before_id: Cursor from the previous page.
+        current_user: Authenticated user.
+        service: OrderService instance.
+
+    Returns:
+        List of order summaries, newest first.
+    """
+    return await service.get_user_order_summaries(current_user.id, limit, before_id)
\ No newline at end of file
@@ -1,10 +1,27 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 
+from app.core.config import get_settings
 from app.models import User
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto",bcrypt__ident="2b",bcrypt__default_rounds=12,)
+settings = get_settings()
+
+# Password hashing context.
+# min/max rounds are pinned to the configured cost, so a hash made with any
+# other rounds is reported as needing an update (see verify_and_rehash_async).
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__ident="2b",
+    bcrypt__default_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__min_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__max_rounds=settings.BCRYPT_ROUNDS,
+)
 
 
 def hash_password(password: str) -> str:
@@ -34,6 +51,182 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+class PasswordHasher:
+    """
+    Runs bcrypt on a small dedicated thread pool instead of the event loop.
+
+    One bcrypt call with 12 rounds takes ~250ms. Called directly from an
+    async endpoint it blocks every other in-flight request for that long.
+    bcrypt releases the GIL, so a few threads are enough to take it off
+    the loop completely.
+
+    The pool is bounded: once max_pending jobs are queued or running, new
+    ones are rejected with 503 instead of piling up behind a login burst.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int):
+        """
+        Initialize the hasher.
+
+        Args:
+            max_workers: Number of hashing threads.
+            max_pending: Max jobs queued or running at the same time.
+        """
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bcrypt")
+
+        # Metrics – only touched from the event loop thread
+        self.pending = 0
+        self.peak_pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self.rehashed = 0
+        self._total_wait = 0.0
+        self._total_work = 0.0
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run a hashing function on the pool.
+
+        Args:
+            func: Blocking function to run (e.g. pwd_context.hash).
+            *args: Arguments for func.
+
+        Returns:
+            Whatever func returns.
+
+        Raises:
+            HTTPException: 503 if the hashing queue is full.
+        """
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many password operations in progress, please retry",
+            )
+
+        submitted = time.perf_counter()
+
+        def job() -> tuple[Any, float, float]:
+            started = time.perf_counter()
+            result = func(*args)
+            return result, started - submitted, time.perf_counter() - started
+
+        self.pending += 1
+        self.peak_pending = max(self.peak_pending, self.pending)
+        try:
+            loop = asyncio.get_running_loop()
+            result, waited, worked = await loop.run_in_executor(self._executor, job)
+        finally:
+            self.pending -= 1
+
+        self.completed += 1
+        self._total_wait += waited
+        self._total_work += worked
+        return result
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Current queue-depth and timing metrics.
+
+        Returns:
+            Dict with pending/queued jobs, peak, totals and average timings.
+        """
+        completed = self.completed or 1
+        return {
+            "workers": self.max_workers,
+            "max_pending": self.max_pending,
+            "pending": self.pending,
+            "queued": max(0, self.pending - self.max_workers),
+            "peak_pending": self.peak_pending,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "rehashed": self.rehashed,
+            "avg_queue_wait_ms": round(self._total_wait / completed * 1000, 2),
+            "avg_hash_ms": round(self._total_work / completed * 1000, 2),
+        }
+
+    def shutdown(self) -> None:
+        """Stop the worker threads. Call this during application shutdown."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+password_hasher = PasswordHasher(
+    max_workers=settings.HASH_WORKERS,
+    max_pending=settings.HASH_MAX_PENDING,
+)
+
+
+async def hash_password_async(password: str) -> str:
+    """
+    Hash a password without blocking the event loop.
+
+    Use this from async endpoints instead of hash_password.
+
+    Args:
+        password: Plain-text password.
+
+    Returns:
+        Hashed password string.
+
+    Raises:
+        HTTPException: 503 if the hashing queue is full.
+    """
+    return await password_hasher.run(pwd_context.hash, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password without blocking the event loop.
+
+    Use this from async endpoints instead of verify_password.
+
+    Args:
+        plain_password: Plain-text password to verify.
+        hashed_password: Hashed password from database.
+
+    Returns:
+        True if password matches, False otherwise.
+
+    Raises:
+        HTTPException: 503 if the hashing queue is full.
+    """
+    return await password_hasher.run(pwd_context.verify, plain_password, hashed_password)
+
+
+async def verify_and_rehash_async(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    """
+    Verify a password and rehash it if it was made with other bcrypt rounds.
+
+    The plain password is only available at login, so this is the one
+    chance to upgrade old hashes after BCRYPT_ROUNDS changes. Store the
+    new hash when one is returned:
+
+        valid, new_hash = await verify_and_rehash_async(password, user.hashed_password)
+        if valid and new_hash:
+            await user_repo.update(user.id, {"hashed_password": new_hash})
+
+    Args:
+        plain_password: Plain-text password to verify.
+        hashed_password: Hashed password from database.
+
+    Returns:
+        (is_valid, new_hash) – new_hash is None when no rehash is needed.
+
+    Raises:
+        HTTPException: 503 if the hashing queue is full.
+    """
+    valid, new_hash = await password_hasher.run(
+        pwd_context.verify_and_update, plain_password, hashed_password
+    )
+    if valid and new_hash:
+        password_hasher.rehashed += 1
+    return valid, new_hash
+
+
 # def get_current_user() -> User:
 #     """
 #     Get the current authenticated user.
@@ -16,6 +16,8 @@ from app.services import (
     CategoryService,
     ProductService,
     OrderService,
+    InventoryService,
+    get_inventory_service,
 )
 
 
@@ -138,34 +140,48 @@ async def get_category_service(
     return CategoryService(category_repo)
 
 
+async def get_inventory() -> InventoryService | None:
+    """
+    Get the shared InventoryService (Redis flash-sale reservations).
+
+    Returns:
+        InventoryService instance, or None when REDIS_URL is not set.
+    """
+    return get_inventory_service()
+
+
 async def get_product_service(
     product_repo: ProductRepository = Depends(get_product_repo),
-    category_repo: CategoryRepository = Depends(get_category_repo),) -> ProductService:
+    category_repo: CategoryRepository = Depends(get_category_repo),
+    inventory: InventoryService | None = Depends(get_inventory),) -> ProductService:
     """
     Get ProductService instance.
 
     Args:
         product_repo: ProductRepository from dependency injection.
         category_repo: CategoryRepository from dependency injection.
+        inventory: InventoryService (or None) from dependency injection.
 
     Returns:
         ProductService instance.
     """
-    return ProductService(product_repo, category_repo)
+    return ProductService(product_repo, category_repo, inventory)
 
 
 async def get_order_service(
-    order_repo: OrderRepository = Depends(get_order_repo),) -> OrderService:
+    order_repo: OrderRepository = Depends(get_order_repo),
+    inventory: InventoryService | None = Depends(get_inventory),) -> OrderService:
     """
     Get OrderService instance.
 
     Args:
         order_repo: OrderRepository from dependency injection.
+        inventory: InventoryService (or None) from dependency injection.
 
     Returns:
         OrderService instance.
     """
-    return OrderService(order_repo)
+    return OrderService(order_repo, inventory)
 
 
 __all__ = [
@@ -177,6 +193,7 @@ __all__ = [
     "get_product_repo",
     "get_order_repo",
     "get_order_item_repo",
+    "get_inventory",
     "get_user_service",
     "get_category_service",
     "get_product_service",
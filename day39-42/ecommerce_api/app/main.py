@@ -1,8 +1,12 @@
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 from fastapi import FastAPI
 
 from app.api.v1.router import router as v1_router
-from app.database.db import engine
+from app.core.config import get_settings
+from app.core.security import password_hasher
+from app.database.db import engine, async_session_factory
+from app.services import get_inventory_service
 from app.models import Base  # imports all models for Base.metadata
 
 
@@ -14,9 +18,13 @@ async def lifespan(app: FastAPI):
     Startup:
         - Creates all database tables from SQLAlchemy models (development only).
         - For production, use Alembic migrations instead.
+        - Loads Redis stock counters for hot products and starts the
+          inventory worker (when REDIS_URL is set).
 
     Shutdown:
+        - Stops the inventory worker and flushes pending stock decrements.
         - Disposes of the async engine.
+        - Stops the password hashing threads.
 
     Args:
         app: FastAPI application instance.
@@ -28,10 +36,31 @@ async def lifespan(app: FastAPI):
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
+    settings = get_settings()
+    inventory = get_inventory_service()
+    inventory_worker = None
+    if inventory:
+        async with async_session_factory() as session:
+            await inventory.load_hot_products(session)
+        inventory_worker = asyncio.create_task(
+            inventory.run_worker(
+                async_session_factory,
+                settings.INVENTORY_FLUSH_INTERVAL,
+                settings.INVENTORY_FLUSH_BATCH,
+            )
+        )
+
     yield
 
-    # Shutdown: Cleanup engine
+    if inventory_worker:
+        inventory_worker.cancel()
+        with suppress(asyncio.CancelledError):
+            await inventory_worker
+        await inventory.flush_pending(async_session_factory, settings.INVENTORY_FLUSH_BATCH)
+
+    # Shutdown: Cleanup engine and hashing pool
     await engine.dispose()
+    password_hasher.shutdown()
 
 
 # Create FastAPI app with lifespan
@@ -53,11 +82,12 @@ async def health_check():
     Health check endpoint.
 
     Returns:
-        Status and version information.
+        Status, version and password hashing queue metrics.
     """
     return {
         "status": "healthy",
         "version": "1.0.0",
+        "hashing": password_hasher.stats(),
     }
 @app.get("/", tags=["Health"])
 async def root():
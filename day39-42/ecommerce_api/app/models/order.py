@@ -3,7 +3,7 @@ from enum import StrEnum
 from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import ForeignKey, String, Numeric, func
+from sqlalchemy import ForeignKey, Index, String, Numeric, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .user import Base
@@ -42,6 +42,11 @@ class Order(Base):
 
     created_at: Mapped[datetime] = mapped_column(insert_default=func.now(), nullable=False)
 
+    # Order history pages walk one user's orders newest-first by id
+    __table_args__ = (
+        Index("ix_orders_user_id_id", "user_id", "id"),
+    )
+
     # Relationships
     user: Mapped["User"] = relationship(back_populates="orders")
     items: Mapped[list["OrderItem"]] = relationship(
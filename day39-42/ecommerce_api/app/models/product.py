@@ -1,7 +1,7 @@
 from typing import TYPE_CHECKING
 from datetime import datetime
 from decimal import Decimal
-from sqlalchemy import String, Numeric, Integer, CheckConstraint, func
+from sqlalchemy import Boolean, String, Numeric, Integer, CheckConstraint, false, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .user import Base
@@ -22,6 +22,7 @@ class Product(Base):
         price: Product price (decimal, 10 digits, 2 decimals).
         stock: Current stock quantity (must be >= 0).
         created_at: Timestamp when product was created (server-generated).
+        is_hot: Flash-sale product – stock is reserved in Redis, not row-locked.
         categories: Relationship to Category objects via many-to-many.
         order_items: Relationship to OrderItem objects.
     """
@@ -35,6 +36,9 @@ class Product(Base):
     created_at: Mapped[datetime] = mapped_column(
         insert_default=func.now()
     )
+    is_hot: Mapped[bool] = mapped_column(
+        Boolean, default=False, server_default=false(), nullable=False
+    )
 
     __table_args__ = (
         CheckConstraint("stock >= 0", name="ck_product_stock_non_negative"),
@@ -1,8 +1,8 @@
-from sqlalchemy import select
+from sqlalchemy import Row, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm import selectinload
 
-from app.models import Order
+from app.models import Order, OrderItem
 from .base_repo import BaseRepository
 
 
@@ -69,4 +69,71 @@ class OrderRepository(BaseRepository[Order]):
             .options(selectinload(Order.items))
         )
         result = await self.session.execute(stmt)
-        return result.unique().scalars().all()
\ No newline at end of file
+        return result.unique().scalars().all()
+
+    async def get_all_by_user_with_items(
+        self, user_id: int, limit: int = 20, before_id: int | None = None
+    ) -> list[Order]:
+        """
+        Retrieve one page of a user's orders, newest first, with items and products.
+
+        Keyset pagination on (user_id, id): pass the last id of the previous
+        page as before_id. Every page is an index range scan, so page 500 of
+        a heavy buyer costs the same as page 1. Items and their products are
+        selectinloaded for this page only (two extra IN queries).
+
+        Args:
+            user_id: User id to filter by.
+            limit: Max orders to return.
+            before_id: Only return orders with a smaller id (cursor).
+
+        Returns:
+            List of Order instances with items and products preloaded.
+        """
+        stmt = (
+            select(Order)
+            .where(Order.user_id == user_id)
+            .order_by(Order.id.desc())
+            .limit(limit)
+            .options(selectinload(Order.items).selectinload(OrderItem.product))
+        )
+        if before_id is not None:
+            stmt = stmt.where(Order.id < before_id)
+        result = await self.session.execute(stmt)
+        return result.scalars().all()
+
+    async def get_summaries_by_user(
+        self, user_id: int, limit: int = 20, before_id: int | None = None
+    ) -> list[Row]:
+        """
+        Retrieve lightweight order summaries for list views.
+
+        Only id, status, total, created_at and an item count are selected –
+        no ORM objects, no item rows. The count is a correlated subquery, so
+        it only runs for the orders on this page (via ix_order_items_order_id).
+
+        Args:
+            user_id: User id to filter by.
+            limit: Max orders to return.
+            before_id: Only return orders with a smaller id (cursor).
+
+        Returns:
+            Rows with id, status, total, created_at and item_count.
+        """
+        item_count = (
+            select(func.count(OrderItem.id))
+            .where(OrderItem.order_id == Order.id)
+            .correlate(Order)
+            .scalar_subquery()
+            .label("item_count")
+        )
+        stmt = (
+            select(Order.id, Order.status, Order.total, Order.created_at, item_count)
+            .where(Order.user_id == user_id)
+            .order_by(Order.id.desc())
+            .limit(limit)
+        )
+        if before_id is not None:
+            stmt = stmt.where(Order.id < before_id)
+        result = await self.session.execute(stmt)
+        return result.all()
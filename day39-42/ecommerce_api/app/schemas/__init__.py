@@ -7,8 +7,8 @@ Re-exports all schemas for convenient importing.
 from .user import UserCreate, UserUpdate, UserResponse
 from .category import CategoryCreate, CategoryUpdate, CategoryResponse
 from .product import ProductCreate, ProductUpdate, ProductResponse
-from .order_item import OrderItemResponse, OrderItemCreate
-from .order import OrderCreate, OrderResponse
+from .order_item import OrderItemResponse, OrderItemCreate, OrderItemProduct
+from .order import OrderCreate, OrderResponse, OrderSummaryResponse
 
 __all__ = [
     # User schemas
@@ -26,7 +26,9 @@ __all__ = [
     # Order schemas
     "OrderCreate",
     "OrderResponse",
+    "OrderSummaryResponse",
     # OrderItem schemas
     "OrderItemCreate",
     "OrderItemResponse",
+    "OrderItemProduct",
 ]
\ No newline at end of file
@@ -28,4 +28,19 @@ class OrderResponse(BaseModel):
     created_at: datetime
     items: List[OrderItemResponse] = Field(default_factory=list)
 
+    model_config = ConfigDict(from_attributes=True)
+
+
+class OrderSummaryResponse(BaseModel):
+    """
+    Lightweight order row for order-history list views.
+
+    No items are loaded – only their count.
+    """
+    id: int
+    status: str
+    total: Decimal
+    created_at: datetime
+    item_count: int
+
     model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
@@ -18,6 +18,23 @@ class OrderItemCreate(BaseModel):
     quantity: int = Field(..., gt=0, examples=[2])
 
 
+class OrderItemProduct(BaseModel):
+    """
+    Basic product information nested inside an order item.
+
+    Attributes:
+        id: Product identifier.
+        name: Product name.
+        price: Current product price (see price_at_purchase for the paid price).
+    """
+
+    id: int
+    name: str
+    price: Decimal
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 class OrderItemResponse(BaseModel):
     """
     Schema for returning order item data in responses.
@@ -30,6 +47,7 @@ class OrderItemResponse(BaseModel):
         product_id: ID of the ordered product.
         quantity: Quantity ordered.
         price_at_purchase: Price snapshot at purchase time.
+        product: Basic product details (must be eager-loaded).
 
     """
 
@@ -37,5 +55,6 @@ class OrderItemResponse(BaseModel):
     product_id: int
     quantity: int
     price_at_purchase: Decimal
+    product: OrderItemProduct | None = None
 
     model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
@@ -13,6 +13,7 @@ class ProductCreate(BaseModel):
         price: Product price (decimal with 2 decimals).
         stock: Initial stock quantity (defaults to 0).
         category_ids: List of category IDs to associate with the product.
+        is_hot: Flag as a flash-sale product (stock reserved in Redis).
 
     """
 
@@ -20,6 +21,7 @@ class ProductCreate(BaseModel):
     price: Decimal = Field(..., gt=0, decimal_places=2, examples=[Decimal("999.99")])
     stock: int = Field(default=0, ge=0, examples=[10])
     category_ids: list[int] = Field(default_factory=list, examples=[[1, 2, 3]])
+    is_hot: bool = Field(default=False, examples=[False])
 
 
 class ProductUpdate(BaseModel):
@@ -33,12 +35,14 @@ class ProductUpdate(BaseModel):
         price: Product price (optional).
         stock: Stock quantity (optional).
         category_ids: List of category IDs (optional).
+        is_hot: Flash-sale flag (optional).
     """
 
     name: str | None = Field(None, min_length=1, examples=["Laptop Pro"])
     price: Decimal | None = Field(None, gt=0, decimal_places=2, examples=[Decimal("899.99")])
     stock: int | None = Field(None, ge=0, examples=[5])
     category_ids: list[int] | None = Field(None, examples=[[1, 3]])
+    is_hot: bool | None = Field(None, examples=[True])
 
 
 class ProductResponse(BaseModel):
@@ -52,6 +56,7 @@ class ProductResponse(BaseModel):
         stock: Current stock quantity.
         created_at: Timestamp of product creation.
         categories: List of associated categories.
+        is_hot: Whether the product is a flash-sale product.
 
     """
 
@@ -60,6 +65,7 @@ class ProductResponse(BaseModel):
     price: Decimal
     stock: int
     created_at: datetime
+    is_hot: bool = False
     categories: list[CategoryResponse] = Field(default_factory=list)
 
     model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
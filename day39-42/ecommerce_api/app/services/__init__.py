@@ -8,10 +8,13 @@ from .user_service import UserService
 from .category_service import CategoryService
 from .product_service import ProductService
 from .order_service import OrderService
+from .inventory_service import InventoryService, get_inventory_service
 
 __all__ = [
     "UserService",
     "CategoryService",
     "ProductService",
     "OrderService",
+    "InventoryService",
+    "get_inventory_service",
 ]
\ No newline at end of file
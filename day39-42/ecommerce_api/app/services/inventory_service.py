@@ -0,0 +1,399 @@
+import asyncio
+import logging
+import time
+import uuid
+from functools import lru_cache
+
+from redis.asyncio import Redis
+from sqlalchemy import bindparam, case, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import get_settings
+from app.models import Product
+
+logger = logging.getLogger(__name__)
+
+# Redis keys
+STOCK_PREFIX = "inventory:stock:"              # inventory:stock:{product_id} -> available units
+RESERVATION_PREFIX = "inventory:reservation:"  # hash product_id -> qty for one checkout
+EXPIRY_KEY = "inventory:expiry"                # zset reservation_id -> expires_at
+RESERVED_KEY = "inventory:reserved"            # hash product_id -> units held by open reservations
+PENDING_KEY = "inventory:pending"              # hash product_id -> confirmed units not yet in Postgres
+INFLIGHT_KEY = "inventory:inflight"            # pending hash currently being flushed
+FLUSH_LOCK_KEY = "inventory:flush-lock"
+
+# Check every line first, then decrement all of them – all or nothing.
+# Returns {1} on success, {0, index, available} when short, {-1, index} when
+# a counter is not loaded yet.
+RESERVE_LUA = """
+local n = #KEYS - 3
+for i = 1, n do
+    local stock = redis.call('GET', KEYS[i])
+    if not stock then
+        return {-1, i}
+    end
+    if tonumber(stock) < tonumber(ARGV[2 + i]) then
+        return {0, i, tonumber(stock)}
+    end
+end
+for i = 1, n do
+    local product_id = ARGV[2 + n + i]
+    redis.call('DECRBY', KEYS[i], ARGV[2 + i])
+    redis.call('HSET', KEYS[n + 1], product_id, ARGV[2 + i])
+    redis.call('HINCRBY', KEYS[n + 3], product_id, ARGV[2 + i])
+end
+redis.call('ZADD', KEYS[n + 2], ARGV[2], ARGV[1])
+return {1}
+"""
+
+# Move a live reservation into the pending (write-behind) hash.
+# An expired reservation cannot be confirmed – the sweeper gives it back.
+CONFIRM_LUA = """
+local expires = redis.call('ZSCORE', KEYS[2], ARGV[1])
+if not expires or tonumber(expires) < tonumber(ARGV[2]) then
+    return 0
+end
+local items = redis.call('HGETALL', KEYS[1])
+for i = 1, #items, 2 do
+    redis.call('HINCRBY', KEYS[3], items[i], items[i + 1])
+    redis.call('HINCRBY', KEYS[4], items[i], -tonumber(items[i + 1]))
+end
+redis.call('DEL', KEYS[1])
+redis.call('ZREM', KEYS[2], ARGV[1])
+return 1
+"""
+
+# Give the units of each reservation id back to the stock counters.
+RELEASE_LUA = """
+local released = 0
+for i = 3, #ARGV do
+    local key = ARGV[2] .. ARGV[i]
+    local items = redis.call('HGETALL', key)
+    for j = 1, #items, 2 do
+        redis.call('INCRBY', ARGV[1] .. items[j], items[j + 1])
+        redis.call('HINCRBY', KEYS[2], items[j], -tonumber(items[j + 1]))
+    end
+    if #items > 0 then
+        released = released + 1
+    end
+    redis.call('DEL', key)
+    redis.call('ZREM', KEYS[1], ARGV[i])
+end
+return released
+"""
+
+# Undo a confirmed reservation whose database commit failed.
+UNCONFIRM_LUA = """
+for i = 2, #ARGV, 2 do
+    redis.call('HINCRBY', KEYS[1], ARGV[i], -tonumber(ARGV[i + 1]))
+    redis.call('INCRBY', ARGV[1] .. ARGV[i], ARGV[i + 1])
+end
+return 1
+"""
+
+# Set a counter from the database stock, minus units Redis already handed
+# out that Postgres does not know about yet (pending, inflight, reserved).
+LOAD_LUA = """
+if ARGV[3] == '0' and redis.call('EXISTS', KEYS[1]) == 1 then
+    return 0
+end
+local held = 0
+for i = 2, 4 do
+    held = held + tonumber(redis.call('HGET', KEYS[i], ARGV[1]) or '0')
+end
+redis.call('SET', KEYS[1], tonumber(ARGV[2]) - held)
+return 1
+"""
+
+# Hand the pending hash to a flush. A leftover inflight hash (crashed
+# flush) is retried before new decrements are taken.
+DRAIN_LUA = """
+if redis.call('EXISTS', KEYS[2]) == 0 then
+    if redis.call('EXISTS', KEYS[1]) == 0 then
+        return {}
+    end
+    redis.call('RENAME', KEYS[1], KEYS[2])
+end
+return redis.call('HGETALL', KEYS[2])
+"""
+
+# Only the holder of the flush lock may delete it.
+UNLOCK_LUA = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+# Never let a replayed flush push stock below the CHECK (stock >= 0) constraint
+_products = Product.__table__
+_apply_decrement = (
+    _products.update()
+    .where(_products.c.id == bindparam("product_id"))
+    .values(
+        stock=case(
+            (_products.c.stock >= bindparam("quantity"), _products.c.stock - bindparam("quantity")),
+            else_=0,
+        )
+    )
+)
+
+
+class InsufficientStock(Exception):
+    """Raised when a reservation asks for more units than are available."""
+
+    def __init__(self, product_id: int, available: int):
+        super().__init__(f"Product {product_id} has only {available} units left")
+        self.product_id = product_id
+        self.available = available
+
+
+class InventoryService:
+    """
+    Flash-sale stock reservations held in Redis with write-behind to Postgres.
+
+    Hot products would otherwise serialize every checkout on their single
+    products row. Instead their stock lives in a Redis counter:
+
+    1. reserve()  – Lua script checks and decrements all counters atomically
+                    and records a reservation that expires after a TTL.
+    2. confirm()  – once the order is written, the reservation becomes a
+                    pending decrement (pending hash) for the write-behind.
+    3. flush_pending() – a background worker applies pending decrements to
+                    products.stock in batches.
+
+    Reservations that are never confirmed (crash, timeout) are returned to
+    the counters by release_expired().
+    """
+
+    def __init__(self, redis: Redis, reservation_ttl: int):
+        """
+        Initialize InventoryService.
+
+        Args:
+            redis: Async Redis client (decode_responses=True).
+            reservation_ttl: Seconds a reservation is held before expiring.
+        """
+        self.redis = redis
+        self.reservation_ttl = reservation_ttl
+        self._reserve = redis.register_script(RESERVE_LUA)
+        self._confirm = redis.register_script(CONFIRM_LUA)
+        self._release = redis.register_script(RELEASE_LUA)
+        self._unconfirm = redis.register_script(UNCONFIRM_LUA)
+        self._load = redis.register_script(LOAD_LUA)
+        self._drain = redis.register_script(DRAIN_LUA)
+        self._unlock = redis.register_script(UNLOCK_LUA)
+
+    async def load_product(self, product_id: int, db_stock: int, force: bool = False) -> bool:
+        """
+        Load a product's stock counter into Redis.
+
+        Without force an existing counter is kept (it is the live value).
+        Use force after an admin changes the stock in the database.
+
+        Args:
+            product_id: Product id.
+            db_stock: Stock currently stored in products.stock.
+            force: Overwrite an existing counter.
+
+        Returns:
+            True if the counter was written.
+        """
+        written = await self._load(
+            keys=[STOCK_PREFIX + str(product_id), PENDING_KEY, INFLIGHT_KEY, RESERVED_KEY],
+            args=[product_id, db_stock, 1 if force else 0],
+        )
+        return bool(written)
+
+    async def unload_product(self, product_id: int) -> None:
+        """Stop tracking a product (pending decrements are still flushed)."""
+        await self.redis.delete(STOCK_PREFIX + str(product_id))
+
+    async def load_hot_products(self, session: AsyncSession) -> int:
+        """
+        Load counters for every product flagged is_hot. Call during startup.
+
+        Args:
+            session: AsyncSession for reading products.
+
+        Returns:
+            Number of hot products found.
+        """
+        result = await session.execute(select(Product.id, Product.stock).where(Product.is_hot.is_(True)))
+        rows = result.all()
+        for product_id, stock in rows:
+            await self.load_product(product_id, stock)
+        return len(rows)
+
+    async def reserve(self, items: dict[int, int], db_stock: dict[int, int]) -> str:
+        """
+        Atomically reserve units of one or more hot products.
+
+        Args:
+            items: product_id -> quantity to reserve.
+            db_stock: product_id -> products.stock, used to load a counter
+                that is missing in Redis (e.g. after a Redis restart).
+
+        Returns:
+            Reservation id to pass to confirm() or release().
+
+        Raises:
+            InsufficientStock: If any product has fewer units than requested.
+        """
+        reservation_id = uuid.uuid4().hex
+        product_ids = list(items)
+        keys = [STOCK_PREFIX + str(pid) for pid in product_ids]
+        keys += [RESERVATION_PREFIX + reservation_id, EXPIRY_KEY, RESERVED_KEY]
+        args = [reservation_id, time.time() + self.reservation_ttl]
+        args += [items[pid] for pid in product_ids] + product_ids
+
+        for _ in range(2):
+            result = await self._reserve(keys=keys, args=args)
+            status = int(result[0])
+            if status == 1:
+                return reservation_id
+            product_id = product_ids[int(result[1]) - 1]
+            if status == 0:
+                raise InsufficientStock(product_id, int(result[2]))
+            await self.load_product(product_id, db_stock[product_id])
+
+        raise RuntimeError("Inventory counters could not be loaded")
+
+    async def confirm(self, reservation_id: str) -> bool:
+        """
+        Turn a reservation into a pending decrement for the write-behind.
+
+        Args:
+            reservation_id: Id returned by reserve().
+
+        Returns:
+            False if the reservation already expired.
+        """
+        confirmed = await self._confirm(
+            keys=[RESERVATION_PREFIX + reservation_id, EXPIRY_KEY, PENDING_KEY, RESERVED_KEY],
+            args=[reservation_id, time.time()],
+        )
+        return bool(confirmed)
+
+    async def release(self, *reservation_ids: str) -> int:
+        """
+        Return the units of unconfirmed reservations to the counters.
+
+        Args:
+            *reservation_ids: Ids returned by reserve().
+
+        Returns:
+            Number of reservations released.
+        """
+        if not reservation_ids:
+            return 0
+        return int(
+            await self._release(
+                keys=[EXPIRY_KEY, RESERVED_KEY],
+                args=[STOCK_PREFIX, RESERVATION_PREFIX, *reservation_ids],
+            )
+        )
+
+    async def unconfirm(self, items: dict[int, int]) -> None:
+        """
+        Undo confirm() after the order's database commit failed.
+
+        Args:
+            items: The same product_id -> quantity passed to reserve().
+        """
+        args: list = [STOCK_PREFIX]
+        for product_id, quantity in items.items():
+            args += [product_id, quantity]
+        await self._unconfirm(keys=[PENDING_KEY], args=args)
+
+    async def release_expired(self, limit: int = 1000) -> int:
+        """
+        Return units held by reservations whose TTL has passed.
+
+        Args:
+            limit: Max reservations to release in one call.
+
+        Returns:
+            Number of reservations released.
+        """
+        expired = await self.redis.zrangebyscore(EXPIRY_KEY, "-inf", time.time(), start=0, num=limit)
+        return await self.release(*expired)
+
+    async def flush_pending(self, session_factory: sessionmaker, batch_size: int) -> int:
+        """
+        Write confirmed decrements to products.stock (write-behind).
+
+        Only one worker flushes at a time (Redis lock). Decrements are
+        applied with executemany in batches of batch_size products and
+        committed together; the inflight hash is dropped only after the
+        commit, so a failed flush is retried on the next run.
+
+        Args:
+            session_factory: Async session factory.
+            batch_size: Products per executemany batch.
+
+        Returns:
+            Number of products updated.
+        """
+        token = uuid.uuid4().hex
+        if not await self.redis.set(FLUSH_LOCK_KEY, token, nx=True, ex=60):
+            return 0
+
+        try:
+            raw = await self._drain(keys=[PENDING_KEY, INFLIGHT_KEY])
+            decrements = [
+                {"product_id": int(raw[i]), "quantity": int(raw[i + 1])}
+                for i in range(0, len(raw), 2)
+                if int(raw[i + 1]) != 0
+            ]
+            if decrements:
+                async with session_factory() as session:
+                    for start in range(0, len(decrements), batch_size):
+                        await session.execute(_apply_decrement, decrements[start:start + batch_size])
+                    await session.commit()
+            await self.redis.delete(INFLIGHT_KEY)
+            return len(decrements)
+        finally:
+            await self._unlock(keys=[FLUSH_LOCK_KEY], args=[token])
+
+    async def run_worker(
+        self, session_factory: sessionmaker, interval: float, batch_size: int
+    ) -> None:
+        """
+        Background loop: release expired reservations and flush pending decrements.
+
+        Start it with asyncio.create_task() during startup and cancel it on
+        shutdown (call flush_pending() once more afterwards).
+
+        Args:
+            session_factory: Async session factory.
+            interval: Seconds between runs.
+            batch_size: Products per executemany batch.
+        """
+        while True:
+            try:
+                released = await self.release_expired()
+                flushed = await self.flush_pending(session_factory, batch_size)
+                if released or flushed:
+                    logger.info(f"Inventory worker | released {released} reservations | flushed {flushed} products")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Inventory worker failed: {e}")
+            await asyncio.sleep(interval)
+
+
+@lru_cache
+def get_inventory_service() -> InventoryService | None:
+    """
+    Get the process-wide InventoryService.
+
+    Returns:
+        InventoryService, or None when REDIS_URL is not configured.
+    """
+    settings = get_settings()
+    if not settings.REDIS_URL:
+        return None
+    redis = Redis.from_url(settings.REDIS_URL, decode_responses=True)
+    return InventoryService(redis, settings.RESERVATION_TTL_SECONDS)
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from decimal import Decimal
 from fastapi import HTTPException, status
@@ -6,13 +7,16 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.models import User, Order, OrderItem, Product
 from app.repositories import OrderRepository, ProductRepository  
 from app.schemas import OrderItemCreate
+from app.services.inventory_service import InventoryService, InsufficientStock
 
 logger = logging.getLogger(__name__)
 
 
 class OrderService:
-    def __init__(self, order_repo: OrderRepository):
+    def __init__(self, order_repo: OrderRepository, inventory: InventoryService | None = None):
         self.order_repo = order_repo
+        # Redis reservations for is_hot products; None = database stock only
+        self.inventory = inventory
 
     async def create_order(
         self,
@@ -23,12 +27,18 @@ class OrderService:
     ) -> Order:
         total = Decimal("0.0")
         order_items_to_create = []
+        # Hot products are reserved in Redis instead of checking/decrementing the row
+        hot_items: dict[int, int] = {}
+        hot_products: dict[int, Product] = {}
 
         for item in items_data:
             product = await product_repo.get_by_id(item.product_id)
             if not product:
                 raise HTTPException(status_code=404, detail=f"Product {item.product_id} not found")
-            if product.stock < item.quantity:
+            if self.inventory and product.is_hot:
+                hot_items[product.id] = hot_items.get(product.id, 0) + item.quantity
+                hot_products[product.id] = product
+            elif product.stock < item.quantity:
                 raise HTTPException(
                     status_code=400,
                     detail=f"Not enough stock for '{product.name}'. Only {product.stock} left.",
@@ -37,6 +47,19 @@ class OrderService:
             total += product.price * item.quantity
             order_items_to_create.append((product, item.quantity))
 
+        reservation_id = None
+        if hot_items:
+            try:
+                reservation_id = await self.inventory.reserve(
+                    hot_items, {pid: p.stock for pid, p in hot_products.items()}
+                )
+            except InsufficientStock as e:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Not enough stock for '{hot_products[e.product_id].name}'. Only {e.available} left.",
+                ) from e
+
+        confirmed = False
         try:
             order = Order(user_id=user.id, total=total, status="pending")
             session.add(order)
@@ -50,18 +73,85 @@ class OrderService:
                     price_at_purchase=product.price,
                 )
                 session.add(order_item)
-                product.stock -= quantity
+                if product.id not in hot_items:
+                    product.stock -= quantity
+
+            # Confirm right before commit: the write-behind worker now owns the decrement
+            if reservation_id:
+                confirmed = await self.inventory.confirm(reservation_id)
+                if not confirmed:
+                    raise HTTPException(
+                        status_code=status.HTTP_409_CONFLICT,
+                        detail="Stock reservation expired, please try again",
+                    )
 
             await session.commit()
-            await session.refresh(order, attribute_names=["items"])
 
-            logger.info(f"Order #{order.id} created | User {user.id} | Total ${total}")
-            return order
+        except HTTPException:
+            await session.rollback()
+            raise
+
+        except asyncio.CancelledError:
+            # Client went away (or the task was cancelled) before the commit
+            # finished: the order is rolled back, so the stock must come back too
+            await session.rollback()
+            await self._return_stock(hot_items, reservation_id, confirmed)
+            raise
 
         except Exception as e:
             await session.rollback()
+            await self._return_stock(hot_items, reservation_id, confirmed)
             logger.error(f"Order failed: {e}")
             raise HTTPException(status_code=500, detail="Order creation failed") from e
 
-    async def get_user_orders(self, user_id: int) -> list[Order]:
-        return await self.order_repo.get_all_by_user_with_items(user_id)
\ No newline at end of file
+        # Committed: from here on the stock must stay taken, so nothing below
+        # may release or unconfirm the reservation.
+        logger.info(f"Order #{order.id} created | User {user.id} | Total ${total}")
+        # Reload with items + products so the response can nest product details
+        return await self.order_repo.get_by_id_with_items(user.id, order.id)
+
+    async def _return_stock(self, hot_items: dict[int, int], reservation_id: str | None, confirmed: bool) -> None:
+        """
+        Give back the Redis stock of an order that did not commit.
+
+        Args:
+            hot_items: product_id -> quantity that was reserved.
+            reservation_id: Id returned by reserve(), if anything was reserved.
+            confirmed: Whether confirm() already handed the units to the write-behind.
+        """
+        if confirmed:
+            await self.inventory.unconfirm(hot_items)
+        elif reservation_id:
+            await self.inventory.release(reservation_id)
+
+    async def get_user_orders(
+        self, user_id: int, limit: int = 20, before_id: int | None = None
+    ) -> list[Order]:
+        """
+        One page of a user's order history with items and products loaded.
+
+        Args:
+            user_id: Owner of the orders.
+            limit: Page size.
+            before_id: Cursor – id of the last order on the previous page.
+
+        Returns:
+            List of Order instances, newest first.
+        """
+        return await self.order_repo.get_all_by_user_with_items(user_id, limit, before_id)
+
+    async def get_user_order_summaries(
+        self, user_id: int, limit: int = 20, before_id: int | None = None
+    ) -> list:
+        """
+        One page of lightweight order summaries (no items, just their count).
+
+        Args:
+            user_id: Owner of the orders.
+            limit: Page size.
+            before_id: Cursor – id of the last order on the previous page.
+
+        Returns:
+            Rows with id, status, total, created_at and item_count.
+        """
+        return await self.order_repo.get_summaries_by_user(user_id, limit, before_id)
\ No newline at end of file
@@ -3,6 +3,7 @@ from fastapi import HTTPException, status
 from app.models import Product
 from app.repositories import ProductRepository, CategoryRepository
 from app.schemas import ProductCreate, ProductUpdate
+from app.services.inventory_service import InventoryService
 
 
 class ProductService:
@@ -16,6 +17,7 @@ class ProductService:
         self,
         product_repo: ProductRepository,
         category_repo: CategoryRepository,
+        inventory: InventoryService | None = None,
     ):
         """
         Initialize ProductService.
@@ -23,9 +25,11 @@ class ProductService:
         Args:
             product_repo: ProductRepository instance for product data access.
             category_repo: CategoryRepository instance for category data access.
+            inventory: InventoryService for hot products (None = disabled).
         """
         self.product_repo = product_repo
         self.category_repo = category_repo
+        self.inventory = inventory
 
     async def get_all_products(self) -> list[Product]:
         """Retrieve all products with categories preloaded."""
@@ -71,11 +75,14 @@ class ProductService:
             name=product_in.name,
             price=product_in.price,
             stock=product_in.stock,
+            is_hot=product_in.is_hot,
         )
         product.categories = categories
 
         # Save to DB
         created = await self.product_repo.create(product)
+        if self.inventory and created.is_hot:
+            await self.inventory.load_product(created.id, created.stock)
 
         # Reload with joinedload so categories are available
         return await self.product_repo.get_by_id_with_categories(created.id)
@@ -109,7 +116,21 @@ class ProductService:
             await self.product_repo.update(product_id, update_data)
 
         # Always return preloaded version
-        return await self.product_repo.get_by_id_with_categories(product_id)
+        updated = await self.product_repo.get_by_id_with_categories(product_id)
+        await self._sync_inventory(updated, stock_changed="stock" in update_data)
+        return updated
+
+    async def _sync_inventory(self, product: Product, stock_changed: bool) -> None:
+        """
+        Keep the Redis counter in step with the is_hot flag and admin stock edits.
+        """
+        if not self.inventory:
+            return
+        if product.is_hot:
+            # A new stock value from the admin overrides the live counter
+            await self.inventory.load_product(product.id, product.stock, force=stock_changed)
+        else:
+            await self.inventory.unload_product(product.id)
 
     async def delete_product(self, product_id: int) -> bool:
         """Delete a product by id."""
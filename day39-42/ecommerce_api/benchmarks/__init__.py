@@ -0,0 +1,5 @@
+"""
+Benchmark scripts for the e-commerce API.
+
+Run them from the project root, e.g. python -m benchmarks.serialization_bench
+"""
\ No newline at end of file
@@ -0,0 +1,145 @@
+"""
+Flash-sale contention benchmark.
+
+Many buyers race for one product with limited stock. Runs the same
+checkout (OrderService.create_order) twice:
+
+- db:    normal product – every checkout reads and updates the products row.
+- redis: is_hot product – stock reserved in Redis, written back in batches.
+
+Reports checkouts/sec, latency percentiles, and whether the final stock is
+consistent with the number of successful orders (no overselling).
+
+Needs the database from DATABASE_URL and, for the redis mode, REDIS_URL.
+
+Usage:
+    python -m benchmarks.flash_sale_bench --buyers 2000 --concurrency 200 --stock 500
+    python -m benchmarks.flash_sale_bench --modes redis
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from decimal import Decimal
+
+from fastapi import HTTPException
+from sqlalchemy import select
+
+from app.core.config import get_settings
+from app.core.security import hash_password
+from app.database.db import async_session_factory, engine
+from app.models import Base, Product, User
+from app.repositories import OrderRepository, ProductRepository
+from app.schemas import OrderItemCreate
+from app.services import OrderService, get_inventory_service
+
+BUYER_EMAIL = "flash-buyer@load.test"
+
+
+async def get_buyer() -> User:
+    async with async_session_factory() as session:
+        result = await session.execute(select(User).where(User.email == BUYER_EMAIL))
+        user = result.scalar_one_or_none()
+        if not user:
+            user = User(email=BUYER_EMAIL, name="Flash Buyer", role="customer", hashed_password=hash_password("x"))
+            session.add(user)
+            await session.commit()
+            await session.refresh(user)
+        return user
+
+
+async def create_product(stock: int, is_hot: bool) -> int:
+    async with async_session_factory() as session:
+        product = Product(name=f"Flash Sale Item ({'hot' if is_hot else 'db'})", price=Decimal("9.99"), stock=stock, is_hot=is_hot)
+        session.add(product)
+        await session.commit()
+        return product.id
+
+
+async def read_stock(product_id: int) -> int:
+    async with async_session_factory() as session:
+        result = await session.execute(select(Product.stock).where(Product.id == product_id))
+        return result.scalar_one()
+
+
+async def run_mode(mode: str, buyers: int, concurrency: int, stock: int) -> dict:
+    inventory = get_inventory_service() if mode == "redis" else None
+    if mode == "redis" and inventory is None:
+        raise SystemExit("REDIS_URL is not set – cannot run the redis mode")
+
+    user = await get_buyer()
+    product_id = await create_product(stock, is_hot=mode == "redis")
+    if inventory:
+        await inventory.load_product(product_id, stock, force=True)
+
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    outcomes: dict[str, int] = {}
+
+    async def buy() -> None:
+        async with semaphore, async_session_factory() as session:
+            service = OrderService(OrderRepository(session), inventory)
+            started = time.perf_counter()
+            try:
+                await service.create_order(
+                    user=user,
+                    items_data=[OrderItemCreate(product_id=product_id, quantity=1)],
+                    product_repo=ProductRepository(session),
+                    session=session,
+                )
+                outcome = "ok"
+            except HTTPException as e:
+                outcome = str(e.status_code)
+            latencies.append((time.perf_counter() - started) * 1000)
+            outcomes[outcome] = outcomes.get(outcome, 0) + 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(buy() for _ in range(buyers)))
+    elapsed = time.perf_counter() - started
+
+    if inventory:
+        await inventory.flush_pending(async_session_factory, get_settings().INVENTORY_FLUSH_BATCH)
+    final_stock = await read_stock(product_id)
+    sold = outcomes.get("ok", 0)
+    cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+
+    return {
+        "mode": mode,
+        "checkouts_per_s": buyers / elapsed,
+        "p50_ms": cuts[49],
+        "p95_ms": cuts[94],
+        "p99_ms": cuts[98],
+        "sold": sold,
+        "outcomes": outcomes,
+        "final_stock": final_stock,
+        "consistent": final_stock == stock - sold and sold <= stock,
+    }
+
+
+async def main(args: argparse.Namespace) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    print(f"{args.buyers} buyers, concurrency {args.concurrency}, stock {args.stock}\n")
+    print(f"{'mode':<6} {'checkouts/s':>12} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'sold':>6} {'stock':>6}  consistent  outcomes")
+    for mode in args.modes:
+        r = await run_mode(mode, args.buyers, args.concurrency, args.stock)
+        print(
+            f"{r['mode']:<6} {r['checkouts_per_s']:>12.1f} {r['p50_ms']:>8.1f} {r['p95_ms']:>8.1f} "
+            f"{r['p99_ms']:>8.1f} {r['sold']:>6} {r['final_stock']:>6}  {str(r['consistent']):<10}  {r['outcomes']}"
+        )
+    await engine.dispose()
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Flash-sale checkout contention benchmark.")
+    parser.add_argument("--buyers", type=int, default=2000, help="Total checkout attempts")
+    parser.add_argument("--concurrency", type=int, default=200, help="Concurrent checkouts")
+    parser.add_argument("--stock", type=int, default=500, help="Units available in the sale")
+    parser.add_argument("--modes", nargs="+", choices=["db", "redis"], default=["db", "redis"])
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
@@ -0,0 +1,326 @@
+"""
+HTTP load and benchmark harness for the e-commerce API.
+
+Boots app.main with uvicorn against the local database (DATABASE_URL),
+optionally seeds it first with seed_bulk.py, then drives a weighted mix of
+realistic requests with an asyncio httpx client at a fixed concurrency.
+
+Reports p50/p95/p99 latency and requests/sec per endpoint and saves the
+run as JSON, so two versions can be compared with --compare.
+
+Usage:
+    python -m benchmarks.load_test --seed-scale small --concurrency 50 --duration 30
+    python -m benchmarks.load_test --url http://localhost:8000 --requests 5000
+    python -m benchmarks.load_test --compare benchmarks/results/<previous>.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+
+import httpx
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+# endpoint name -> weight in the request mix
+DEFAULT_MIX = {
+    "browse": 45,
+    "search": 20,
+    "product_detail": 30,
+    "place_order": 5,
+}
+
+
+@dataclass
+class EndpointStats:
+    """Latencies and status codes collected for one endpoint."""
+
+    latencies_ms: list[float] = field(default_factory=list)
+    errors: int = 0
+    status_codes: dict[str, int] = field(default_factory=dict)
+
+    def record(self, latency_ms: float, status_code: int | None) -> None:
+        self.latencies_ms.append(latency_ms)
+        key = str(status_code) if status_code is not None else "error"
+        self.status_codes[key] = self.status_codes.get(key, 0) + 1
+        if status_code is None or status_code >= 500:
+            self.errors += 1
+
+    def summary(self, elapsed: float) -> dict:
+        count = len(self.latencies_ms)
+        if count == 0:
+            return {"requests": 0}
+        if count > 1:
+            cuts = statistics.quantiles(self.latencies_ms, n=100, method="inclusive")
+            p50, p95, p99 = cuts[49], cuts[94], cuts[98]
+        else:
+            p50 = p95 = p99 = self.latencies_ms[0]
+        return {
+            "requests": count,
+            "rps": round(count / elapsed, 2),
+            "p50_ms": round(p50, 2),
+            "p95_ms": round(p95, 2),
+            "p99_ms": round(p99, 2),
+            "max_ms": round(max(self.latencies_ms), 2),
+            "errors": self.errors,
+            "status_codes": self.status_codes,
+        }
+
+
+class Workload:
+    """Builds requests for each endpoint from a sample of real catalog data."""
+
+    def __init__(self, products: list[dict], rng: random.Random):
+        if not products:
+            raise SystemExit("No products found – seed the database first (--seed-scale).")
+        self.rng = rng
+        self.product_ids = [p["id"] for p in products]
+        # Search terms taken from real product names so searches return results
+        self.search_terms = sorted({word for p in products for word in p["name"].split() if len(word) > 2})
+
+    def build(self, name: str) -> tuple[str, str, dict | None]:
+        """Return (method, path, json_body) for one request of the given kind."""
+        if name == "browse":
+            skip = self.rng.choice([0, 0, 0, 10, 20, 50])
+            return "GET", f"/v1/products?skip={skip}&limit=20", None
+        if name == "search":
+            return "GET", f"/v1/products?search={self.rng.choice(self.search_terms)}&limit=20", None
+        if name == "product_detail":
+            return "GET", f"/v1/products/{self.rng.choice(self.product_ids)}", None
+        if name == "place_order":
+            picked = self.rng.sample(self.product_ids, min(self.rng.randint(1, 3), len(self.product_ids)))
+            items = [{"product_id": pid, "quantity": 1} for pid in picked]
+            return "POST", "/v1/orders", {"items": items}
+        raise ValueError(f"Unknown endpoint: {name}")
+
+
+async def wait_until_healthy(
+    base_url: str, server: subprocess.Popen | None = None, timeout: float = 30.0
+) -> None:
+    deadline = time.perf_counter() + timeout
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        while time.perf_counter() < deadline:
+            if server is not None and server.poll() is not None:
+                raise SystemExit(f"Server exited with code {server.returncode} before becoming healthy")
+            try:
+                if (await client.get("/health")).status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.25)
+    raise SystemExit(f"Server at {base_url} did not become healthy within {timeout}s")
+
+
+async def run_load(
+    base_url: str,
+    mix: dict[str, int],
+    concurrency: int,
+    duration: float | None,
+    total_requests: int | None,
+    seed: int,
+) -> tuple[dict[str, EndpointStats], float]:
+    rng = random.Random(seed)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30.0) as client:
+        catalog = await client.get("/v1/products", params={"limit": 100})
+        catalog.raise_for_status()
+        workload = Workload(catalog.json(), rng)
+
+        names = list(mix)
+        weights = [mix[name] for name in names]
+        stats = {name: EndpointStats() for name in names}
+        remaining = [total_requests] if total_requests else None
+        deadline = time.perf_counter() + duration if duration else None
+
+        def should_continue() -> bool:
+            if deadline is not None and time.perf_counter() >= deadline:
+                return False
+            if remaining is not None:
+                if remaining[0] <= 0:
+                    return False
+                remaining[0] -= 1
+            return True
+
+        async def worker() -> None:
+            while should_continue():
+                name = rng.choices(names, weights=weights)[0]
+                method, path, body = workload.build(name)
+                started = time.perf_counter()
+                try:
+                    response = await client.request(method, path, json=body)
+                    status_code = response.status_code
+                except httpx.HTTPError:
+                    status_code = None
+                stats[name].record((time.perf_counter() - started) * 1000, status_code)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    return stats, elapsed
+
+
+def start_server(port: int, workers: int) -> subprocess.Popen:
+    """Boot app.main with uvicorn using the current environment (DATABASE_URL etc.)."""
+    command = [
+        sys.executable, "-m", "uvicorn", "app.main:app",
+        "--host", "127.0.0.1",
+        "--port", str(port),
+        "--workers", str(workers),
+        "--log-level", "warning",
+    ]
+    return subprocess.Popen(command, cwd=PROJECT_ROOT, env=os.environ.copy())
+
+
+def seed_database(scale: str) -> None:
+    subprocess.run(
+        [sys.executable, "seed_bulk.py", "--scale", scale],
+        cwd=PROJECT_ROOT,
+        env=os.environ.copy(),
+        check=True,
+    )
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=PROJECT_ROOT, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_report(results: dict) -> None:
+    print()
+    print(f"{'endpoint':<16} {'requests':>9} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'errors':>7}")
+    print("-" * 74)
+    for name, row in results["endpoints"].items():
+        if not row["requests"]:
+            continue
+        print(
+            f"{name:<16} {row['requests']:>9} {row['rps']:>9.1f} {row['p50_ms']:>9.2f} "
+            f"{row['p95_ms']:>9.2f} {row['p99_ms']:>9.2f} {row['errors']:>7}"
+        )
+    total = results["total"]
+    print("-" * 74)
+    print(f"{'total':<16} {total['requests']:>9} {total['rps']:>9.1f} {total['p50_ms']:>9.2f} "
+          f"{total['p95_ms']:>9.2f} {total['p99_ms']:>9.2f} {total['errors']:>7}")
+
+
+def print_comparison(current: dict, previous_path: Path) -> None:
+    previous = json.loads(previous_path.read_text())
+    print(f"\nCompared with {previous_path.name} (revision {previous.get('git_revision')}):")
+    print(f"{'endpoint':<16} {'req/s':>16} {'p95 ms':>18} {'p99 ms':>18}")
+    for name, row in {**current["endpoints"], "total": current["total"]}.items():
+        old = previous["endpoints"].get(name) if name != "total" else previous.get("total")
+        if not old or not old.get("requests") or not row.get("requests"):
+            continue
+
+        def delta(key: str) -> str:
+            change = (row[key] - old[key]) / old[key] * 100 if old[key] else 0.0
+            return f"{row[key]:>8.1f} ({change:+5.1f}%)"
+
+        print(f"{name:<16} {delta('rps'):>16} {delta('p95_ms'):>18} {delta('p99_ms'):>18}")
+
+
+def parse_mix(value: str | None) -> dict[str, int]:
+    """Parse 'browse=50,search=20,...' into a weight dict."""
+    if not value:
+        return dict(DEFAULT_MIX)
+    mix = {}
+    for part in value.split(","):
+        name, weight = part.split("=")
+        if name not in DEFAULT_MIX:
+            raise SystemExit(f"Unknown endpoint in mix: {name}")
+        mix[name] = int(weight)
+    return mix
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Load-test the e-commerce API.")
+    parser.add_argument("--url", help="Benchmark an already running server instead of booting one")
+    parser.add_argument("--port", type=int, default=8765, help="Port for the booted server")
+    parser.add_argument("--workers", type=int, default=1, help="Uvicorn worker processes")
+    parser.add_argument("--seed-scale", choices=["small", "medium", "large"], help="Run seed_bulk.py first")
+    parser.add_argument("--concurrency", type=int, default=50, help="Concurrent clients")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds to run (ignored with --requests)")
+    parser.add_argument("--requests", type=int, help="Stop after this many requests")
+    parser.add_argument("--mix", help="Weights, e.g. browse=45,search=20,product_detail=30,place_order=5")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for the request mix")
+    parser.add_argument("--output", type=Path, help="Where to save JSON results")
+    parser.add_argument("--compare", type=Path, help="Previous JSON result to compare against")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    mix = parse_mix(args.mix)
+
+    if args.seed_scale:
+        seed_database(args.seed_scale)
+
+    server = None
+    base_url = args.url
+    if not base_url:
+        server = start_server(args.port, args.workers)
+        base_url = f"http://127.0.0.1:{args.port}"
+
+    try:
+        asyncio.run(wait_until_healthy(base_url, server))
+        duration = None if args.requests else args.duration
+        print(f"Running {mix} against {base_url} with {args.concurrency} clients...")
+        stats, elapsed = asyncio.run(
+            run_load(base_url, mix, args.concurrency, duration, args.requests, args.seed)
+        )
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=10)
+
+    combined = EndpointStats()
+    for endpoint in stats.values():
+        combined.latencies_ms.extend(endpoint.latencies_ms)
+        combined.errors += endpoint.errors
+
+    results = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "git_revision": git_revision(),
+        "config": {
+            "url": base_url,
+            "workers": args.workers,
+            "seed_scale": args.seed_scale,
+            "concurrency": args.concurrency,
+            "duration": duration,
+            "requests": args.requests,
+            "mix": mix,
+        },
+        "elapsed_s": round(elapsed, 3),
+        "endpoints": {name: s.summary(elapsed) for name, s in stats.items()},
+        "total": combined.summary(elapsed),
+    }
+
+    print_report(results)
+
+    output = args.output or RESULTS_DIR / f"load_{datetime.now():%Y%m%d_%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2))
+    print(f"\nResults saved to {output}")
+
+    if args.compare:
+        print_comparison(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
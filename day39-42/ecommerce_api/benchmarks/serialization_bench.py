@@ -0,0 +1,84 @@
+"""
+Serialization benchmark for the product list endpoint.
+
+Compares the default FastAPI path (validate every ORM row through
+response_model, then json.dumps) against the FAST_SERIALIZATION path
+(plain dict rows + precompiled TypeAdapter.dump_json).
+
+Usage:
+    python -m benchmarks.serialization_bench
+"""
+
+import json
+import timeit
+from datetime import datetime
+from decimal import Decimal
+
+from pydantic import TypeAdapter
+
+from app.core.serialization import product_list_response
+from app.models import Category, Product
+from app.schemas import ProductResponse
+
+PAGE_SIZES = [100, 1000]
+REPEAT = 5
+NUMBER = 20
+
+
+def make_products(count: int) -> list[Product]:
+    """Build transient Product rows with two categories each (no database needed)."""
+    categories = [
+        Category(id=i, name=f"Category {i}", description=f"Description {i}")
+        for i in range(1, 6)
+    ]
+    now = datetime.now()
+    return [
+        Product(
+            id=i,
+            name=f"Product {i}",
+            price=Decimal("19.99") + i,
+            stock=i % 50,
+            created_at=now,
+            is_hot=False,
+            categories=[categories[i % 5], categories[(i + 1) % 5]],
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+# Same steps FastAPI runs for response_model=list[ProductResponse]
+_response_adapter = TypeAdapter(list[ProductResponse])
+
+
+def default_path(products: list[Product]) -> bytes:
+    validated = _response_adapter.validate_python(products, from_attributes=True)
+    content = _response_adapter.dump_python(validated, mode="json")
+    return json.dumps(content, separators=(",", ":")).encode("utf-8")
+
+
+def fast_path(products: list[Product]) -> bytes:
+    return product_list_response(products).body
+
+
+def best_ms(func, products: list[Product]) -> float:
+    """Return the best per-call time in milliseconds."""
+    timings = timeit.repeat(lambda: func(products), repeat=REPEAT, number=NUMBER)
+    return min(timings) / NUMBER * 1000
+
+
+def main() -> None:
+    print(f"{'items':>6} | {'default (ms)':>12} | {'fast (ms)':>10} | {'speedup':>7}")
+    print("-" * 46)
+    for size in PAGE_SIZES:
+        products = make_products(size)
+
+        # Both paths must produce the same JSON document
+        assert json.loads(default_path(products)) == json.loads(fast_path(products))
+
+        default_ms = best_ms(default_path, products)
+        fast_ms = best_ms(fast_path, products)
+        print(f"{size:>6} | {default_ms:>12.3f} | {fast_ms:>10.3f} | {default_ms / fast_ms:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
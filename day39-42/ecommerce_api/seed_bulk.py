@@ -0,0 +1,303 @@
+"""
+High-volume synthetic data generator for load testing.
+
+seed.py only inserts a handful of demo rows. This script fills the database
+with users, categories, products, category links, orders and order items at
+production-like sizes so the v1 endpoints can be measured realistically.
+
+- Postgres: rows are streamed with COPY (asyncpg copy_records_to_table).
+- SQLite / others: rows are inserted with Core executemany.
+- Rows are generated and written in batches, committing after each batch.
+- Distributions are skewed like real shops: a few heavy buyers and
+  best-selling products, mostly small orders, mostly delivered.
+
+Usage:
+    python seed_bulk.py --scale small
+    python seed_bulk.py --scale large --batch-size 50000
+    python seed_bulk.py --users 2000000 --orders 10000000
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+from itertools import accumulate
+from typing import Iterable, Iterator, Sequence
+
+from sqlalchemy import Table, func, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.core.security import hash_password
+from app.database.db import engine
+from app.models import Base
+from app.models.order import OrderStatus
+
+SCALES = {
+    "small": {"users": 1_000, "categories": 20, "products": 1_000, "orders": 5_000},
+    "medium": {"users": 100_000, "categories": 100, "products": 50_000, "orders": 500_000},
+    "large": {"users": 1_000_000, "categories": 200, "products": 200_000, "orders": 5_000_000},
+}
+
+ITEMS_PER_ORDER = ([1, 2, 3, 4, 5, 6], [35, 25, 18, 10, 7, 5])
+QUANTITY = ([1, 2, 3, 4], [78, 15, 5, 2])
+STATUSES = (
+    [OrderStatus.PENDING, OrderStatus.PAID, OrderStatus.SHIPPED, OrderStatus.DELIVERED, OrderStatus.CANCELLED],
+    [8, 12, 15, 60, 5],
+)
+
+# bcrypt is far too slow to run millions of times – every generated user
+# shares one hash of this password.
+LOAD_TEST_PASSWORD = "loadtest123"
+
+
+def batched(rows: Iterable[tuple], size: int) -> Iterator[list[tuple]]:
+    """Yield lists of at most `size` rows."""
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def zipf_cum_weights(count: int, exponent: float = 1.1) -> list[float]:
+    """Cumulative Zipf weights, so rank 1 is picked far more often than rank N."""
+    return list(accumulate(1.0 / (rank ** exponent) for rank in range(1, count + 1)))
+
+
+class Progress:
+    """Prints a single updating progress line per table."""
+
+    def __init__(self, label: str, total: int):
+        self.label = label
+        self.total = total
+        self.done = 0
+        self.started = time.perf_counter()
+
+    def update(self, rows: int) -> None:
+        self.done += rows
+        elapsed = time.perf_counter() - self.started
+        rate = self.done / elapsed if elapsed else 0
+        percent = self.done / self.total * 100 if self.total else 100
+        print(
+            f"  {self.label:<20} {self.done:>12,} / {self.total:,} ({percent:5.1f}%) {rate:>10,.0f} rows/s",
+            end="\r",
+            flush=True,
+        )
+
+    def finish(self) -> None:
+        print()
+
+
+class BulkWriter:
+    """Writes row batches using the fastest path the database offers."""
+
+    def __init__(self, conn: AsyncConnection, batch_size: int):
+        self.conn = conn
+        self.batch_size = batch_size
+        self.is_postgres = conn.dialect.name == "postgresql"
+
+    async def write(self, table: Table, columns: Sequence[str], rows: list[tuple]) -> None:
+        """Insert one batch of tuples (ordered like `columns`) into `table`."""
+        if self.is_postgres:
+            raw = await self.conn.get_raw_connection()
+            await raw.driver_connection.copy_records_to_table(
+                table.name, records=rows, columns=list(columns)
+            )
+        else:
+            await self.conn.execute(table.insert(), [dict(zip(columns, row)) for row in rows])
+
+    async def write_all(
+        self, table: Table, columns: Sequence[str], rows: Iterable[tuple], total: int
+    ) -> None:
+        """Stream every row into `table` batch by batch, committing as we go."""
+        progress = Progress(table.name, total)
+        for batch in batched(rows, self.batch_size):
+            await self.write(table, columns, batch)
+            await self.conn.commit()
+            progress.update(len(batch))
+        progress.finish()
+
+    async def next_id(self, table: Table) -> int:
+        """First free primary key, so generated rows never collide with existing ones."""
+        result = await self.conn.execute(select(func.coalesce(func.max(table.c.id), 0)))
+        return result.scalar_one() + 1
+
+    async def reset_sequences(self, tables: Iterable[Table]) -> None:
+        """COPY with explicit ids bypasses SERIAL – move each sequence past the new max id."""
+        if not self.is_postgres:
+            return
+        for table in tables:
+            await self.conn.execute(
+                text(
+                    f"SELECT setval(pg_get_serial_sequence('{table.name}', 'id'), "
+                    f"(SELECT COALESCE(MAX(id), 1) FROM {table.name}))"
+                )
+            )
+        await self.conn.commit()
+
+
+class DataGenerator:
+    """Generates rows with realistic, reproducible distributions."""
+
+    def __init__(self, counts: dict[str, int], seed: int):
+        self.counts = counts
+        self.rng = random.Random(seed)
+        self.now = datetime.now()
+        self.password_hash = hash_password(LOAD_TEST_PASSWORD)
+        self.product_prices: dict[int, Decimal] = {}
+
+    def users(self, first_id: int) -> Iterator[tuple]:
+        for user_id in range(first_id, first_id + self.counts["users"]):
+            role = "admin" if user_id % 10_000 == 0 else "customer"
+            created_at = self.now - timedelta(days=self.rng.uniform(30, 3 * 365))
+            yield (user_id, f"user{user_id}@load.test", f"Load User {user_id}", role, self.password_hash, created_at)
+
+    def categories(self, first_id: int) -> Iterator[tuple]:
+        for category_id in range(first_id, first_id + self.counts["categories"]):
+            yield (category_id, f"Load Category {category_id}", f"Generated category #{category_id}")
+
+    def products(self, first_id: int) -> Iterator[tuple]:
+        for product_id in range(first_id, first_id + self.counts["products"]):
+            # Log-normal prices: most items are cheap, a long tail is expensive
+            price = max(Decimal("0.99"), Decimal(str(round(self.rng.lognormvariate(3.5, 1.0), 2))))
+            self.product_prices[product_id] = price
+            stock = self.rng.randint(0, 500)
+            created_at = self.now - timedelta(days=self.rng.uniform(0, 2 * 365))
+            yield (product_id, f"Load Product {product_id}", price, stock, created_at)
+
+    def product_categories(self, first_product_id: int, first_category_id: int) -> Iterator[tuple]:
+        category_ids = range(first_category_id, first_category_id + self.counts["categories"])
+        for product_id in range(first_product_id, first_product_id + self.counts["products"]):
+            links = self.rng.choice([1, 1, 2, 2, 3])
+            for category_id in self.rng.sample(category_ids, min(links, len(category_ids))):
+                yield (product_id, category_id)
+
+    def orders_with_items(
+        self, first_order_id: int, first_item_id: int, first_user_id: int, first_product_id: int
+    ) -> Iterator[tuple[list[tuple], list[tuple]]]:
+        """Yield (orders, items) batches – items must be written after their orders."""
+        user_ids = list(range(first_user_id, first_user_id + self.counts["users"]))
+        product_ids = list(range(first_product_id, first_product_id + self.counts["products"]))
+        # Shuffle so the heavy buyers / best sellers are not simply the lowest ids
+        self.rng.shuffle(user_ids)
+        self.rng.shuffle(product_ids)
+        user_weights = zipf_cum_weights(len(user_ids), exponent=0.8)
+        product_weights = zipf_cum_weights(len(product_ids))
+
+        order_id = first_order_id
+        item_id = first_item_id
+        remaining = self.counts["orders"]
+        while remaining > 0:
+            size = min(remaining, 10_000)
+            buyers = self.rng.choices(user_ids, cum_weights=user_weights, k=size)
+            orders, items = [], []
+            for user_id in buyers:
+                item_count = self.rng.choices(*ITEMS_PER_ORDER)[0]
+                picked = set(self.rng.choices(product_ids, cum_weights=product_weights, k=item_count))
+                total = Decimal("0.00")
+                for product_id in picked:
+                    quantity = self.rng.choices(*QUANTITY)[0]
+                    price = self.product_prices[product_id]
+                    total += price * quantity
+                    items.append((item_id, order_id, product_id, quantity, price))
+                    item_id += 1
+                status = self.rng.choices(*STATUSES)[0].value
+                created_at = self.now - timedelta(days=self.rng.uniform(0, 365))
+                orders.append((order_id, user_id, total, status, created_at))
+                order_id += 1
+            remaining -= size
+            yield orders, items
+
+
+async def seed_bulk(counts: dict[str, int], batch_size: int, seed: int) -> None:
+    tables = Base.metadata.tables
+    users, categories, products = tables["users"], tables["categories"], tables["products"]
+    links, orders, order_items = tables["product_categories"], tables["orders"], tables["order_items"]
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    generator = DataGenerator(counts, seed)
+    started = time.perf_counter()
+
+    async with engine.connect() as conn:
+        writer = BulkWriter(conn, batch_size)
+        print(f"Seeding {engine.dialect.name} with {counts} (batch size {batch_size:,})")
+
+        first_user = await writer.next_id(users)
+        first_category = await writer.next_id(categories)
+        first_product = await writer.next_id(products)
+        first_order = await writer.next_id(orders)
+        first_item = await writer.next_id(order_items)
+
+        await writer.write_all(
+            users,
+            ["id", "email", "name", "role", "hashed_password", "created_at"],
+            generator.users(first_user),
+            counts["users"],
+        )
+        await writer.write_all(
+            categories,
+            ["id", "name", "description"],
+            generator.categories(first_category),
+            counts["categories"],
+        )
+        await writer.write_all(
+            products,
+            ["id", "name", "price", "stock", "created_at"],
+            generator.products(first_product),
+            counts["products"],
+        )
+        await writer.write_all(
+            links,
+            ["product_id", "category_id"],
+            generator.product_categories(first_product, first_category),
+            # choice([1, 1, 2, 2, 3]) averages 1.8 links per product
+            int(counts["products"] * 1.8),
+        )
+
+        order_progress = Progress("orders + items", counts["orders"])
+        for order_rows, item_rows in generator.orders_with_items(
+            first_order, first_item, first_user, first_product
+        ):
+            for batch in batched(order_rows, batch_size):
+                await writer.write(orders, ["id", "user_id", "total", "status", "created_at"], batch)
+            for batch in batched(item_rows, batch_size):
+                await writer.write(
+                    order_items, ["id", "order_id", "product_id", "quantity", "price_at_purchase"], batch
+                )
+            await conn.commit()
+            order_progress.update(len(order_rows))
+        order_progress.finish()
+
+        await writer.reset_sequences([users, categories, products, orders, order_items])
+
+    print(f"Bulk seed completed in {time.perf_counter() - started:.1f}s")
+    print(f"Every generated user logs in with password '{LOAD_TEST_PASSWORD}'")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Generate synthetic load-test data.")
+    parser.add_argument("--scale", choices=SCALES, default="small", help="Preset row counts")
+    parser.add_argument("--users", type=int, help="Override number of users")
+    parser.add_argument("--categories", type=int, help="Override number of categories")
+    parser.add_argument("--products", type=int, help="Override number of products")
+    parser.add_argument("--orders", type=int, help="Override number of orders")
+    parser.add_argument("--batch-size", type=int, default=10_000, help="Rows per write")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed (same seed = same data)")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    counts = dict(SCALES[args.scale])
+    for key in counts:
+        override = getattr(args, key)
+        if override is not None:
+            counts[key] = override
+    asyncio.run(seed_bulk(counts, args.batch_size, args.seed))
@@ -0,0 +1,26 @@
+"""Add refresh_tokens expires_at index
+
+Revision ID: 7e5a3c1b9d24
+Revises: 4c185e0c7600
+Create Date: 2026-10-19 14:02:33.518240
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7e5a3c1b9d24'
+down_revision: Union[str, None] = '4c185e0c7600'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(op.f('ix_refresh_tokens_expires_at'), 'refresh_tokens', ['expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_refresh_tokens_expires_at'), table_name='refresh_tokens')
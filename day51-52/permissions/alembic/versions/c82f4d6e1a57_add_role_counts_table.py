@@ -0,0 +1,32 @@
+"""Add role_counts table
+
+Revision ID: c82f4d6e1a57
+Revises: 7e5a3c1b9d24
+Create Date: 2026-10-19 14:20:48.302719
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c82f4d6e1a57'
+down_revision: Union[str, None] = '7e5a3c1b9d24'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('role_counts',
+    sa.Column('role', sa.String(), nullable=False),
+    sa.Column('user_count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('role')
+    )
+    # Backfill from the existing users in one GROUP BY
+    op.execute("INSERT INTO role_counts (role, user_count) SELECT role, count(*) FROM users GROUP BY role")
+
+
+def downgrade() -> None:
+    op.drop_table('role_counts')
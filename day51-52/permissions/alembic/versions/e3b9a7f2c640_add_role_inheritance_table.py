@@ -0,0 +1,35 @@
+"""Add role_inheritance table
+
+Revision ID: e3b9a7f2c640
+Revises: c82f4d6e1a57
+Create Date: 2026-10-19 14:48:15.227903
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3b9a7f2c640'
+down_revision: Union[str, None] = 'c82f4d6e1a57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    role_inheritance = op.create_table('role_inheritance',
+    sa.Column('role', sa.String(), nullable=False),
+    sa.Column('inherits', sa.String(), nullable=False),
+    sa.PrimaryKeyConstraint('role', 'inherits')
+    )
+    # Default hierarchy: admin > moderator > user
+    op.bulk_insert(role_inheritance, [
+        {'role': 'moderator', 'inherits': 'user'},
+        {'role': 'admin', 'inherits': 'moderator'},
+    ])
+
+
+def downgrade() -> None:
+    op.drop_table('role_inheritance')
@@ -0,0 +1,28 @@
+"""Add admin user search indexes
+
+Revision ID: f4a2d6b8c1e3
+Revises: e3b9a7f2c640
+Create Date: 2026-10-19 15:24:09.871562
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4a2d6b8c1e3'
+down_revision: Union[str, None] = 'e3b9a7f2c640'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_users_role_id', 'users', ['role', 'id'], unique=False)
+    op.create_index('ix_users_email_pattern', 'users', ['email'], unique=False, postgresql_ops={'email': 'text_pattern_ops'})
+
+
+def downgrade() -> None:
+    op.drop_index('ix_users_email_pattern', table_name='users')
+    op.drop_index('ix_users_role_id', table_name='users')
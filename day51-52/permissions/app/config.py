@@ -11,6 +11,18 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7  
+    # Put user id, role and the compiled permission mask in access tokens so
+    # authorization needs no database reads. Role changes and deletions then
+    # take effect when the access token expires.
+    ACCESS_TOKEN_PERMISSION_CLAIMS: bool = True
+
+    # Expired refresh token cleanup (interval 0 disables the scheduled runner)
+    TOKEN_CLEANUP_INTERVAL_SECONDS: int = 3600
+    TOKEN_CLEANUP_BATCH_SIZE: int = 5000
+
+    # RBAC policy hot-reload across workers (unset = single worker, local reload only)
+    REDIS_URL: str | None = None
+    POLICY_CHANNEL: str = "rbac:policy"
 
     model_config = SettingsConfigDict(
         env_file=".env",
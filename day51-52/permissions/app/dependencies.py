@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -5,7 +6,7 @@ from app.database import AsyncSessionLocal
 from app.shared.security import decode_token
 from app.modules.users.repository import get_user_by_email
 from app.modules.users.models import User, UserRole
-from app.modules.permissions.repository import user_has_permission
+from app.modules.permissions.policy import policy_engine
 from app.shared.exceptions import UnauthorizedException
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/users/token")
@@ -17,28 +18,52 @@ async def get_db():
 def get_db_session(db: AsyncSession = Depends(get_db)):
     return db
 
-async def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: AsyncSession = Depends(get_db_session)
-) -> User:
+@dataclass(frozen=True)
+class TokenUser:
+    """Who is calling, as far as authorization needs to know"""
+    id: int
+    email: str
+    role: str
+
+def _decode_access_token(token: str) -> dict:
     payload = decode_token(token)
     
     if payload is None:
         raise UnauthorizedException(detail="Invalid token")
     
-    email: str = payload.get("sub")
-    if email is None:
+    if payload.get("sub") is None:
         raise UnauthorizedException(detail="Invalid token payload")
     
-    user = await get_user_by_email(db, email=email)
+    return payload
+
+async def _load_user(db: AsyncSession, payload: dict) -> User:
+    user = await get_user_by_email(db, email=payload["sub"])
     if user is None:
         raise UnauthorizedException(detail="User not found")
     
     return user
 
+async def get_current_user(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_db_session)
+) -> User:
+    return await _load_user(db, _decode_access_token(token))
+
+async def get_token_user(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_db_session)
+) -> TokenUser:
+    """Caller from the token's claims; only tokens without claims hit the database"""
+    payload = _decode_access_token(token)
+    if "uid" in payload and "role" in payload:
+        return TokenUser(id=payload["uid"], email=payload["sub"], role=payload["role"])
+    
+    user = await _load_user(db, payload)
+    return TokenUser(id=user.id, email=user.email, role=user.role)
+
 def require_role(*allowed_roles: UserRole):
     """Dependency to check if user has required role"""
-    async def role_checker(current_user: User = Depends(get_current_user)) -> User:
+    async def role_checker(current_user: TokenUser = Depends(get_token_user)) -> TokenUser:
         if current_user.role not in [role.value for role in allowed_roles]:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -53,12 +78,24 @@ def require_permission(permission_name: str):
     """
     Dependency to check if user has specific permission
     Usage: Depends(require_permission("create:post"))
+    
+    Tokens carrying a permission mask for the current policy version are
+    authorized from their claims alone. If the policy changed since the token
+    was issued (or it has no claims), the role is re-read from the database
+    and checked against the current compiled policy.
     """
     async def permission_checker(
-        current_user: User = Depends(get_current_user),
+        token: str = Depends(oauth2_scheme),
         db: AsyncSession = Depends(get_db_session)
-    ) -> User:
-        has_perm = await user_has_permission(db, current_user.role, permission_name)
+    ) -> TokenUser:
+        payload = _decode_access_token(token)
+        has_perm = policy_engine.claims_allow(payload, permission_name)
+        if has_perm is not None and "uid" in payload:
+            current_user = TokenUser(id=payload["uid"], email=payload["sub"], role=payload["role"])
+        else:
+            user = await _load_user(db, payload)
+            current_user = TokenUser(id=user.id, email=user.email, role=user.role)
+            has_perm = policy_engine.has_permission(user.role, permission_name)
         
         if not has_perm:
             raise HTTPException(
@@ -69,10 +106,10 @@ def require_permission(permission_name: str):
         return current_user
     return permission_checker
 
-async def get_current_admin(current_user: User = Depends(require_role(UserRole.ADMIN))) -> User:
+async def get_current_admin(current_user: TokenUser = Depends(require_role(UserRole.ADMIN))) -> TokenUser:
     """Shortcut dependency for admin-only routes"""
     return current_user
 
-async def get_current_moderator(current_user: User = Depends(require_role(UserRole.MODERATOR, UserRole.ADMIN))) -> User:
+async def get_current_moderator(current_user: TokenUser = Depends(require_role(UserRole.MODERATOR, UserRole.ADMIN))) -> TokenUser:
     """Shortcut dependency for moderator or admin routes"""
     return current_user
\ No newline at end of file
@@ -1,10 +1,30 @@
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from app.config import settings
 from app.modules.users.router import router as users_router
 from app.modules.permissions.router import router as permissions_router
+from app.modules.users.token_cleanup import run_token_cleanup
+from app.modules.permissions.policy import policy_engine
 from app.database import engine, Base
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    tasks = []
+    await policy_engine.reload()
+    if settings.REDIS_URL:
+        tasks.append(asyncio.create_task(policy_engine.listen()))
+    if settings.TOKEN_CLEANUP_INTERVAL_SECONDS > 0:
+        tasks.append(asyncio.create_task(
+            run_token_cleanup(settings.TOKEN_CLEANUP_INTERVAL_SECONDS, settings.TOKEN_CLEANUP_BATCH_SIZE)
+        ))
+    yield
+    for task in tasks:
+        task.cancel()
+
 def create_app() -> FastAPI:
-    app = FastAPI(title="Day 51-52 Permission System")
+    app = FastAPI(title="Day 51-52 Permission System", lifespan=lifespan)
 
     app.include_router(users_router)
     app.include_router(permissions_router)  
@@ -15,4 +35,4 @@ def create_app() -> FastAPI:
 
     return app
 
-app = create_app()
\ No newline at end of file
+app = create_app()
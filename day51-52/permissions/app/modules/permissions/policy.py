@@ -0,0 +1,153 @@
+import asyncio
+import hashlib
+import logging
+import uuid
+from dataclasses import dataclass, field
+from typing import Iterable
+
+import redis.asyncio as redis
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.modules.users.models import Permission, RolePermission, RoleInheritance
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CompiledPolicy:
+    """Permissions as bit positions and roles as bitmasks (own + inherited grants)"""
+    bits: dict[str, int] = field(default_factory=dict)
+    role_masks: dict[str, int] = field(default_factory=dict)
+    # Content hash, identical on every worker that compiled the same policy
+    version: str = ""
+
+    def allows(self, role: str, permission_name: str) -> bool:
+        return self.mask_allows(self.role_masks.get(role, 0), permission_name)
+
+    def mask_allows(self, mask: int, permission_name: str) -> bool:
+        return bool(mask & self.bits.get(permission_name, 0))
+
+
+def compile_policy(
+    permissions: Iterable[str],
+    grants: Iterable[tuple[str, str]],
+    inheritance: Iterable[tuple[str, str]],
+) -> CompiledPolicy:
+    """
+    Compile permission names, (role, permission) grants and (role, inherits)
+    edges into bitmasks. Inheritance is transitive; cycles are tolerated.
+    """
+    bits = {name: 1 << i for i, name in enumerate(sorted(set(permissions)))}
+
+    own: dict[str, int] = {}
+    for role, name in grants:
+        own[role] = own.get(role, 0) | bits.get(name, 0)
+
+    parents: dict[str, set[str]] = {}
+    for role, inherits in inheritance:
+        parents.setdefault(role, set()).add(inherits)
+
+    role_masks = {}
+    for role in set(own) | set(parents):
+        mask, seen, stack = 0, set(), [role]
+        while stack:
+            current = stack.pop()
+            if current in seen:
+                continue
+            seen.add(current)
+            mask |= own.get(current, 0)
+            stack.extend(parents.get(current, ()))
+        role_masks[role] = mask
+
+    digest = hashlib.sha256(repr((sorted(bits.items()), sorted(role_masks.items()))).encode()).hexdigest()
+    return CompiledPolicy(bits=bits, role_masks=role_masks, version=digest[:16])
+
+
+async def load_policy(db: AsyncSession) -> CompiledPolicy:
+    """Three small reads: permissions, grants and the role hierarchy"""
+    permissions = (await db.execute(select(Permission.name))).scalars().all()
+    grants = (await db.execute(
+        select(RolePermission.role, Permission.name).join(Permission, Permission.id == RolePermission.permission_id)
+    )).all()
+    inheritance = (await db.execute(select(RoleInheritance.role, RoleInheritance.inherits))).all()
+    return compile_policy(permissions, grants, inheritance)
+
+
+class PolicyEngine:
+    """
+    Per-process compiled policy.
+
+    Permission checks never touch the database. When policy changes, the
+    worker that made the change recompiles and publishes on Redis; every
+    other worker recompiles when it receives the message. Without Redis
+    (REDIS_URL unset) only the local process is reloaded.
+    """
+
+    def __init__(self, redis_url: str | None, channel: str):
+        self.redis_url = redis_url
+        self.channel = channel
+        self.policy = CompiledPolicy()
+        self._instance_id = uuid.uuid4().hex
+        self._lock = asyncio.Lock()
+
+    def has_permission(self, role: str, permission_name: str) -> bool:
+        return self.policy.allows(role, permission_name)
+
+    def claims_for(self, role: str) -> dict:
+        """Access-token claims: the role's compiled mask and the policy version it was compiled under"""
+        policy = self.policy
+        return {"role": role, "pm": policy.role_masks.get(role, 0), "pv": policy.version}
+
+    def claims_allow(self, claims: dict, permission_name: str) -> bool | None:
+        """Authorize from token claims; None when the token's policy version is stale or missing"""
+        policy = self.policy
+        if "pm" not in claims or claims.get("pv") != policy.version:
+            return None
+        return policy.mask_allows(claims["pm"], permission_name)
+
+    async def reload(self, db: AsyncSession | None = None):
+        async with self._lock:
+            if db is not None:
+                self.policy = await load_policy(db)
+            else:
+                async with AsyncSessionLocal() as session:
+                    self.policy = await load_policy(session)
+
+    async def invalidate(self, db: AsyncSession):
+        """Call after committing a policy change"""
+        await self.reload(db)
+        if not self.redis_url:
+            return
+        try:
+            client = redis.from_url(self.redis_url)
+            try:
+                await client.publish(self.channel, self._instance_id)
+            finally:
+                await client.aclose()
+        except Exception:
+            # The change is committed; other workers catch up on their next resubscribe
+            logger.exception("Failed to publish policy invalidation")
+
+    async def listen(self):
+        """Background task: recompile whenever another worker publishes a change"""
+        while True:
+            try:
+                client = redis.from_url(self.redis_url, decode_responses=True)
+                async with client.pubsub() as pubsub:
+                    await pubsub.subscribe(self.channel)
+                    # Catch up on anything published while we were not subscribed
+                    await self.reload()
+                    async for message in pubsub.listen():
+                        if message["type"] == "message" and message["data"] != self._instance_id:
+                            await self.reload()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Policy subscription lost, retrying")
+                await asyncio.sleep(5)
+
+
+policy_engine = PolicyEngine(settings.REDIS_URL, settings.POLICY_CHANNEL)
@@ -1,6 +1,7 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from app.modules.users.models import Permission, RolePermission
+from app.modules.users.models import Permission, RolePermission, RoleInheritance
+from app.modules.permissions.policy import policy_engine
 from typing import List
 
 async def create_permission(db: AsyncSession, name: str, description: str | None = None) -> Permission:
@@ -9,6 +10,7 @@ async def create_permission(db: AsyncSession, name: str, description: str | None
     db.add(permission)
     await db.commit()
     await db.refresh(permission)
+    await policy_engine.invalidate(db)
     return permission
 
 async def get_permission_by_name(db: AsyncSession, name: str) -> Permission | None:
@@ -28,6 +30,7 @@ async def delete_permission(db: AsyncSession, permission_id: int) -> bool:
     if permission:
         await db.delete(permission)
         await db.commit()
+        await policy_engine.invalidate(db)
         return True
     return False
 
@@ -39,15 +42,17 @@ async def assign_permission_to_role(db: AsyncSession, role: str, permission_id:
     db.add(role_permission)
     await db.commit()
     await db.refresh(role_permission)
+    await policy_engine.invalidate(db)
     return role_permission
 
 async def get_role_permissions(db: AsyncSession, role: str) -> List[Permission]:
-    """Get all permissions for a role"""
-    result = await db.execute(
-        select(Permission)
-        .join(RolePermission)
-        .where(RolePermission.role == role)
-    )
+    """Get all permissions for a role, including those it inherits"""
+    policy = policy_engine.policy
+    mask = policy.role_masks.get(role, 0)
+    names = [name for name, bit in policy.bits.items() if mask & bit]
+    if not names:
+        return []
+    result = await db.execute(select(Permission).where(Permission.name.in_(names)).order_by(Permission.name))
     return result.scalars().all()
 
 async def remove_permission_from_role(db: AsyncSession, role: str, permission_id: int) -> bool:
@@ -60,15 +65,16 @@ async def remove_permission_from_role(db: AsyncSession, role: str, permission_id
     if role_permission:
         await db.delete(role_permission)
         await db.commit()
+        await policy_engine.invalidate(db)
         return True
     return False
 
-async def user_has_permission(db: AsyncSession, user_role: str, permission_name: str) -> bool:
-    """Check if user's role has specific permission"""
-    result = await db.execute(
-        select(Permission)
-        .join(RolePermission)
-        .where(RolePermission.role == user_role, Permission.name == permission_name)
-    )
-    permission = result.scalar_one_or_none()
-    return permission is not None
\ No newline at end of file
+async def set_role_inheritance(db: AsyncSession, role: str, inherits: str) -> RoleInheritance:
+    """Make `role` inherit every permission of `inherits`"""
+    edge = await db.get(RoleInheritance, (role, inherits))
+    if not edge:
+        edge = RoleInheritance(role=role, inherits=inherits)
+        db.add(edge)
+        await db.commit()
+        await policy_engine.invalidate(db)
+    return edge
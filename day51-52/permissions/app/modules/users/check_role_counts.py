@@ -0,0 +1,44 @@
+"""
+Consistency check for the role_counts table.
+
+Compares each role's counter with a GROUP BY over users and reports every
+role that has drifted. With --fix all counters are rebuilt from users.
+
+Usage:
+    python -m app.modules.users.check_role_counts
+    python -m app.modules.users.check_role_counts --fix
+"""
+
+import argparse
+import asyncio
+import sys
+
+from app.database import AsyncSessionLocal
+from app.modules.users.repository import find_role_count_drift, rebuild_role_counts
+
+
+async def check(fix: bool) -> int:
+    async with AsyncSessionLocal() as db:
+        drifted = await find_role_count_drift(db)
+        for row in drifted:
+            print(f"role {row['role']}: stored {row['stored']}, actual {row['actual']}")
+        if not drifted:
+            print("All role counters are consistent.")
+            return 0
+        if fix:
+            counts = await rebuild_role_counts(db)
+            print(f"Rebuilt counters for {len(counts)} role(s).")
+            return 0
+        print(f"{len(drifted)} role(s) drifted – rerun with --fix to repair.")
+        return 1
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Check role counters against the users table.")
+    parser.add_argument("--fix", action="store_true", help="Rebuild every counter from the users table")
+    args = parser.parse_args()
+    return asyncio.run(check(args.fix))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Boolean, Table
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Boolean, Table, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.database import Base
@@ -22,6 +22,12 @@ class User(Base):
     # Relationships
     refresh_tokens = relationship("RefreshToken", back_populates="user", cascade="all, delete-orphan")
 
+    # Admin user search: keyset on id per role, and email prefix matching
+    __table_args__ = (
+        Index("ix_users_role_id", "role", "id"),
+        Index("ix_users_email_pattern", "email", postgresql_ops={"email": "text_pattern_ops"}),
+    )
+
 class RefreshToken(Base):
     __tablename__ = "refresh_tokens"
 
@@ -30,12 +36,20 @@ class RefreshToken(Base):
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     is_revoked = Column(Boolean, default=False, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    expires_at = Column(DateTime(timezone=True), nullable=False)
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
     
     # Relationship
     user = relationship("User", back_populates="refresh_tokens")
 
 
+class RoleCount(Base):
+    """Number of users per role, kept in step with users by the repository"""
+    __tablename__ = "role_counts"
+
+    role = Column(String, primary_key=True)
+    user_count = Column(Integer, nullable=False, default=0)
+
+
 class Permission(Base):
     __tablename__ = "permissions"
 
@@ -56,4 +70,11 @@ class RolePermission(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     # Relationship
-    permission = relationship("Permission", back_populates="role_permissions")
\ No newline at end of file
+    permission = relationship("Permission", back_populates="role_permissions")
+
+class RoleInheritance(Base):
+    """Role hierarchy edge: `role` gets every permission of `inherits`"""
+    __tablename__ = "role_inheritance"
+
+    role = Column(String, primary_key=True)
+    inherits = Column(String, primary_key=True)
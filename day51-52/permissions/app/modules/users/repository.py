@@ -1,7 +1,11 @@
 from sqlalchemy.ext.asyncio import AsyncSession
+import base64
+from sqlalchemy import delete, func, insert, literal_column, text
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.future import select
-from app.modules.users.models import User, RefreshToken
+from app.modules.users.models import User, RefreshToken, RoleCount
 from app.shared.security import hash_password
+from app.shared.exceptions import BadRequestException
 from datetime import datetime, timedelta, timezone
 from app.config import settings
 
@@ -14,6 +18,7 @@ async def create_user(db: AsyncSession, email: str, password: str, full_name: st
         role=role
     )
     db.add(new_user)
+    await adjust_role_count(db, role, 1)
     await db.commit()
     await db.refresh(new_user)
     return new_user
@@ -22,6 +27,125 @@ async def get_user_by_email(db: AsyncSession, email: str):
     result = await db.execute(select(User).where(User.email == email))
     return result.scalar_one_or_none()
 
+def encode_user_cursor(user_id: int) -> str:
+    return base64.urlsafe_b64encode(str(user_id).encode()).decode()
+
+def decode_user_cursor(cursor: str) -> int:
+    try:
+        return int(base64.urlsafe_b64decode(cursor.encode()).decode())
+    except ValueError:
+        raise BadRequestException(detail="Invalid cursor")
+
+def encode_email_cursor(email: str) -> str:
+    return base64.urlsafe_b64encode(f"email:{email}".encode()).decode()
+
+def decode_email_cursor(cursor: str) -> str:
+    try:
+        kind, _, email = base64.urlsafe_b64decode(cursor.encode()).decode().partition(":")
+    except ValueError:
+        raise BadRequestException(detail="Invalid cursor")
+    if kind != "email" or not email:
+        raise BadRequestException(detail="Invalid cursor")
+    return email
+
+def _email_operators(db: AsyncSession) -> tuple:
+    """
+    (ORDER BY, >=, <, >) in the byte order of ix_users_email_pattern.
+    text_pattern_ops sorts with its own ~<~ family of operators; SQLite's
+    default BINARY collation already sorts bytewise.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        return literal_column("users.email USING ~<~"), "~>=~", "~<~", "~>~"
+    return User.email.asc(), ">=", "<", ">"
+
+def _prefix_upper_bound(prefix: str) -> str | None:
+    """Smallest string greater than every string starting with prefix (code point order = UTF-8 byte order)"""
+    if ord(prefix[-1]) == 0x10FFFF:
+        return None
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+async def search_users(
+    db: AsyncSession,
+    limit: int = 50,
+    cursor: str | None = None,
+    role: str | None = None,
+    email_prefix: str | None = None,
+) -> tuple[list[User], str | None]:
+    """
+    Newest users first, keyset on id (served by ix_users_role_id).
+
+    With email_prefix, users come in email order instead, keyset on the
+    (unique) email, so each page is a range scan of ix_users_email_pattern
+    that stops after limit rows, however many emails match.
+    """
+    query = select(User)
+    if role:
+        query = query.where(User.role == role)
+    if email_prefix:
+        order, ge, lt, gt = _email_operators(db)
+        # Explicit range bounds, so the index scan starts and stops at the prefix
+        query = query.where(User.email.startswith(email_prefix, autoescape=True), User.email.op(ge)(email_prefix))
+        upper = _prefix_upper_bound(email_prefix)
+        if upper:
+            query = query.where(User.email.op(lt)(upper))
+        if cursor:
+            query = query.where(User.email.op(gt)(decode_email_cursor(cursor)))
+        query = query.order_by(order)
+    else:
+        if cursor:
+            query = query.where(User.id < decode_user_cursor(cursor))
+        query = query.order_by(User.id.desc())
+    result = await db.execute(query.limit(limit + 1))
+    users = result.scalars().all()
+    if len(users) <= limit:
+        return users, None
+    last = users[limit - 1]
+    return users[:limit], encode_email_cursor(last.email) if email_prefix else encode_user_cursor(last.id)
+
+# ROLE COUNTERS 
+
+async def adjust_role_count(db: AsyncSession, role: str, delta: int):
+    """Add delta to a role's user count in the caller's transaction (relative upsert, safe under concurrency)"""
+    dialect_name = db.get_bind().dialect.name
+    if dialect_name == "postgresql":
+        dialect = postgresql
+    elif dialect_name == "sqlite":
+        dialect = sqlite
+    else:
+        raise NotImplementedError(f"Role counters need INSERT ... ON CONFLICT, not supported for {dialect_name}")
+    stmt = dialect.insert(RoleCount).values(role=role, user_count=delta)
+    await db.execute(stmt.on_conflict_do_update(
+        index_elements=[RoleCount.role],
+        set_={"user_count": RoleCount.user_count + stmt.excluded.user_count}
+    ))
+
+async def get_role_counts(db: AsyncSession) -> dict[str, int]:
+    """User count per role, read from the counter table (one row per role)"""
+    result = await db.execute(select(RoleCount.role, RoleCount.user_count))
+    return {role: count for role, count in result.all()}
+
+async def find_role_count_drift(db: AsyncSession) -> list[dict]:
+    """Roles whose counter disagrees with the users table"""
+    actual = dict((await db.execute(select(User.role, func.count()).group_by(User.role))).all())
+    stored = await get_role_counts(db)
+    return [
+        {"role": role, "stored": stored.get(role, 0), "actual": actual.get(role, 0)}
+        for role in sorted(set(actual) | set(stored))
+        if stored.get(role, 0) != actual.get(role, 0)
+    ]
+
+async def rebuild_role_counts(db: AsyncSession) -> dict[str, int]:
+    """Rewrite every counter from the users table (the migration's GROUP BY backfill)"""
+    if db.get_bind().dialect.name == "postgresql":
+        # Waits for in-flight adjustments to commit and holds off new ones until we do
+        await db.execute(text("LOCK TABLE role_counts IN EXCLUSIVE MODE"))
+    await db.execute(delete(RoleCount))
+    await db.execute(
+        insert(RoleCount).from_select(["role", "user_count"], select(User.role, func.count()).group_by(User.role))
+    )
+    await db.commit()
+    return await get_role_counts(db)
+
 # REFRESH TOKEN FUNCTIONS 
 
 async def create_refresh_token(db: AsyncSession, token: str, user_id: int) -> RefreshToken:
@@ -54,12 +178,24 @@ async def revoke_refresh_token(db: AsyncSession, token: str) -> bool:
         return True
     return False
 
-async def delete_expired_tokens(db: AsyncSession):
-    """Delete expired refresh tokens (cleanup)"""
-    result = await db.execute(
-        select(RefreshToken).where(RefreshToken.expires_at < datetime.now(timezone.utc))
-    )
-    expired_tokens = result.scalars().all()
-    for token in expired_tokens:
-        await db.delete(token)
-    await db.commit()
\ No newline at end of file
+async def delete_expired_tokens(db: AsyncSession, batch_size: int | None = None) -> int:
+    """
+    Delete expired refresh tokens (cleanup) and return how many were removed.
+
+    Runs entirely in the database. With batch_size, each batch is its own
+    short transaction, so a large backlog never holds locks for long.
+    """
+    now = datetime.now(timezone.utc)
+    if batch_size is None:
+        result = await db.execute(delete(RefreshToken).where(RefreshToken.expires_at < now))
+        await db.commit()
+        return result.rowcount
+
+    deleted = 0
+    while True:
+        batch = select(RefreshToken.id).where(RefreshToken.expires_at < now).limit(batch_size)
+        result = await db.execute(delete(RefreshToken).where(RefreshToken.id.in_(batch)))
+        await db.commit()
+        deleted += result.rowcount
+        if result.rowcount < batch_size:
+            return deleted
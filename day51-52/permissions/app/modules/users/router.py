@@ -1,31 +1,31 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
-from datetime import timedelta
-from typing import List
 from app.dependencies import (
     get_db_session, 
     get_current_user, 
+    get_token_user,
     get_current_admin,
-    require_role
+    require_role,
+    TokenUser
 )
 from app.modules.users.schemas import (
     UserCreate, 
     UserOut, 
     Token, 
-    RefreshTokenRequest
+    RefreshTokenRequest,
+    UserPage
 )
 from app.modules.users.service import (
     register_user_service, 
     authenticate_user_service,
     create_user_refresh_token,
     validate_refresh_token,
-    revoke_token_service
+    revoke_token_service,
+    create_user_access_token
 )
 from app.modules.users.models import User, UserRole
-from app.modules.users.repository import get_user_by_email
-from app.shared.security import create_access_token
-from app.config import settings
+from app.modules.users.repository import get_user_by_email, adjust_role_count, get_role_counts, search_users
 from sqlalchemy.future import select
 
 router = APIRouter(prefix="/users", tags=["users"])
@@ -51,11 +51,7 @@ async def login(
         )
     
     # Create access token
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    access_token = create_access_token(
-        data={"sub": user.email}, 
-        expires_delta=access_token_expires
-    )
+    access_token = create_user_access_token(user)
     
     # Create refresh token
     refresh_token = await create_user_refresh_token(db, user.id)
@@ -94,11 +90,7 @@ async def refresh_access_token(
     await revoke_token_service(db, refresh_request.refresh_token)
     
     # Create new tokens
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    access_token = create_access_token(
-        data={"sub": user.email}, 
-        expires_delta=access_token_expires
-    )
+    access_token = create_user_access_token(user)
     
     new_refresh_token = await create_user_refresh_token(db, user.id)
     
@@ -112,7 +104,7 @@ async def refresh_access_token(
 async def revoke_token(
     refresh_request: RefreshTokenRequest,
     db: AsyncSession = Depends(get_db_session),
-    current_user: User = Depends(get_current_user)
+    current_user: TokenUser = Depends(get_token_user)
 ):
     """Revoke a refresh token (logout)"""
     success = await revoke_token_service(db, refresh_request.refresh_token)
@@ -132,24 +124,27 @@ async def get_current_user_info(current_user: User = Depends(get_current_user)):
 
 # ADMIN ONLY ROUTES 
 
-@router.get("/admin/all-users", response_model=List[UserOut])
+@router.get("/admin/all-users", response_model=UserPage)
 async def get_all_users(
+    limit: int = Query(50, ge=1, le=200),
+    cursor: str | None = None,
+    role: str | None = None,
+    email_prefix: str | None = None,
     db: AsyncSession = Depends(get_db_session),
-    current_admin: User = Depends(get_current_admin)
+    current_admin: TokenUser = Depends(get_current_admin)
 ):
-    """Get all users - ADMIN ONLY"""
-    result = await db.execute(select(User))
-    users = result.scalars().all()
-    return users
+    """Search users one cursor page at a time, newest first (email order with email_prefix) - ADMIN ONLY"""
+    users, next_cursor = await search_users(db, limit, cursor, role, email_prefix)
+    return {"items": users, "next_cursor": next_cursor}
 
 @router.delete("/admin/users/{user_id}")
 async def delete_user(
     user_id: int,
     db: AsyncSession = Depends(get_db_session),
-    current_admin: User = Depends(get_current_admin)
+    current_admin: TokenUser = Depends(get_current_admin)
 ):
     """Delete a user - ADMIN ONLY"""
-    result = await db.execute(select(User).where(User.id == user_id))
+    result = await db.execute(select(User).where(User.id == user_id).with_for_update().execution_options(populate_existing=True))
     user = result.scalar_one_or_none()
     
     if not user:
@@ -159,6 +154,7 @@ async def delete_user(
         raise HTTPException(status_code=400, detail="Cannot delete yourself")
     
     await db.delete(user)
+    await adjust_role_count(db, user.role, -1)
     await db.commit()
     return {"message": f"User {user.email} deleted successfully"}
 
@@ -167,15 +163,20 @@ async def update_user_role(
     user_id: int,
     new_role: UserRole,
     db: AsyncSession = Depends(get_db_session),
-    current_admin: User = Depends(get_current_admin)
+    current_admin: TokenUser = Depends(get_current_admin)
 ):
     """Update user role - ADMIN ONLY"""
-    result = await db.execute(select(User).where(User.id == user_id))
+    # Row lock: concurrent role changes must each see the role the other left behind,
+    # or both move the counters away from the same old role
+    result = await db.execute(select(User).where(User.id == user_id).with_for_update().execution_options(populate_existing=True))
     user = result.scalar_one_or_none()
     
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
+    if user.role != new_role.value:
+        await adjust_role_count(db, user.role, -1)
+        await adjust_role_count(db, new_role.value, 1)
     user.role = new_role.value
     await db.commit()
     await db.refresh(user)
@@ -186,16 +187,16 @@ async def update_user_role(
 @router.get("/moderator/stats")
 async def get_user_stats(
     db: AsyncSession = Depends(get_db_session),
-    current_moderator: User = Depends(require_role(UserRole.MODERATOR, UserRole.ADMIN))
+    current_moderator: TokenUser = Depends(require_role(UserRole.MODERATOR, UserRole.ADMIN))
 ):
     """Get user statistics - MODERATOR or ADMIN"""
-    result = await db.execute(select(User))
-    all_users = result.scalars().all()
+    # Served from the role_counts table: one small read, however many users exist
+    counts = await get_role_counts(db)
     
     stats = {
-        "total_users": len(all_users),
-        "admins": len([u for u in all_users if u.role == "admin"]),
-        "moderators": len([u for u in all_users if u.role == "moderator"]),
-        "regular_users": len([u for u in all_users if u.role == "user"])
+        "total_users": sum(counts.values()),
+        "admins": counts.get("admin", 0),
+        "moderators": counts.get("moderator", 0),
+        "regular_users": counts.get("user", 0)
     }
     return stats
\ No newline at end of file
@@ -16,6 +16,10 @@ class UserOut(BaseModel):
     class Config:
         from_attributes = True
 
+class UserPage(BaseModel):
+    items: list[UserOut]
+    next_cursor: str | None = None
+
 class Token(BaseModel):
     access_token: str
     refresh_token: str  
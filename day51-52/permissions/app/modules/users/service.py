@@ -6,8 +6,10 @@ from app.modules.users.repository import (
     get_refresh_token,
     revoke_refresh_token
 )
-from app.shared.security import verify_password, create_refresh_token as generate_refresh_token
-from datetime import datetime, timezone
+from app.shared.security import verify_password, create_access_token, create_refresh_token as generate_refresh_token
+from app.modules.permissions.policy import policy_engine
+from app.config import settings
+from datetime import datetime, timedelta, timezone
 
 async def register_user_service(db: AsyncSession, email: str, password: str, full_name: str | None, role: str = "user"):
     return await create_user(db, email, password, full_name, role)
@@ -20,6 +22,13 @@ async def authenticate_user_service(db: AsyncSession, username: str, password: s
         return None
     return user
 
+def create_user_access_token(user) -> str:
+    """Access token for user, with role and permission claims when enabled"""
+    data = {"sub": user.email}
+    if settings.ACCESS_TOKEN_PERMISSION_CLAIMS:
+        data.update(uid=user.id, **policy_engine.claims_for(user.role))
+    return create_access_token(data=data, expires_delta=timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES))
+
 # REFRESH TOKEN SERVICES 
 
 async def create_user_refresh_token(db: AsyncSession, user_id: int) -> str:
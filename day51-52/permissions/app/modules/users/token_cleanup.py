@@ -0,0 +1,21 @@
+import asyncio
+import logging
+
+from app.database import AsyncSessionLocal
+from app.modules.users.repository import delete_expired_tokens
+
+logger = logging.getLogger(__name__)
+
+
+async def run_token_cleanup(interval_seconds: int, batch_size: int):
+    """Delete expired refresh tokens every interval_seconds until cancelled"""
+    while True:
+        try:
+            async with AsyncSessionLocal() as db:
+                deleted = await delete_expired_tokens(db, batch_size=batch_size)
+            if deleted:
+                logger.info("Deleted %d expired refresh tokens", deleted)
+        except Exception:
+            # Keep the runner alive; the next run picks up where this one stopped
+            logger.exception("Expired refresh token cleanup failed")
+        await asyncio.sleep(interval_seconds)
@@ -3,7 +3,8 @@ from app.database import AsyncSessionLocal
 from app.modules.permissions.repository import (
     create_permission,
     assign_permission_to_role,
-    get_permission_by_name
+    get_permission_by_name,
+    set_role_inheritance
 )
 
 async def seed_permissions():
@@ -40,35 +41,38 @@ async def seed_permissions():
                 created_permissions[name] = existing.id
                 print(f"- Already exists: {name}")
         
-        # Assign permissions to roles
+        # Role hierarchy: each role inherits everything granted to the one below
+        print("\nSetting up role hierarchy...")
+        for role, inherits in [("moderator", "user"), ("admin", "moderator")]:
+            await set_role_inheritance(db, role, inherits)
+        print("admin > moderator > user")
+        
+        # Assign permissions to roles (only what each role adds on top of the roles it inherits)
         print("\nAssigning permissions to roles...")
         
-        # ADMIN: All permissions
-        admin_permissions = [
-            "create:post", "edit:post", "delete:post", "view:post",
-            "manage:users", "view:users", "edit:profile",
-            "manage:permissions", "view:analytics"
+        # USER: Basic permissions
+        user_permissions = [
+            "create:post", "edit:post", "view:post", "edit:profile"
         ]
-        for perm_name in admin_permissions:
-            await assign_permission_to_role(db, "admin", created_permissions[perm_name])
-        print("Admin permissions assigned")
+        for perm_name in user_permissions:
+            await assign_permission_to_role(db, "user", created_permissions[perm_name])
+        print("User permissions assigned")
         
-        # MODERATOR: Post management + view users
+        # MODERATOR: Post management + view users (plus everything USER has)
         moderator_permissions = [
-            "create:post", "edit:post", "delete:post", "view:post",
-            "view:users", "edit:profile", "view:analytics"
+            "delete:post", "view:users", "view:analytics"
         ]
         for perm_name in moderator_permissions:
             await assign_permission_to_role(db, "moderator", created_permissions[perm_name])
         print("Moderator permissions assigned")
         
-        # USER: Basic permissions
-        user_permissions = [
-            "create:post", "edit:post", "view:post", "edit:profile"
+        # ADMIN: User and permission management (plus everything MODERATOR has)
+        admin_permissions = [
+            "manage:users", "manage:permissions"
         ]
-        for perm_name in user_permissions:
-            await assign_permission_to_role(db, "user", created_permissions[perm_name])
-        print("User permissions assigned")
+        for perm_name in admin_permissions:
+            await assign_permission_to_role(db, "admin", created_permissions[perm_name])
+        print("Admin permissions assigned")
         
         print("\nPermission seeding complete!")
 
@@ -0,0 +1,53 @@
+import os
+
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite://")
+os.environ.setdefault("SECRET_KEY", "test-secret")
+os.environ.setdefault("DEBUG", "false")
+os.environ.setdefault("TOKEN_CLEANUP_INTERVAL_SECONDS", "0")
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base
+from app.modules.users import models  # noqa: F401  (register tables)
+from app.modules.permissions.policy import CompiledPolicy, policy_engine
+
+
+@pytest_asyncio.fixture
+async def engine():
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def db(engine):
+    async with async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)() as session:
+        yield session
+
+
+@pytest.fixture(autouse=True)
+def reset_policy():
+    """The policy engine is process-wide; start every test from an empty policy."""
+    policy_engine.policy = CompiledPolicy()
+    yield
+    policy_engine.policy = CompiledPolicy()
+
+
+@pytest.fixture
+def count_queries():
+    """Call with a session to start recording every SQL statement its engine runs."""
+    def start(db):
+        statements = []
+
+        @event.listens_for(db.bind.sync_engine, "before_cursor_execute")
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        return statements
+    return start
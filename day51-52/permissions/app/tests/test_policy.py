@@ -0,0 +1,68 @@
+import pytest
+
+from app.modules.permissions.policy import compile_policy, policy_engine
+from app.modules.permissions.repository import (
+    assign_permission_to_role,
+    create_permission,
+    get_role_permissions,
+    set_role_inheritance,
+)
+
+PERMISSIONS = ["view:post", "create:post", "delete:post", "manage:users"]
+
+
+def test_inheritance_is_transitive():
+    policy = compile_policy(
+        PERMISSIONS,
+        [("user", "view:post"), ("user", "create:post"), ("moderator", "delete:post"), ("admin", "manage:users")],
+        [("moderator", "user"), ("admin", "moderator")],
+    )
+
+    assert all(policy.allows("admin", name) for name in PERMISSIONS)
+    assert policy.allows("moderator", "view:post")
+    assert not policy.allows("moderator", "manage:users")
+    assert not policy.allows("user", "delete:post")
+
+
+def test_inheritance_cycles_terminate():
+    policy = compile_policy(
+        PERMISSIONS,
+        [("a", "view:post"), ("b", "create:post")],
+        [("a", "b"), ("b", "a"), ("b", "b")],
+    )
+
+    assert policy.role_masks["a"] == policy.role_masks["b"]
+    assert policy.allows("a", "create:post") and policy.allows("b", "view:post")
+
+
+def test_unknown_role_or_permission_grants_nothing():
+    policy = compile_policy(PERMISSIONS, [("user", "view:post"), ("user", "no:such")], [])
+
+    assert policy.role_masks.get("ghost", 0) == 0
+    assert not policy.allows("ghost", "view:post")
+    assert not policy.allows("user", "no:such")
+    assert policy.mask_allows(policy.role_masks["user"], "no:such") is False
+
+
+def test_version_depends_only_on_content():
+    first = compile_policy(PERMISSIONS, [("user", "view:post")], [])
+    again = compile_policy(reversed(PERMISSIONS), [("user", "view:post")], [])
+    changed = compile_policy(PERMISSIONS, [("user", "create:post")], [])
+
+    assert first.version == again.version
+    assert first.version != changed.version
+
+
+@pytest.mark.asyncio
+async def test_role_permissions_include_inherited_grants(db):
+    ids = {name: (await create_permission(db, name)).id for name in PERMISSIONS}
+    await set_role_inheritance(db, "moderator", "user")
+    await set_role_inheritance(db, "admin", "moderator")
+    await assign_permission_to_role(db, "user", ids["view:post"])
+    await assign_permission_to_role(db, "moderator", ids["delete:post"])
+    await assign_permission_to_role(db, "admin", ids["manage:users"])
+
+    assert policy_engine.has_permission("admin", "view:post")
+    assert [p.name for p in await get_role_permissions(db, "admin")] == ["delete:post", "manage:users", "view:post"]
+    assert [p.name for p in await get_role_permissions(db, "user")] == ["view:post"]
+    assert await get_role_permissions(db, "ghost") == []
@@ -0,0 +1,60 @@
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import update
+
+from app.dependencies import TokenUser
+from app.modules.users.models import RoleCount, User, UserRole
+from app.modules.users.repository import (
+    adjust_role_count,
+    find_role_count_drift,
+    get_role_counts,
+    rebuild_role_counts,
+)
+from app.modules.users.router import delete_user, update_user_role
+
+ADMIN = TokenUser(id=0, email="root@example.com", role="admin")
+
+
+async def add_users(db, roles):
+    users = [User(email=f"{role}{i}@example.com", hashed_password="x", role=role) for i, role in enumerate(roles)]
+    db.add_all(users)
+    for role in roles:
+        await adjust_role_count(db, role, 1)
+    await db.commit()
+    return users
+
+
+@pytest.mark.asyncio
+async def test_counters_follow_role_changes_and_deletes(db):
+    users = await add_users(db, ["user", "user", "moderator"])
+
+    await update_user_role(users[0].id, UserRole.ADMIN, db=db, current_admin=ADMIN)
+    await update_user_role(users[0].id, UserRole.ADMIN, db=db, current_admin=ADMIN)
+    await delete_user(users[2].id, db=db, current_admin=ADMIN)
+
+    assert await get_role_counts(db) == {"user": 1, "moderator": 0, "admin": 1}
+    assert await find_role_count_drift(db) == []
+
+
+@pytest.mark.asyncio
+async def test_drift_is_reported_and_rebuilt_from_users(db):
+    await add_users(db, ["user", "user", "admin"])
+    await db.execute(update(RoleCount).where(RoleCount.role == "user").values(user_count=7))
+    db.add(RoleCount(role="ghost", user_count=2))
+    await db.commit()
+
+    assert await find_role_count_drift(db) == [
+        {"role": "ghost", "stored": 2, "actual": 0},
+        {"role": "user", "stored": 7, "actual": 2},
+    ]
+    assert await rebuild_role_counts(db) == {"admin": 1, "user": 2}
+    assert await find_role_count_drift(db) == []
+
+
+@pytest.mark.asyncio
+async def test_unsupported_dialect_is_rejected():
+    db = SimpleNamespace(get_bind=lambda: SimpleNamespace(dialect=SimpleNamespace(name="mysql")))
+
+    with pytest.raises(NotImplementedError):
+        await adjust_role_count(db, "user", 1)
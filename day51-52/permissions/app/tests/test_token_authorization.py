@@ -0,0 +1,91 @@
+import pytest
+import pytest_asyncio
+from fastapi import HTTPException
+
+from app.dependencies import require_permission
+from app.modules.permissions.policy import compile_policy, policy_engine
+from app.modules.users.models import User
+from app.modules.users.service import create_user_access_token
+from app.shared.security import create_access_token
+
+POLICY = (
+    ["view:post", "delete:post", "manage:users"],
+    [("user", "view:post"), ("moderator", "delete:post"), ("admin", "manage:users")],
+    [("moderator", "user"), ("admin", "moderator")],
+)
+
+
+@pytest_asyncio.fixture
+async def moderator(db):
+    user = User(email="mod@example.com", hashed_password="x", role="moderator")
+    db.add(user)
+    await db.commit()
+    policy_engine.policy = compile_policy(*POLICY)
+    return user
+
+
+async def authorize(db, token, permission_name):
+    return await require_permission(permission_name)(token=token, db=db)
+
+
+@pytest.mark.asyncio
+async def test_current_claims_authorize_without_database(db, moderator, count_queries):
+    token = create_user_access_token(moderator)
+    statements = count_queries(db)
+
+    caller = await authorize(db, token, "view:post")
+
+    assert (caller.id, caller.role) == (moderator.id, "moderator")
+    assert statements == []
+
+
+@pytest.mark.asyncio
+async def test_missing_permission_bit_is_forbidden(db, moderator, count_queries):
+    token = create_user_access_token(moderator)
+    statements = count_queries(db)
+
+    with pytest.raises(HTTPException) as exc:
+        await authorize(db, token, "manage:users")
+
+    assert exc.value.status_code == 403
+    assert statements == []
+
+
+@pytest.mark.asyncio
+async def test_stale_policy_version_rechecks_role_from_database(db, moderator, count_queries):
+    token = create_user_access_token(moderator)
+    # Policy changes after the token was issued: moderators may now manage users
+    policy_engine.policy = compile_policy(POLICY[0], POLICY[1] + [("moderator", "manage:users")], POLICY[2])
+    statements = count_queries(db)
+
+    caller = await authorize(db, token, "manage:users")
+
+    assert caller.role == "moderator"
+    assert len(statements) == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_claims_use_the_current_role(db, moderator):
+    token = create_user_access_token(moderator)
+    moderator.role = "user"
+    await db.commit()
+    policy_engine.policy = compile_policy(POLICY[0], POLICY[1] + [("user", "manage:users")], POLICY[2])
+
+    assert (await authorize(db, token, "view:post")).role == "user"
+    with pytest.raises(HTTPException) as exc:
+        await authorize(db, token, "delete:post")
+    assert exc.value.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_token_without_claims_falls_back_to_database(db, moderator, count_queries):
+    token = create_access_token(data={"sub": moderator.email})
+    statements = count_queries(db)
+
+    caller = await authorize(db, token, "delete:post")
+
+    assert caller.id == moderator.id
+    assert len(statements) == 1
+    with pytest.raises(HTTPException) as exc:
+        await authorize(db, token, "manage:users")
+    assert exc.value.status_code == 403
@@ -0,0 +1,26 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import select
+
+from app.modules.users.models import RefreshToken, User
+from app.modules.users.repository import delete_expired_tokens
+
+
+@pytest.mark.asyncio
+async def test_batched_cleanup_deletes_every_expired_token(db, count_queries):
+    user = User(email="owner@example.com", hashed_password="x")
+    db.add(user)
+    await db.flush()
+    now = datetime.now(timezone.utc)
+    db.add_all([RefreshToken(token=f"old-{i}", user_id=user.id, expires_at=now - timedelta(days=1)) for i in range(23)])
+    db.add_all([RefreshToken(token=f"live-{i}", user_id=user.id, expires_at=now + timedelta(days=1)) for i in range(4)])
+    await db.commit()
+    statements = count_queries(db)
+
+    assert await delete_expired_tokens(db, batch_size=5) == 23
+
+    remaining = (await db.execute(select(RefreshToken.token).order_by(RefreshToken.token))).scalars().all()
+    assert remaining == [f"live-{i}" for i in range(4)]
+    assert sum(s.lstrip().upper().startswith("DELETE") for s in statements) == 5
+    assert await delete_expired_tokens(db, batch_size=5) == 0
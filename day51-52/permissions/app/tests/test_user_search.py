@@ -0,0 +1,50 @@
+import pytest
+import pytest_asyncio
+
+from app.modules.users.models import User
+from app.modules.users.repository import search_users
+from app.shared.exceptions import BadRequestException
+
+
+@pytest_asyncio.fixture
+async def users(db):
+    db.add_all([
+        User(email=f"{'staff' if i % 4 == 0 else 'member'}{i:02d}@example.com", hashed_password="x", role="admin" if i % 4 == 0 else "user")
+        for i in range(40)
+    ])
+    await db.commit()
+
+
+async def all_pages(db, **filters):
+    seen, cursor = [], None
+    while True:
+        page, cursor = await search_users(db, limit=3, cursor=cursor, **filters)
+        seen.extend(page)
+        if not cursor:
+            return seen
+
+
+@pytest.mark.asyncio
+async def test_pages_newest_first_by_role(db, users):
+    seen = await all_pages(db, role="user")
+
+    assert len(seen) == 30
+    assert [u.id for u in seen] == sorted((u.id for u in seen), reverse=True)
+
+
+@pytest.mark.asyncio
+async def test_email_prefix_pages_in_email_order(db, users, count_queries):
+    statements = count_queries(db)
+    seen = await all_pages(db, email_prefix="staff")
+
+    assert [u.email for u in seen] == [f"staff{i:02d}@example.com" for i in range(0, 40, 4)]
+    assert all("ORDER BY users.email" in s for s in statements)
+    assert (await search_users(db, email_prefix="staff%"))[0] == []
+
+
+@pytest.mark.asyncio
+async def test_cursor_from_the_other_ordering_is_rejected(db, users):
+    _, id_cursor = await search_users(db, limit=1)
+
+    with pytest.raises(BadRequestException):
+        await search_users(db, cursor=id_cursor, email_prefix="staff")
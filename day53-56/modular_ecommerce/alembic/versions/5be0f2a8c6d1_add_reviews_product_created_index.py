@@ -0,0 +1,26 @@
+"""Add (product_id, created_at) index on reviews
+
+Revision ID: 5be0f2a8c6d1
+Revises: c3a9d41e7b52
+Create Date: 2026-10-19 11:02:47.905316
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5be0f2a8c6d1'
+down_revision: Union[str, None] = 'c3a9d41e7b52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_reviews_product_id_created_at', 'reviews', ['product_id', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_reviews_product_id_created_at', table_name='reviews')
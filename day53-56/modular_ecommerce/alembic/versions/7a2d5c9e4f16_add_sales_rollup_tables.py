@@ -0,0 +1,64 @@
+"""Add sales rollup tables
+
+Revision ID: 7a2d5c9e4f16
+Revises: e61b8f0d2c37
+Create Date: 2026-10-19 13:05:12.408217
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7a2d5c9e4f16'
+down_revision: Union[str, None] = 'e61b8f0d2c37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'sales_daily',
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('order_count', sa.Integer(), nullable=True),
+        sa.Column('items_sold', sa.Integer(), nullable=True),
+        sa.Column('revenue', sa.DECIMAL(precision=14, scale=2), nullable=True),
+        sa.PrimaryKeyConstraint('day')
+    )
+    op.create_table(
+        'product_sales_daily',
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('product_id', sa.Integer(), nullable=False),
+        sa.Column('quantity', sa.Integer(), nullable=True),
+        sa.Column('revenue', sa.DECIMAL(precision=14, scale=2), nullable=True),
+        sa.ForeignKeyConstraint(['product_id'], ['products.id'], ),
+        sa.PrimaryKeyConstraint('day', 'product_id')
+    )
+    # Backfill from existing orders
+    op.execute(
+        """
+        INSERT INTO product_sales_daily (day, product_id, quantity, revenue)
+        SELECT date(o.created_at), oi.product_id, sum(oi.quantity), sum(oi.price_at_purchase * oi.quantity)
+        FROM order_items oi JOIN orders o ON o.id = oi.order_id
+        GROUP BY date(o.created_at), oi.product_id
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO sales_daily (day, order_count, items_sold, revenue)
+        SELECT date(o.created_at), count(o.id), coalesce(sum(i.items_sold), 0), coalesce(sum(i.revenue), 0)
+        FROM orders o
+        LEFT JOIN (
+            SELECT order_id, sum(quantity) AS items_sold, sum(price_at_purchase * quantity) AS revenue
+            FROM order_items GROUP BY order_id
+        ) i ON i.order_id = o.id
+        GROUP BY date(o.created_at)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('product_sales_daily')
+    op.drop_table('sales_daily')
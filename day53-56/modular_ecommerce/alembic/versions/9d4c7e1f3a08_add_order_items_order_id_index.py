@@ -0,0 +1,26 @@
+"""Add order_id index on order_items
+
+Revision ID: 9d4c7e1f3a08
+Revises: 5be0f2a8c6d1
+Create Date: 2026-10-19 11:40:15.226874
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d4c7e1f3a08'
+down_revision: Union[str, None] = '5be0f2a8c6d1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(op.f('ix_order_items_order_id'), 'order_items', ['order_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_order_items_order_id'), table_name='order_items')
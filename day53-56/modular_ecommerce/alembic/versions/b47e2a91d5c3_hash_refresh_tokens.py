@@ -0,0 +1,40 @@
+"""Store refresh tokens as SHA-256 digests
+
+Revision ID: b47e2a91d5c3
+Revises: 7a2d5c9e4f16
+Create Date: 2026-10-19 13:41:27.915304
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b47e2a91d5c3'
+down_revision: Union[str, None] = '7a2d5c9e4f16'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Drop rows that could never be used again, then hash the rest in place
+    op.execute("DELETE FROM refresh_tokens WHERE revoked OR expires_at < (NOW() AT TIME ZONE 'UTC')")
+    op.add_column('refresh_tokens', sa.Column('token_hash', sa.String(length=64), nullable=True))
+    op.execute("UPDATE refresh_tokens SET token_hash = encode(sha256(convert_to(token, 'UTF8')), 'hex')")
+    op.alter_column('refresh_tokens', 'token_hash', existing_type=sa.String(length=64), nullable=False)
+    op.drop_index('ix_refresh_tokens_token', table_name='refresh_tokens')
+    op.drop_column('refresh_tokens', 'token')
+    op.create_index('ix_refresh_tokens_token_hash', 'refresh_tokens', ['token_hash'], unique=True)
+    op.create_index('ix_refresh_tokens_expires_at', 'refresh_tokens', ['expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    # Raw tokens can't be recovered from their digests; existing sessions must log in again
+    op.drop_index('ix_refresh_tokens_expires_at', table_name='refresh_tokens')
+    op.drop_index('ix_refresh_tokens_token_hash', table_name='refresh_tokens')
+    op.execute("DELETE FROM refresh_tokens")
+    op.drop_column('refresh_tokens', 'token_hash')
+    op.add_column('refresh_tokens', sa.Column('token', sa.VARCHAR(), nullable=False))
+    op.create_index('ix_refresh_tokens_token', 'refresh_tokens', ['token'], unique=True)
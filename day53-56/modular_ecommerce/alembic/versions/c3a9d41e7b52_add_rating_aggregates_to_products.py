@@ -0,0 +1,37 @@
+"""Add denormalized rating aggregates to products
+
+Revision ID: c3a9d41e7b52
+Revises: f8e096c23cc1
+Create Date: 2026-10-19 10:12:03.418220
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3a9d41e7b52'
+down_revision: Union[str, None] = 'f8e096c23cc1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('products', sa.Column('rating_sum', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('products', sa.Column('rating_count', sa.Integer(), nullable=False, server_default='0'))
+
+    # Backfill from existing reviews; afterwards the review service keeps them current
+    op.execute(
+        """
+        UPDATE products
+        SET rating_sum = COALESCE((SELECT SUM(r.rating) FROM reviews r WHERE r.product_id = products.id), 0),
+            rating_count = (SELECT COUNT(*) FROM reviews r WHERE r.product_id = products.id)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('products', 'rating_count')
+    op.drop_column('products', 'rating_sum')
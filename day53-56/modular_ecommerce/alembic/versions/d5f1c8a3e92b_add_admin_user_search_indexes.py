@@ -0,0 +1,32 @@
+"""Add admin user search indexes
+
+Revision ID: d5f1c8a3e92b
+Revises: b47e2a91d5c3
+Create Date: 2026-10-19 15:10:52.640118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5f1c8a3e92b'
+down_revision: Union[str, None] = 'b47e2a91d5c3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_users_role_id', 'users', ['role', 'id'], unique=False)
+    op.create_index('ix_users_role_is_active_id', 'users', ['role', 'is_active', 'id'], unique=False)
+    op.create_index('ix_users_is_active_id', 'users', ['is_active', 'id'], unique=False)
+    op.create_index('ix_users_email_pattern', 'users', ['email'], unique=False, postgresql_ops={'email': 'text_pattern_ops'})
+
+
+def downgrade() -> None:
+    op.drop_index('ix_users_email_pattern', table_name='users')
+    op.drop_index('ix_users_is_active_id', table_name='users')
+    op.drop_index('ix_users_role_is_active_id', table_name='users')
+    op.drop_index('ix_users_role_id', table_name='users')
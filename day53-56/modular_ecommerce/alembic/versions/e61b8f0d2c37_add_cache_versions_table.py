@@ -0,0 +1,32 @@
+"""Add cache_versions table
+
+Revision ID: e61b8f0d2c37
+Revises: 9d4c7e1f3a08
+Create Date: 2026-10-19 12:18:40.671093
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e61b8f0d2c37'
+down_revision: Union[str, None] = '9d4c7e1f3a08'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    cache_versions = op.create_table(
+        'cache_versions',
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('name')
+    )
+    op.bulk_insert(cache_versions, [{'name': 'role_permissions', 'version': 0}])
+
+
+def downgrade() -> None:
+    op.drop_table('cache_versions')
@@ -12,6 +12,19 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7  
+    # Expired / revoked refresh tokens are deleted in batches this often (0 disables)
+    REFRESH_TOKEN_PURGE_INTERVAL_SECONDS: float = 3600.0
+    REFRESH_TOKEN_PURGE_BATCH_SIZE: int = 1000
+
+    # How often each worker checks whether cached permissions / users changed
+    CACHE_VERSION_CHECK_SECONDS: float = 5.0
+    # Upper bound on how long an authenticated user is served from cache
+    USER_CACHE_TTL_SECONDS: float = 30.0
+    # Most users kept per worker; the least recently used are evicted beyond this
+    USER_CACHE_MAX_ENTRIES: int = 10000
+
+    # Turn off when `python -m app.seed` runs as a release step instead
+    SEED_ON_STARTUP: bool = True
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -1,10 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-from typing import List
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from datetime import date
 from app.database import get_db
 from app.modules.auth.dependencies import get_current_user, require_role, require_permission
-from app.modules.auth.models import User
-from app.modules.admin.service import get_all_users, update_user_role, ban_user, get_sales_analytics
+from app.modules.auth.principal_cache import Principal
+from app.modules.admin.service import search_users, update_user_role, ban_user, get_sales_analytics
+from app.modules.auth.repository import get_refresh_token_stats, grant_role_permission, revoke_role_permission
+from app.modules.auth.token_purge import purge_metrics
 from pydantic import BaseModel
 
 
@@ -12,7 +15,14 @@ class UserRoleUpdate(BaseModel):
     role: str
 
 
+class UserPage(BaseModel):
+    items: List[dict]
+    next_cursor: Optional[str] = None
+
+
 class SalesAnalytics(BaseModel):
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
     total_orders: int
     total_revenue: float
     top_5_products: List[dict]
@@ -21,47 +31,91 @@ class SalesAnalytics(BaseModel):
 router = APIRouter()
 
 
-@router.get("/users", response_model=List[dict])
-def get_users(
-    skip: int = 0,
-    limit: int = Query(10, le=100),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(require_permission("manage:users"))
+@router.get("/users", response_model=UserPage)
+async def get_users(
+    limit: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = None,
+    role: Optional[str] = None,
+    is_active: Optional[bool] = None,
+    email_prefix: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(require_permission("manage:users"))
 ):
-    users = get_all_users(db, skip, limit)
-    return [{"id": u.id, "email": u.email, "role": u.role, "is_active": u.is_active} for u in users]
+    users, next_cursor = await search_users(db, limit, cursor, role, is_active, email_prefix)
+    return {
+        "items": [{"id": u.id, "email": u.email, "role": u.role, "is_active": u.is_active} for u in users],
+        "next_cursor": next_cursor
+    }
 
 
 @router.patch("/users/{user_id}/role")
-def change_user_role(
+async def change_user_role(
     user_id: int,
     update: UserRoleUpdate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(require_permission("manage:users"))
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(require_permission("manage:users"))
 ):
     try:
-        user = update_user_role(db, user_id, update.role, current_user)
+        user = await update_user_role(db, user_id, update.role, current_user)
         return {"message": f"User {user.email} role updated to {user.role}"}
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.patch("/users/{user_id}/ban")
-def ban_user_endpoint(
+async def ban_user_endpoint(
     user_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(require_permission("manage:users"))
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(require_permission("manage:users"))
 ):
     try:
-        user = ban_user(db, user_id, current_user)
+        user = await ban_user(db, user_id, current_user)
         return {"message": f"User {user.email} has been banned"}
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@router.post("/roles/{role}/permissions/{permission_name}")
+async def grant_permission(
+    role: str,
+    permission_name: str,
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(require_role("admin"))
+):
+    # Bumps the permissions version, so every worker picks the change up
+    if not await grant_role_permission(db, role, permission_name):
+        raise HTTPException(status_code=404, detail="Permission not found")
+    return {"message": f"Granted {permission_name} to {role}"}
+
+
+@router.delete("/roles/{role}/permissions/{permission_name}")
+async def revoke_permission(
+    role: str,
+    permission_name: str,
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(require_role("admin"))
+):
+    if not await revoke_role_permission(db, role, permission_name):
+        raise HTTPException(status_code=404, detail="Permission not found")
+    return {"message": f"Revoked {permission_name} from {role}"}
+
+
 @router.get("/reports/sales", response_model=SalesAnalytics)
-def get_sales_report(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(require_role("admin"))
+async def get_sales_report(
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(require_role("admin"))
+):
+    if start_date and end_date and start_date > end_date:
+        raise HTTPException(status_code=400, detail="start_date must not be after end_date")
+    return await get_sales_analytics(db, start_date, end_date)
+
+
+@router.get("/metrics/refresh-tokens")
+async def refresh_token_metrics(
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(require_role("admin"))
 ):
-    return get_sales_analytics(db)
\ No newline at end of file
+    # Table size from the database; purge figures are for this worker only
+    return {"table": await get_refresh_token_stats(db), "purge": purge_metrics.as_dict()}
@@ -1,52 +1,158 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import func
-from typing import List, Dict, Any
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, literal_column, select
+from typing import List, Dict, Any, Optional, Tuple
+from datetime import date
+import base64
 from app.modules.auth.models import User
-from app.modules.orders.models import Order, OrderItem
+from app.modules.auth.principal_cache import Principal, bump_users_version, principal_cache
+from app.modules.orders.models import SalesDaily, ProductSalesDaily
 from app.modules.products.models import Product
+from app.shared.exceptions import BadRequestException
 
 
-def get_all_users(db: Session, skip: int = 0, limit: int = 10) -> List[User]:
-    return db.query(User).offset(skip).limit(limit).all()
+def _encode_user_cursor(user_id: int) -> str:
+    return base64.urlsafe_b64encode(str(user_id).encode()).decode()
 
 
-def update_user_role(db: Session, user_id: int, new_role: str, current_admin: User) -> User:
-    user = db.query(User).filter(User.id == user_id).first()
+def _decode_user_cursor(cursor: str) -> int:
+    try:
+        return int(base64.urlsafe_b64decode(cursor.encode()).decode())
+    except ValueError:
+        raise BadRequestException("Invalid cursor")
+
+
+def _encode_email_cursor(email: str) -> str:
+    return base64.urlsafe_b64encode(f"email:{email}".encode()).decode()
+
+
+def _decode_email_cursor(cursor: str) -> str:
+    try:
+        kind, _, email = base64.urlsafe_b64decode(cursor.encode()).decode().partition(":")
+    except ValueError:
+        raise BadRequestException("Invalid cursor")
+    if kind != "email" or not email:
+        raise BadRequestException("Invalid cursor")
+    return email
+
+
+def _email_operators(db: AsyncSession) -> tuple:
+    # (ORDER BY, >=, <, >) in the byte order of ix_users_email_pattern:
+    # text_pattern_ops sorts with its own ~<~ family of operators, SQLite's
+    # default BINARY collation already sorts bytewise
+    if db.get_bind().dialect.name == "postgresql":
+        return literal_column("users.email USING ~<~"), "~>=~", "~<~", "~>~"
+    return User.email.asc(), ">=", "<", ">"
+
+
+def _prefix_upper_bound(prefix: str) -> Optional[str]:
+    # Smallest string above every string starting with prefix (code point order = UTF-8 byte order)
+    if ord(prefix[-1]) == 0x10FFFF:
+        return None
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+async def search_users(
+    db: AsyncSession,
+    limit: int = 10,
+    cursor: Optional[str] = None,
+    role: Optional[str] = None,
+    is_active: Optional[bool] = None,
+    email_prefix: Optional[str] = None,
+) -> Tuple[List[User], Optional[str]]:
+    """
+    Newest users first, keyset on id so every page costs the same. Role and
+    active filters are served by the (role, is_active, id) / (is_active, id)
+    indexes.
+
+    With email_prefix, users come in email order instead, keyset on the
+    (unique) email: each page is a range scan of ix_users_email_pattern that
+    stops after limit rows, however many emails match.
+    """
+    query = select(User)
+    if role:
+        query = query.where(User.role == role)
+    if is_active is not None:
+        query = query.where(User.is_active == is_active)
+    if email_prefix:
+        order, ge, lt, gt = _email_operators(db)
+        # Explicit range bounds, so the index scan starts and stops at the prefix
+        query = query.where(User.email.startswith(email_prefix, autoescape=True), User.email.op(ge)(email_prefix))
+        upper = _prefix_upper_bound(email_prefix)
+        if upper:
+            query = query.where(User.email.op(lt)(upper))
+        if cursor:
+            query = query.where(User.email.op(gt)(_decode_email_cursor(cursor)))
+        query = query.order_by(order)
+    else:
+        if cursor:
+            query = query.where(User.id < _decode_user_cursor(cursor))
+        query = query.order_by(User.id.desc())
+    result = await db.execute(query.limit(limit + 1))
+    users = result.scalars().all()
+    has_more = len(users) > limit
+    users = users[:limit]
+    if not has_more:
+        return users, None
+    return users, _encode_email_cursor(users[-1].email) if email_prefix else _encode_user_cursor(users[-1].id)
+
+
+async def update_user_role(db: AsyncSession, user_id: int, new_role: str, current_admin: Principal) -> User:
+    user = await db.get(User, user_id)
     if not user:
         raise ValueError("User not found")
     if user.id == current_admin.id:
         raise ValueError("Cannot change your own role")
     user.role = new_role
-    db.commit()
-    db.refresh(user)
+    await bump_users_version(db)
+    await db.commit()
+    principal_cache.invalidate(user.id)
+    await db.refresh(user)
     return user
 
 
-def ban_user(db: Session, user_id: int, current_admin: User) -> User:
-    user = db.query(User).filter(User.id == user_id).first()
+async def ban_user(db: AsyncSession, user_id: int, current_admin: Principal) -> User:
+    user = await db.get(User, user_id)
     if not user:
         raise ValueError("User not found")
     if user.id == current_admin.id:
         raise ValueError("Cannot ban yourself")
     user.is_active = False
-    db.commit()
-    db.refresh(user)
+    await bump_users_version(db)
+    await db.commit()
+    principal_cache.invalidate(user.id)
+    await db.refresh(user)
     return user
 
 
-def get_sales_analytics(db: Session) -> Dict[str, Any]:
-    total_orders = db.query(func.count(Order.id)).scalar()
-    total_revenue = db.query(func.sum(OrderItem.price_at_purchase * OrderItem.quantity)).join(Order).scalar() or 0
-    top_products = (
-        db.query(Product.name, func.sum(OrderItem.quantity).label("total_sold"))
-        .join(OrderItem)
-        .group_by(Product.id)
-        .order_by(func.sum(OrderItem.quantity).desc())
+async def get_sales_analytics(db: AsyncSession, start_date: Optional[date] = None, end_date: Optional[date] = None) -> Dict[str, Any]:
+    # Served from the daily rollups: cost grows with the number of days in
+    # the range, not with the number of orders
+    day_filters = []
+    product_day_filters = []
+    if start_date:
+        day_filters.append(SalesDaily.day >= start_date)
+        product_day_filters.append(ProductSalesDaily.day >= start_date)
+    if end_date:
+        day_filters.append(SalesDaily.day <= end_date)
+        product_day_filters.append(ProductSalesDaily.day <= end_date)
+
+    totals = (await db.execute(
+        select(func.coalesce(func.sum(SalesDaily.order_count), 0), func.coalesce(func.sum(SalesDaily.revenue), 0))
+        .where(*day_filters)
+    )).one()
+    total_sold = func.sum(ProductSalesDaily.quantity)
+    top_products = await db.execute(
+        select(Product.name, total_sold.label("total_sold"))
+        .join(Product, Product.id == ProductSalesDaily.product_id)
+        .where(*product_day_filters)
+        .group_by(Product.id, Product.name)
+        .order_by(total_sold.desc())
         .limit(5)
-        .all()
     )
     return {
-        "total_orders": total_orders,
-        "total_revenue": float(total_revenue),
+        "start_date": start_date,
+        "end_date": end_date,
+        "total_orders": totals[0],
+        "total_revenue": float(totals[1]),
         "top_5_products": [{"name": p.name, "total_sold": p.total_sold} for p in top_products]
-    }
\ No newline at end of file
+    }
@@ -0,0 +1,20 @@
+from sqlalchemy import select, update, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.modules.auth.models import CacheVersion
+
+
+async def get_cache_version(db: AsyncSession, name: str) -> int:
+    version = await db.scalar(select(CacheVersion.version).where(CacheVersion.name == name))
+    return version or 0
+
+
+async def bump_cache_version(db: AsyncSession, name: str) -> None:
+    """Tell every worker that cache `name` is stale. Runs in the caller's transaction."""
+    result = await db.execute(
+        update(CacheVersion)
+        .where(CacheVersion.name == name)
+        .values(version=CacheVersion.version + 1)
+    )
+    if not result.rowcount:
+        await db.execute(insert(CacheVersion).values(name=name, version=1))
@@ -1,12 +1,13 @@
 from fastapi import Depends
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.shared.exceptions import UnauthorizedException, ForbiddenException
 from app.modules.auth.service import verify_token
 from app.database import get_db
-from app.modules.auth.models import User, Permission, role_permissions
+from app.modules.auth.models import User
+from app.modules.auth.permission_cache import permission_cache
+from app.modules.auth.principal_cache import Principal, principal_cache
 
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/token")
@@ -15,19 +16,23 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/token")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/token")
 
 
-async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> User:
+async def get_current_user(token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)) -> Principal:
     payload = verify_token(token)
     user_id: int = payload.get("sub")
     if user_id is None:
         raise UnauthorizedException("Invalid token")
-    user = db.query(User).filter(User.id == user_id).first()
-    if user is None or not user.is_active:
-        raise UnauthorizedException("User not found or inactive")
-    return user
+    # Common path: served from the principal cache without touching the users table
+    principal = await principal_cache.get(db, int(user_id))
+    if principal is None:
+        user = await db.get(User, int(user_id))
+        if user is None or not user.is_active:
+            raise UnauthorizedException("User not found or inactive")
+        principal = principal_cache.put(user)
+    return principal
 
 
 def require_role(required_role: str):
-    def role_checker(current_user: User = Depends(get_current_user)):
+    async def role_checker(current_user: Principal = Depends(get_current_user)):
         if current_user.role != required_role:
             raise ForbiddenException("Insufficient permissions")
         return current_user
@@ -35,16 +40,9 @@ def require_role(required_role: str):
 
 
 def require_permission(required_permission: str):
-    def permission_checker(current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
-        # Check if user's role has the permission
-        perm = db.query(Permission).filter(Permission.name == required_permission).first()
-        if not perm:
-            raise ForbiddenException("Permission not found")
-        role_perm = db.execute(select(role_permissions).where(
-            role_permissions.c.role == current_user.role,
-            role_permissions.c.permission_id == perm.id
-        )).first()
-        if not role_perm:
+    async def permission_checker(current_user: Principal = Depends(get_current_user), db: AsyncSession = Depends(get_db)):
+        # Served from the per-process cache; db is only touched on a version check
+        if not await permission_cache.has_permission(db, current_user.role, required_permission):
             raise ForbiddenException("Insufficient permissions")
         return current_user
-    return permission_checker
\ No newline at end of file
+    return permission_checker
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Table
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Index, Table
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from datetime import datetime
 
@@ -17,14 +17,24 @@ class User(Base):
     bio: Mapped[str | None] = mapped_column(String, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
 
+    # Admin user search: keyset on id within each filter, and email prefix
+    # matching (text_pattern_ops lets Postgres use the index for LIKE 'x%')
+    __table_args__ = (
+        Index("ix_users_role_id", "role", "id"),
+        Index("ix_users_role_is_active_id", "role", "is_active", "id"),
+        Index("ix_users_is_active_id", "is_active", "id"),
+        Index("ix_users_email_pattern", "email", postgresql_ops={"email": "text_pattern_ops"}),
+    )
+
 
 class RefreshToken(Base):
     __tablename__ = "refresh_tokens"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"))
-    token: Mapped[str] = mapped_column(String, unique=True, index=True)
-    expires_at: Mapped[datetime] = mapped_column(DateTime)
+    # SHA-256 hex digest of the JWT; the raw token is never stored
+    token_hash: Mapped[str] = mapped_column(String(64), unique=True, index=True)
+    expires_at: Mapped[datetime] = mapped_column(DateTime, index=True)
     revoked: Mapped[bool] = mapped_column(Boolean, default=False)
 
     user = relationship("User")
@@ -42,4 +52,12 @@ role_permissions = Table(
     Base.metadata,
     Column("role", String, primary_key=True),
     Column("permission_id", Integer, ForeignKey("permissions.id"), primary_key=True)
-)
\ No newline at end of file
+)
+
+
+class CacheVersion(Base):
+    """Version counters that tell every worker when a cached table changed."""
+    __tablename__ = "cache_versions"
+
+    name: Mapped[str] = mapped_column(String, primary_key=True)
+    version: Mapped[int] = mapped_column(Integer, default=0)
@@ -0,0 +1,84 @@
+import asyncio
+import time
+from typing import Dict, FrozenSet
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.modules.auth.cache_versions import get_cache_version, bump_cache_version
+from app.modules.auth.models import Permission, role_permissions
+
+
+PERMISSIONS_VERSION_KEY = "role_permissions"
+
+
+async def get_permissions_version(db: AsyncSession) -> int:
+    return await get_cache_version(db, PERMISSIONS_VERSION_KEY)
+
+
+async def bump_permissions_version(db: AsyncSession) -> None:
+    """Mark role permissions as changed. Runs in the caller's transaction."""
+    await bump_cache_version(db, PERMISSIONS_VERSION_KEY)
+
+
+class PermissionCache:
+    """
+    Per-process map of role -> frozenset of permission names.
+
+    Lookups are plain set membership. At most once every check_interval
+    seconds a lookup also reads the version counter, and the map is reloaded
+    only when another process has bumped it.
+    """
+
+    def __init__(self, check_interval: float):
+        self.check_interval = check_interval
+        self._lock = asyncio.Lock()
+        self._permissions: Dict[str, FrozenSet[str]] = {}
+        self._version: int | None = None
+        self._checked_at = 0.0
+
+    def _is_fresh(self) -> bool:
+        return self._version is not None and time.monotonic() - self._checked_at < self.check_interval
+
+    async def load(self, db: AsyncSession) -> None:
+        async with self._lock:
+            await self._reload(db, await get_permissions_version(db))
+
+    async def _reload(self, db: AsyncSession, version: int) -> None:
+        rows = await db.execute(
+            select(role_permissions.c.role, Permission.name)
+            .join(Permission, Permission.id == role_permissions.c.permission_id)
+        )
+        grouped: Dict[str, set] = {}
+        for role, name in rows:
+            grouped.setdefault(role, set()).add(name)
+        self._permissions = {role: frozenset(names) for role, names in grouped.items()}
+        self._version = version
+        self._checked_at = time.monotonic()
+
+    async def _refresh(self, db: AsyncSession) -> None:
+        # Concurrent requests wait here for one version check instead of each running it
+        async with self._lock:
+            if self._is_fresh():
+                return
+            version = await get_permissions_version(db)
+            if version != self._version:
+                await self._reload(db, version)
+            else:
+                self._checked_at = time.monotonic()
+
+    async def permissions_for(self, db: AsyncSession, role: str) -> FrozenSet[str]:
+        if not self._is_fresh():
+            await self._refresh(db)
+        return self._permissions.get(role, frozenset())
+
+    async def has_permission(self, db: AsyncSession, role: str, permission: str) -> bool:
+        return permission in await self.permissions_for(db, role)
+
+    def invalidate(self) -> None:
+        """Force the next lookup in this process to re-check the version."""
+        self._version = None
+
+
+permission_cache = PermissionCache(settings.CACHE_VERSION_CHECK_SECONDS)
@@ -0,0 +1,91 @@
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.modules.auth.cache_versions import get_cache_version, bump_cache_version
+from app.modules.auth.models import User
+
+
+USERS_VERSION_KEY = "users"
+
+
+@dataclass(frozen=True)
+class Principal:
+    """The authenticated caller: just what auth checks and routes need."""
+    id: int
+    email: str
+    role: str
+    is_active: bool
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        return cls(id=user.id, email=user.email, role=user.role, is_active=user.is_active)
+
+
+async def bump_users_version(db: AsyncSession) -> None:
+    """Drop cached principals in every worker. Runs in the caller's transaction."""
+    await bump_cache_version(db, USERS_VERSION_KEY)
+
+
+class PrincipalCache:
+    """
+    Per-process user id -> Principal cache with a short TTL, holding at most
+    max_entries users (least recently used are evicted first).
+
+    Changes made in this process evict the entry immediately; other workers
+    notice the bumped users version within check_interval seconds and clear
+    their whole cache.
+    """
+
+    def __init__(self, ttl: float, check_interval: float, max_entries: int = 10000):
+        self.ttl = ttl
+        self.check_interval = check_interval
+        self.max_entries = max_entries
+        self._lock = asyncio.Lock()
+        self._entries: "OrderedDict[int, Tuple[Principal, float]]" = OrderedDict()
+        self._version: int | None = None
+        self._checked_at = 0.0
+
+    async def _check_version(self, db: AsyncSession) -> None:
+        async with self._lock:
+            if self._version is not None and time.monotonic() - self._checked_at < self.check_interval:
+                return
+            version = await get_cache_version(db, USERS_VERSION_KEY)
+            if version != self._version:
+                self._entries.clear()
+                self._version = version
+            self._checked_at = time.monotonic()
+
+    async def get(self, db: AsyncSession, user_id: int) -> Principal | None:
+        if self._version is None or time.monotonic() - self._checked_at >= self.check_interval:
+            await self._check_version(db)
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+        principal, expires_at = entry
+        if time.monotonic() >= expires_at:
+            self._entries.pop(user_id, None)
+            return None
+        self._entries.move_to_end(user_id)
+        return principal
+
+    def put(self, user: User) -> Principal:
+        principal = Principal.from_user(user)
+        self._entries[user.id] = (principal, time.monotonic() + self.ttl)
+        self._entries.move_to_end(user.id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return principal
+
+    def invalidate(self, user_id: int) -> None:
+        self._entries.pop(user_id, None)
+
+
+principal_cache = PrincipalCache(
+    settings.USER_CACHE_TTL_SECONDS, settings.CACHE_VERSION_CHECK_SECONDS, settings.USER_CACHE_MAX_ENTRIES
+)
@@ -1,10 +1,13 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import delete, func, or_, select, update
 from datetime import datetime
 
-from app.modules.auth.models import User, RefreshToken
+from app.modules.auth.models import User, RefreshToken, Permission, role_permissions
+from app.modules.auth.permission_cache import bump_permissions_version, permission_cache
+from app.modules.auth.service import hash_refresh_token
 
 
-def create_user(db: Session, email: str, hashed_password: str, role: str = "user", full_name: str | None = None, bio: str | None = None) -> User:
+async def create_user(db: AsyncSession, email: str, hashed_password: str, role: str = "user", full_name: str | None = None, bio: str | None = None) -> User:
     new_user = User(
         email=email,
         hashed_password=hashed_password,
@@ -13,31 +16,93 @@ def create_user(db: Session, email: str, hashed_password: str, role: str = "user
         bio=bio
     )
     db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    await db.commit()
+    await db.refresh(new_user)
     return new_user
 
 
-def get_user_by_email(db: Session, email: str) -> User | None:
-    return db.query(User).filter(User.email == email).first()
+async def get_user_by_email(db: AsyncSession, email: str) -> User | None:
+    return await db.scalar(select(User).where(User.email == email))
 
 
-def create_refresh_token(db: Session, token: str, user_id: int, expires_at: datetime) -> RefreshToken:
-    refresh_token = RefreshToken(token=token, user_id=user_id, expires_at=expires_at)
+async def create_refresh_token(db: AsyncSession, token: str, user_id: int, expires_at: datetime) -> RefreshToken:
+    refresh_token = RefreshToken(token_hash=hash_refresh_token(token), user_id=user_id, expires_at=expires_at)
     db.add(refresh_token)
-    db.commit()
-    db.refresh(refresh_token)
+    await db.commit()
+    await db.refresh(refresh_token)
     return refresh_token
 
 
-def get_refresh_token(db: Session, token: str) -> RefreshToken | None:
-    return db.query(RefreshToken).filter(RefreshToken.token == token).first()
+async def get_refresh_token(db: AsyncSession, token: str) -> RefreshToken | None:
+    return await db.scalar(select(RefreshToken).where(RefreshToken.token_hash == hash_refresh_token(token)))
 
 
-def revoke_refresh_token(db: Session, token: str) -> bool:
-    db_token = db.query(RefreshToken).filter(RefreshToken.token == token).first()
-    if db_token:
-        db_token.revoked = True
-        db.commit()
-        return True
-    return False
\ No newline at end of file
+async def revoke_refresh_token(db: AsyncSession, token: str) -> bool:
+    result = await db.execute(
+        update(RefreshToken)
+        .where(RefreshToken.token_hash == hash_refresh_token(token))
+        .values(revoked=True)
+    )
+    await db.commit()
+    return bool(result.rowcount)
+
+
+async def purge_refresh_tokens(db: AsyncSession, batch_size: int, now: datetime | None = None) -> tuple[int, int]:
+    """
+    Delete expired and revoked refresh tokens, batch_size rows per transaction,
+    so the purge never holds long locks on the table. Returns (rows, batches).
+    """
+    now = now or datetime.utcnow()
+    deleted = batches = 0
+    while True:
+        batch = (
+            select(RefreshToken.id)
+            .where(or_(RefreshToken.expires_at < now, RefreshToken.revoked.is_(True)))
+            .limit(batch_size)
+        )
+        result = await db.execute(delete(RefreshToken).where(RefreshToken.id.in_(batch)))
+        await db.commit()
+        batches += 1
+        deleted += result.rowcount
+        if result.rowcount < batch_size:
+            return deleted, batches
+
+
+async def get_refresh_token_stats(db: AsyncSession, now: datetime | None = None) -> dict:
+    now = now or datetime.utcnow()
+    purgeable = or_(RefreshToken.expires_at < now, RefreshToken.revoked.is_(True))
+    total, stale = (await db.execute(
+        select(func.count(RefreshToken.id), func.count(RefreshToken.id).filter(purgeable))
+    )).one()
+    return {"total": total, "active": total - stale, "purgeable": stale}
+
+
+async def grant_role_permission(db: AsyncSession, role: str, permission_name: str) -> bool:
+    perm = await db.scalar(select(Permission).where(Permission.name == permission_name))
+    if not perm:
+        return False
+    existing = (await db.execute(select(role_permissions).where(
+        role_permissions.c.role == role,
+        role_permissions.c.permission_id == perm.id
+    ))).first()
+    if not existing:
+        await db.execute(role_permissions.insert().values(role=role, permission_id=perm.id))
+        await bump_permissions_version(db)
+        await db.commit()
+        permission_cache.invalidate()
+    return True
+
+
+async def revoke_role_permission(db: AsyncSession, role: str, permission_name: str) -> bool:
+    perm = await db.scalar(select(Permission).where(Permission.name == permission_name))
+    if not perm:
+        return False
+    result = await db.execute(delete(role_permissions).where(
+        role_permissions.c.role == role,
+        role_permissions.c.permission_id == perm.id
+    ))
+    if result.rowcount:
+        await bump_permissions_version(db)
+        await db.commit()
+        permission_cache.invalidate()
+    return True
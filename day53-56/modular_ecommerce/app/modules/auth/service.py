@@ -2,6 +2,8 @@ from passlib.context import CryptContext
 from jose import JWTError, jwt
 from datetime import datetime, timedelta
 from fastapi import HTTPException
+from starlette.concurrency import run_in_threadpool
+import hashlib
 
 from app.config import settings
 
@@ -17,6 +19,15 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+# bcrypt is deliberately slow; run it on the threadpool so it never blocks the event loop
+async def hash_password_async(password: str) -> str:
+    return await run_in_threadpool(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await run_in_threadpool(verify_password, plain_password, hashed_password)
+
+
 def create_access_token(data: dict, expires_delta: timedelta | None = None) -> str:
     to_encode = data.copy()
     if expires_delta:
@@ -39,6 +50,12 @@ def create_refresh_token(data: dict, expires_delta: timedelta | None = None) ->
     return encoded_jwt
 
 
+def hash_refresh_token(token: str) -> str:
+    # Refresh tokens are long random JWTs, so a plain SHA-256 is enough; it
+    # gives a fixed 64-char key for the index and keeps raw tokens out of the db
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
 def verify_token(token: str) -> dict:
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
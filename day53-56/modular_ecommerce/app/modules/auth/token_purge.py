@@ -0,0 +1,59 @@
+import asyncio
+import logging
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime
+
+from app.config import settings
+from app.database import SessionLocal
+from app.modules.auth.repository import purge_refresh_tokens
+
+
+@dataclass
+class PurgeMetrics:
+    """Running totals for this process's refresh-token purges."""
+    runs: int = 0
+    rows_deleted: int = 0
+    batches: int = 0
+    last_run_at: datetime | None = None
+    last_rows_deleted: int = 0
+    last_duration_seconds: float = 0.0
+    last_rows_per_second: float = 0.0
+    last_error: str | None = None
+
+    def record(self, rows: int, batches: int, duration: float) -> None:
+        self.runs += 1
+        self.rows_deleted += rows
+        self.batches += batches
+        self.last_run_at = datetime.utcnow()
+        self.last_rows_deleted = rows
+        self.last_duration_seconds = duration
+        self.last_rows_per_second = rows / duration if duration else 0.0
+        self.last_error = None
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+purge_metrics = PurgeMetrics()
+
+
+async def run_token_purge(batch_size: int = settings.REFRESH_TOKEN_PURGE_BATCH_SIZE) -> int:
+    started = time.perf_counter()
+    async with SessionLocal() as db:
+        rows, batches = await purge_refresh_tokens(db, batch_size)
+    duration = time.perf_counter() - started
+    purge_metrics.record(rows, batches, duration)
+    logging.info(f"Purged {rows} refresh tokens in {batches} batches ({duration:.2f}s)")
+    return rows
+
+
+async def purge_forever(interval: float) -> None:
+    """Background task started by app.main; a failed run is logged and retried next interval."""
+    while True:
+        try:
+            await run_token_purge()
+        except Exception as e:
+            purge_metrics.last_error = str(e)
+            logging.error(f"Refresh token purge failed: {e}")
+        await asyncio.sleep(interval)
@@ -1,6 +1,6 @@
-from sqlalchemy import Column, Integer, String, DECIMAL, ForeignKey, DateTime, Enum
+from sqlalchemy import Column, Integer, String, DECIMAL, ForeignKey, DateTime, Date, Enum
 from sqlalchemy.orm import relationship, Mapped, mapped_column
-from datetime import datetime
+from datetime import date, datetime
 import enum
 
 from app.database import Base
@@ -29,10 +29,30 @@ class OrderItem(Base):
     __tablename__ = "order_items"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
-    order_id: Mapped[int] = mapped_column(Integer, ForeignKey("orders.id"))
+    order_id: Mapped[int] = mapped_column(Integer, ForeignKey("orders.id"), index=True)
     product_id: Mapped[int] = mapped_column(Integer, ForeignKey("products.id"))
     quantity: Mapped[int] = mapped_column(Integer)
     price_at_purchase: Mapped[DECIMAL] = mapped_column(DECIMAL(10, 2))
 
     order = relationship("Order", back_populates="items")
-    product = relationship("Product")
\ No newline at end of file
+    product = relationship("Product")
+
+
+class SalesDaily(Base):
+    """Running sales totals per UTC day, maintained by checkout."""
+    __tablename__ = "sales_daily"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    order_count: Mapped[int] = mapped_column(Integer, default=0)
+    items_sold: Mapped[int] = mapped_column(Integer, default=0)
+    revenue: Mapped[DECIMAL] = mapped_column(DECIMAL(14, 2), default=0)
+
+
+class ProductSalesDaily(Base):
+    """Units and revenue per product per UTC day, maintained by checkout."""
+    __tablename__ = "product_sales_daily"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    product_id: Mapped[int] = mapped_column(Integer, ForeignKey("products.id"), primary_key=True)
+    quantity: Mapped[int] = mapped_column(Integer, default=0)
+    revenue: Mapped[DECIMAL] = mapped_column(DECIMAL(14, 2), default=0)
@@ -0,0 +1,30 @@
+"""
+Rebuild the sales rollups (sales_daily, product_sales_daily) from orders.
+
+Checkout keeps the rollups current; run this after bulk imports, manual
+fixes to orders, or if the rollups are ever suspected to have drifted.
+Checkouts that commit while it runs may be missed, so run it while
+checkout traffic is paused.
+
+Usage:
+    python -m app.modules.orders.rebuild_rollups
+"""
+
+import asyncio
+import time
+
+from app.database import SessionLocal
+from app.modules.auth import models as auth_models  # noqa: F401  (register users table)
+from app.modules.products import models as product_models  # noqa: F401  (register products table)
+from app.modules.orders.rollups import rebuild_rollups
+
+
+async def main() -> None:
+    started = time.perf_counter()
+    async with SessionLocal() as db:
+        await rebuild_rollups(db)
+    print(f"Sales rollups rebuilt in {time.perf_counter() - started:.2f}s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,79 @@
+from datetime import date
+from decimal import Decimal
+from typing import Dict, Iterable, Tuple
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.modules.orders.models import Order, OrderItem, ProductSalesDaily, SalesDaily
+from app.shared.dialect import dialect_insert
+
+
+async def record_sale(db: AsyncSession, day: date, lines: Iterable[Tuple[int, int, Decimal]]) -> None:
+    """
+    Add one order's (product_id, quantity, unit price) lines to the rollups.
+
+    Runs inside the checkout transaction, so the rollups commit or roll back
+    together with the order.
+    """
+    per_product: Dict[int, Tuple[int, Decimal]] = {}
+    for product_id, quantity, price in lines:
+        sold, revenue = per_product.get(product_id, (0, Decimal(0)))
+        per_product[product_id] = (sold + quantity, revenue + price * quantity)
+
+    # Product rows in id order, matching the checkout's product locks
+    stmt = dialect_insert(db, ProductSalesDaily).values([
+        {"day": day, "product_id": product_id, "quantity": sold, "revenue": revenue}
+        for product_id, (sold, revenue) in sorted(per_product.items())
+    ])
+    await db.execute(stmt.on_conflict_do_update(
+        index_elements=[ProductSalesDaily.day, ProductSalesDaily.product_id],
+        set_={
+            "quantity": ProductSalesDaily.quantity + stmt.excluded.quantity,
+            "revenue": ProductSalesDaily.revenue + stmt.excluded.revenue,
+        },
+    ))
+
+    # Every checkout of the day touches this row; the caller runs it last so
+    # the row lock is held only until the commit that follows
+    stmt = dialect_insert(db, SalesDaily).values(
+        day=day,
+        order_count=1,
+        items_sold=sum(sold for sold, _ in per_product.values()),
+        revenue=sum((revenue for _, revenue in per_product.values()), Decimal(0)),
+    )
+    await db.execute(stmt.on_conflict_do_update(
+        index_elements=[SalesDaily.day],
+        set_={
+            "order_count": SalesDaily.order_count + stmt.excluded.order_count,
+            "items_sold": SalesDaily.items_sold + stmt.excluded.items_sold,
+            "revenue": SalesDaily.revenue + stmt.excluded.revenue,
+        },
+    ))
+
+
+async def rebuild_rollups(db: AsyncSession) -> None:
+    """Recompute both rollup tables from orders and order_items."""
+    day = func.date(Order.created_at)
+    line_revenue = OrderItem.price_at_purchase * OrderItem.quantity
+
+    await db.execute(delete(ProductSalesDaily))
+    await db.execute(delete(SalesDaily))
+    await db.execute(insert(ProductSalesDaily).from_select(
+        ["day", "product_id", "quantity", "revenue"],
+        select(day, OrderItem.product_id, func.sum(OrderItem.quantity), func.sum(line_revenue))
+        .join(Order, Order.id == OrderItem.order_id)
+        .group_by(day, OrderItem.product_id),
+    ))
+    items = (
+        select(OrderItem.order_id, func.sum(OrderItem.quantity).label("items_sold"), func.sum(line_revenue).label("revenue"))
+        .group_by(OrderItem.order_id)
+        .subquery()
+    )
+    await db.execute(insert(SalesDaily).from_select(
+        ["day", "order_count", "items_sold", "revenue"],
+        select(day, func.count(Order.id), func.coalesce(func.sum(items.c.items_sold), 0), func.coalesce(func.sum(items.c.revenue), 0))
+        .outerjoin(items, items.c.order_id == Order.id)
+        .group_by(day),
+    ))
+    await db.commit()
@@ -1,12 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 
 from app.database import get_db
 from app.modules.auth.dependencies import get_current_user, require_role
-from app.modules.auth.models import User
-from app.modules.orders.models import Order, OrderItem
-from app.modules.orders.schemas import OrderCreate, OrderOut, OrderItemOut
+from app.modules.auth.principal_cache import Principal
+from app.modules.orders.schemas import OrderCreate, OrderOut
 from app.modules.orders.service import checkout_order, get_user_orders, get_order_by_id
 
 
@@ -14,26 +13,21 @@ router = APIRouter()
 
 
 @router.post("/", response_model=OrderOut)
-def create_order(order: OrderCreate, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
-    new_order = checkout_order(db, current_user.id, order)
-    return get_order_by_id(db, new_order.id, current_user.id)
+async def create_order(order: OrderCreate, current_user: Principal = Depends(get_current_user), db: AsyncSession = Depends(get_db)):
+    new_order = await checkout_order(db, current_user.id, order)
+    return await get_order_by_id(db, new_order.id, current_user.id)
 
 
 @router.get("/", response_model=List[OrderOut])
-def read_user_orders(skip: int = 0, limit: int = Query(10, le=100), current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
-    return get_user_orders(db, current_user.id, skip, limit)
+async def read_user_orders(skip: int = 0, limit: int = Query(10, le=100), current_user: Principal = Depends(get_current_user), db: AsyncSession = Depends(get_db)):
+    return await get_user_orders(db, current_user.id, skip, limit)
 
 
 @router.get("/{order_id}", response_model=OrderOut)
-def read_order(order_id: int, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
-    order = get_order_by_id(db, order_id, current_user.id)
+async def read_order(order_id: int, current_user: Principal = Depends(get_current_user), db: AsyncSession = Depends(get_db)):
+    # Allow admin to view any order
+    owner_id = None if current_user.role == "admin" else current_user.id
+    order = await get_order_by_id(db, order_id, owner_id)
     if not order:
-        # Allow admin to view any order
-        if current_user.role == "admin":
-            order = db.query(Order).filter(Order.id == order_id).first()
-            if order:
-                items = db.query(OrderItem).filter(OrderItem.order_id == order.id).all()
-                item_outs = [OrderItemOut(id=i.id, product_id=i.product_id, quantity=i.quantity, price_at_purchase=i.price_at_purchase) for i in items]
-                return OrderOut(id=order.id, user_id=order.user_id, status=order.status.value, total_price=order.total_price, created_at=order.created_at, items=item_outs)
         raise HTTPException(status_code=404, detail="Order not found")
-    return order
\ No newline at end of file
+    return order
@@ -1,65 +1,119 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import func
-from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import insert, select, update
+from typing import Dict, List, Optional
 from decimal import Decimal
 from fastapi import HTTPException
 
 from app.modules.orders.models import Order, OrderItem, OrderStatus
+from app.modules.orders.rollups import record_sale
 from app.modules.orders.schemas import OrderCreate, OrderOut, OrderItemOut
 from app.modules.products.models import Product
+from app.shared.dataloader import get_loader
 
 
-def checkout_order(db: Session, user_id: int, order_data: OrderCreate) -> Order:
-    # Validate stock and calculate total
-    total = Decimal(0)
-    items_to_create = []
+async def checkout_order(db: AsyncSession, user_id: int, order_data: OrderCreate) -> Order:
+    # Total quantity per product, so repeated lines are checked against stock together
+    wanted: Dict[int, int] = {}
     for item in order_data.items:
-        product = db.query(Product).filter(Product.id == item.product_id).first()
-        if not product:
-            raise HTTPException(status_code=400, detail=f"Product {item.product_id} not found")
-        if product.stock < item.quantity:
-            raise HTTPException(status_code=400, detail=f"Insufficient stock for product {item.product_id}")
-        total += product.price * item.quantity
-        items_to_create.append((product, item.quantity, product.price))
-
-    # Atomic transaction
+        if item.quantity <= 0:
+            raise HTTPException(status_code=400, detail=f"Invalid quantity for product {item.product_id}")
+        wanted[item.product_id] = wanted.get(item.product_id, 0) + item.quantity
+    if not wanted:
+        raise HTTPException(status_code=400, detail="Order has no items")
+
     try:
-        # Deduct stock
-        for product, quantity, _ in items_to_create:
-            product.stock -= quantity
+        # Lock every product row in one statement, always in id order, so two
+        # checkouts over the same products queue up instead of deadlocking
+        result = await db.execute(
+            select(Product)
+            .where(Product.id.in_(wanted))
+            .order_by(Product.id)
+            .with_for_update()
+        )
+        by_id = {p.id: p for p in result.scalars()}
+
+        # Validate stock and calculate total
+        total = Decimal(0)
+        for item in order_data.items:
+            product = by_id.get(item.product_id)
+            if not product:
+                raise HTTPException(status_code=400, detail=f"Product {item.product_id} not found")
+            if product.stock < wanted[product.id]:
+                raise HTTPException(status_code=400, detail=f"Insufficient stock for product {item.product_id}")
+            total += product.price * item.quantity
+
+        # Deduct stock; the stock >= quantity guard also holds on databases
+        # without row locks (SQLite), where the check above may be stale
+        for product_id, quantity in wanted.items():
+            result = await db.execute(
+                update(Product)
+                .where(Product.id == product_id, Product.stock >= quantity)
+                .values(stock=Product.stock - quantity)
+            )
+            if not result.rowcount:
+                raise HTTPException(status_code=400, detail=f"Insufficient stock for product {product_id}")
 
         # Create order
         new_order = Order(user_id=user_id, total_price=total)
         db.add(new_order)
-        db.flush()  # Get order.id
+        await db.flush()  # Get order.id
 
-        # Create order items
-        for product, quantity, price in items_to_create:
-            order_item = OrderItem(order_id=new_order.id, product_id=product.id, quantity=quantity, price_at_purchase=price)
-            db.add(order_item)
+        # Create order items in one bulk insert
+        await db.execute(insert(OrderItem), [
+            {"order_id": new_order.id, "product_id": item.product_id, "quantity": item.quantity, "price_at_purchase": by_id[item.product_id].price}
+            for item in order_data.items
+        ])
 
-        db.commit()
-        db.refresh(new_order)
+        # Sales rollups for the admin reports, in the same transaction
+        await record_sale(db, new_order.created_at.date(), [
+            (item.product_id, item.quantity, by_id[item.product_id].price) for item in order_data.items
+        ])
+
+        await db.commit()
+        await db.refresh(new_order)
         return new_order
-    except Exception as e:
-        db.rollback()
+    except HTTPException:
+        await db.rollback()
+        raise
+    except Exception:
+        await db.rollback()
         raise HTTPException(status_code=400, detail="Order failed due to error")
 
 
-def get_user_orders(db: Session, user_id: int, skip: int = 0, limit: int = 10) -> List[OrderOut]:
-    orders = db.query(Order).filter(Order.user_id == user_id).offset(skip).limit(limit).all()
-    result = []
-    for o in orders:
-        items = db.query(OrderItem).filter(OrderItem.order_id == o.id).all()
-        item_outs = [OrderItemOut(id=i.id, product_id=i.product_id, quantity=i.quantity, price_at_purchase=i.price_at_purchase) for i in items]
-        result.append(OrderOut(id=o.id, user_id=o.user_id, status=o.status.value, total_price=o.total_price, created_at=o.created_at, items=item_outs))
-    return result
+async def _items_by_order(db: AsyncSession, order_ids: List[int]) -> Dict[int, List[OrderItem]]:
+    items: Dict[int, List[OrderItem]] = {order_id: [] for order_id in order_ids}
+    result = await db.execute(select(OrderItem).where(OrderItem.order_id.in_(order_ids)).order_by(OrderItem.id))
+    for item in result.scalars():
+        items[item.order_id].append(item)
+    return items
+
 
+def _to_order_out(o: Order, items: List[OrderItem]) -> OrderOut:
+    item_outs = [OrderItemOut(id=i.id, product_id=i.product_id, quantity=i.quantity, price_at_purchase=i.price_at_purchase) for i in items]
+    return OrderOut(id=o.id, user_id=o.user_id, status=o.status.value, total_price=o.total_price, created_at=o.created_at, items=item_outs)
+
+
+async def get_user_orders(db: AsyncSession, user_id: int, skip: int = 0, limit: int = 10) -> List[OrderOut]:
+    # Two statements per page: the orders, then every item of the page in one batched IN query
+    result = await db.execute(
+        select(Order)
+        .where(Order.user_id == user_id)
+        .order_by(Order.id.desc())
+        .offset(skip)
+        .limit(limit)
+    )
+    orders = result.scalars().all()
+    items = await get_loader(db, _items_by_order).load_many(o.id for o in orders)
+    return [_to_order_out(o, order_items) for o, order_items in zip(orders, items)]
 
-def get_order_by_id(db: Session, order_id: int, user_id: int) -> Optional[OrderOut]:
-    o = db.query(Order).filter(Order.id == order_id, Order.user_id == user_id).first()
+
+async def get_order_by_id(db: AsyncSession, order_id: int, user_id: Optional[int] = None) -> Optional[OrderOut]:
+    # user_id=None skips the ownership filter (admin access)
+    query = select(Order).where(Order.id == order_id)
+    if user_id is not None:
+        query = query.where(Order.user_id == user_id)
+    result = await db.execute(query)
+    o = result.scalar_one_or_none()
     if not o:
         return None
-    items = db.query(OrderItem).filter(OrderItem.order_id == o.id).all()
-    item_outs = [OrderItemOut(id=i.id, product_id=i.product_id, quantity=i.quantity, price_at_purchase=i.price_at_purchase) for i in items]
-    return OrderOut(id=o.id, user_id=o.user_id, status=o.status.value, total_price=o.total_price, created_at=o.created_at, items=item_outs)
\ No newline at end of file
+    return _to_order_out(o, await get_loader(db, _items_by_order).load(o.id))
@@ -0,0 +1,48 @@
+"""
+Consistency check for the denormalized product rating totals.
+
+Compares products.rating_sum / rating_count with the reviews table and
+reports every product that has drifted. With --fix the stored totals are
+rewritten from the reviews.
+
+Usage:
+    python -m app.modules.products.check_ratings
+    python -m app.modules.products.check_ratings --fix
+"""
+
+import argparse
+import asyncio
+import sys
+
+from app.database import SessionLocal
+from app.modules.auth import models as auth_models  # noqa: F401  (register users table)
+from app.modules.products.service import find_rating_drift, repair_rating_drift
+
+
+async def check(fix: bool) -> int:
+    async with SessionLocal() as db:
+        drifted = await find_rating_drift(db)
+        for row in drifted:
+            print(
+                f"product {row['product_id']}: stored {row['stored_sum']}/{row['stored_count']}, "
+                f"actual {row['actual_sum']}/{row['actual_count']}"
+            )
+        if not drifted:
+            print("All product rating totals are consistent.")
+            return 0
+        if fix:
+            print(f"Repaired {await repair_rating_drift(db)} product(s).")
+            return 0
+        print(f"{len(drifted)} product(s) drifted – rerun with --fix to repair.")
+        return 1
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Check product rating totals against reviews.")
+    parser.add_argument("--fix", action="store_true", help="Rewrite drifted totals from the reviews table")
+    args = parser.parse_args()
+    return asyncio.run(check(args.fix))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,5 @@
-from sqlalchemy import Column, Integer, String, Text, DECIMAL, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, Text, DECIMAL, ForeignKey, DateTime, Index, case, cast, Float
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from datetime import datetime
 
@@ -21,13 +22,29 @@ class Product(Base):
     price: Mapped[DECIMAL] = mapped_column(DECIMAL(10, 2))
     stock: Mapped[int] = mapped_column(Integer, default=0)
     category_id: Mapped[int | None] = mapped_column(Integer, ForeignKey("categories.id"), nullable=True)
+    # Running totals of review ratings, kept in step with the reviews table by
+    # the review service so reads never aggregate reviews
+    rating_sum: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    rating_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
 
     category = relationship("Category")
     reviews = relationship("Review", back_populates="product")
 
+    @hybrid_property
+    def avg_rating(self) -> float | None:
+        return self.rating_sum / self.rating_count if self.rating_count else None
+
+    @avg_rating.inplace.expression
+    @classmethod
+    def _avg_rating_expression(cls):
+        return case((cls.rating_count > 0, cast(cls.rating_sum, Float) / cls.rating_count), else_=None)
+
 
 class Review(Base):
     __tablename__ = "reviews"
+    __table_args__ = (
+        Index("ix_reviews_product_id_created_at", "product_id", "created_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"))
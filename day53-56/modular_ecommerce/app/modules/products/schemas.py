@@ -41,9 +41,19 @@ class ReviewCreate(BaseModel):
     comment: str
 
 
+class ReviewUpdate(BaseModel):
+    rating: Optional[int] = None
+    comment: Optional[str] = None
+
+
 class ReviewOut(BaseModel):
     id: int
     user_id: int
     rating: int
     comment: str
-    created_at: datetime
\ No newline at end of file
+    created_at: datetime
+
+
+class ReviewPage(BaseModel):
+    items: List[ReviewOut]
+    next_cursor: Optional[str] = None
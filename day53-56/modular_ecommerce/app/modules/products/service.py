@@ -1,48 +1,17 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import func
-from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+from sqlalchemy import exists, func, select, tuple_, update
+from typing import List, Optional, Tuple
+from datetime import datetime
 from decimal import Decimal
+import base64
 
 from app.modules.products.models import Product, Category, Review
-from app.modules.products.schemas import ProductCreate, ProductUpdate, ProductOut, CategoryOut, ReviewCreate, ReviewOut
+from app.modules.products.schemas import ProductCreate, ProductUpdate, ProductOut, CategoryOut, ReviewCreate, ReviewUpdate, ReviewOut, ReviewPage
+from app.shared.exceptions import BadRequestException
 
 
-def get_products(db: Session, skip: int = 0, limit: int = 10, name: Optional[str] = None, category_id: Optional[int] = None, min_price: Optional[Decimal] = None, max_price: Optional[Decimal] = None) -> List[ProductOut]:
-    query = db.query(Product).outerjoin(Category)
-    if name:
-        query = query.filter(Product.name.ilike(f"%{name}%"))
-    if category_id:
-        query = query.filter(Product.category_id == category_id)
-    if min_price:
-        query = query.filter(Product.price >= min_price)
-    if max_price:
-        query = query.filter(Product.price <= max_price)
-    products = query.offset(skip).limit(limit).all()
-    result = []
-    for p in products:
-        avg_rating = db.query(func.avg(Review.rating)).filter(Review.product_id == p.id).scalar()
-        review_count = db.query(func.count(Review.id)).filter(Review.product_id == p.id).scalar()
-        category_out = CategoryOut(id=p.category.id, name=p.category.name) if p.category else None
-        result.append(ProductOut(
-            id=p.id,
-            name=p.name,
-            description=p.description,
-            price=p.price,
-            stock=p.stock,
-            category=category_out,
-            avg_rating=avg_rating,
-            review_count=review_count
-        ))
-    return result
-
-
-def get_product_by_id(db: Session, product_id: int) -> Optional[ProductOut]:
-    p = db.query(Product).outerjoin(Category).filter(Product.id == product_id).first()
-    if not p:
-        return None
-    avg_rating = db.query(func.avg(Review.rating)).filter(Review.product_id == p.id).scalar()
-    review_count = db.query(func.count(Review.id)).filter(Review.product_id == p.id).scalar()
-    reviews = db.query(Review).filter(Review.product_id == p.id).all()
+def _to_product_out(p: Product) -> ProductOut:
     category_out = CategoryOut(id=p.category.id, name=p.category.name) if p.category else None
     return ProductOut(
         id=p.id,
@@ -51,19 +20,44 @@ def get_product_by_id(db: Session, product_id: int) -> Optional[ProductOut]:
         price=p.price,
         stock=p.stock,
         category=category_out,
-        avg_rating=avg_rating,
-        review_count=review_count
+        avg_rating=p.avg_rating,
+        review_count=p.rating_count
     )
 
 
-def create_product(db: Session, product: ProductCreate) -> Product:
+async def get_products(db: AsyncSession, skip: int = 0, limit: int = 10, name: Optional[str] = None, category_id: Optional[int] = None, min_price: Optional[Decimal] = None, max_price: Optional[Decimal] = None) -> List[ProductOut]:
+    # Single statement: ratings are stored on the product, category is joined in
+    query = select(Product).options(joinedload(Product.category))
+    if name:
+        query = query.where(Product.name.ilike(f"%{name}%"))
+    if category_id:
+        query = query.where(Product.category_id == category_id)
+    if min_price:
+        query = query.where(Product.price >= min_price)
+    if max_price:
+        query = query.where(Product.price <= max_price)
+    result = await db.execute(query.order_by(Product.id).offset(skip).limit(limit))
+    return [_to_product_out(p) for p in result.scalars()]
+
+
+async def get_product_by_id(db: AsyncSession, product_id: int) -> Optional[ProductOut]:
+    result = await db.execute(select(Product).options(joinedload(Product.category)).where(Product.id == product_id))
+    p = result.scalar_one_or_none()
+    if not p:
+        return None
+    return _to_product_out(p)
+
+
+async def create_product(db: AsyncSession, product: ProductCreate) -> Product:
     category = None
     if product.category_name:
-        category = db.query(Category).filter(Category.name == product.category_name).first()
+        result = await db.execute(select(Category).where(Category.name == product.category_name))
+        category = result.scalar_one_or_none()
         if not category:
             category = Category(name=product.category_name)
             db.add(category)
-    
+            await db.flush()  # Get category.id
+
     new_product = Product(
         name=product.name,
         description=product.description,
@@ -72,39 +66,143 @@ def create_product(db: Session, product: ProductCreate) -> Product:
         category_id=category.id if category else None
     )
     db.add(new_product)
-    db.commit()
-    db.refresh(new_product)
+    await db.commit()
+    await db.refresh(new_product)
     return new_product
 
 
-def update_product(db: Session, product_id: int, update_data: ProductUpdate) -> Optional[Product]:
-    p = db.query(Product).filter(Product.id == product_id).first()
+async def update_product(db: AsyncSession, product_id: int, update_data: ProductUpdate) -> Optional[Product]:
+    p = await db.get(Product, product_id)
     if not p:
         return None
     for key, value in update_data.model_dump(exclude_unset=True).items():
         setattr(p, key, value)
-    db.commit()
-    db.refresh(p)
+    await db.commit()
+    await db.refresh(p)
     return p
 
 
-def delete_product(db: Session, product_id: int) -> bool:
-    p = db.query(Product).filter(Product.id == product_id).first()
+async def delete_product(db: AsyncSession, product_id: int) -> bool:
+    p = await db.get(Product, product_id)
     if not p:
         return False
-    db.delete(p)
-    db.commit()
+    await db.delete(p)
+    await db.commit()
     return True
 
 
-def create_review(db: Session, product_id: int, user_id: int, review: ReviewCreate) -> Review:
+async def _apply_rating_change(db: AsyncSession, product_id: int, rating_delta: int, count_delta: int) -> None:
+    # Relative UPDATE so concurrent reviews can't overwrite each other's totals;
+    # runs in the caller's transaction alongside the review write
+    await db.execute(
+        update(Product)
+        .where(Product.id == product_id)
+        .values(
+            rating_sum=Product.rating_sum + rating_delta,
+            rating_count=Product.rating_count + count_delta,
+        )
+    )
+
+
+async def create_review(db: AsyncSession, product_id: int, user_id: int, review: ReviewCreate) -> Review:
     new_review = Review(product_id=product_id, user_id=user_id, **review.model_dump())
     db.add(new_review)
-    db.commit()
-    db.refresh(new_review)
+    await _apply_rating_change(db, product_id, new_review.rating, 1)
+    await db.commit()
+    await db.refresh(new_review)
     return new_review
 
 
-def get_reviews_for_product(db: Session, product_id: int) -> List[ReviewOut]:
-    reviews = db.query(Review).filter(Review.product_id == product_id).all()
-    return [ReviewOut(id=r.id, user_id=r.user_id, rating=r.rating, comment=r.comment, created_at=r.created_at) for r in reviews]
\ No newline at end of file
+async def update_review(db: AsyncSession, review_id: int, update_data: ReviewUpdate) -> Optional[Review]:
+    r = await db.get(Review, review_id)
+    if not r:
+        return None
+    old_rating = r.rating
+    for key, value in update_data.model_dump(exclude_unset=True).items():
+        setattr(r, key, value)
+    if r.rating != old_rating:
+        await _apply_rating_change(db, r.product_id, r.rating - old_rating, 0)
+    await db.commit()
+    await db.refresh(r)
+    return r
+
+
+async def delete_review(db: AsyncSession, review_id: int) -> bool:
+    r = await db.get(Review, review_id)
+    if not r:
+        return False
+    await _apply_rating_change(db, r.product_id, -r.rating, -1)
+    await db.delete(r)
+    await db.commit()
+    return True
+
+
+async def product_exists(db: AsyncSession, product_id: int) -> bool:
+    return await db.scalar(select(exists().where(Product.id == product_id)))
+
+
+def _encode_review_cursor(r: Review) -> str:
+    raw = f"{r.created_at.isoformat()}|{r.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_review_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        created_at, review_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(created_at), int(review_id)
+    except ValueError:
+        raise BadRequestException("Invalid cursor")
+
+
+async def get_reviews_for_product(db: AsyncSession, product_id: int, limit: int = 20, cursor: Optional[str] = None) -> ReviewPage:
+    # Newest first, keyset on (created_at, id) so deep pages cost the same as
+    # the first one; served by ix_reviews_product_id_created_at
+    query = select(Review).where(Review.product_id == product_id)
+    if cursor:
+        query = query.where(tuple_(Review.created_at, Review.id) < _decode_review_cursor(cursor))
+    result = await db.execute(query.order_by(Review.created_at.desc(), Review.id.desc()).limit(limit + 1))
+    reviews = result.scalars().all()
+    has_more = len(reviews) > limit
+    reviews = reviews[:limit]
+    return ReviewPage(
+        items=[ReviewOut(id=r.id, user_id=r.user_id, rating=r.rating, comment=r.comment, created_at=r.created_at) for r in reviews],
+        next_cursor=_encode_review_cursor(reviews[-1]) if has_more else None
+    )
+
+
+async def find_rating_drift(db: AsyncSession) -> List[dict]:
+    """Products whose stored rating totals disagree with their reviews."""
+    stats = (
+        select(
+            Review.product_id.label("product_id"),
+            func.coalesce(func.sum(Review.rating), 0).label("rating_sum"),
+            func.count(Review.id).label("rating_count"),
+        )
+        .group_by(Review.product_id)
+        .subquery()
+    )
+    actual_sum = func.coalesce(stats.c.rating_sum, 0)
+    actual_count = func.coalesce(stats.c.rating_count, 0)
+    result = await db.execute(
+        select(Product.id, Product.rating_sum, Product.rating_count, actual_sum, actual_count)
+        .outerjoin(stats, stats.c.product_id == Product.id)
+        .where((Product.rating_sum != actual_sum) | (Product.rating_count != actual_count))
+        .order_by(Product.id)
+    )
+    return [
+        {"product_id": pid, "stored_sum": s_sum, "stored_count": s_count, "actual_sum": a_sum, "actual_count": a_count}
+        for pid, s_sum, s_count, a_sum, a_count in result.all()
+    ]
+
+
+async def repair_rating_drift(db: AsyncSession) -> int:
+    """Rewrite the stored totals of drifted products from their reviews."""
+    drifted = await find_rating_drift(db)
+    for row in drifted:
+        await db.execute(
+            update(Product)
+            .where(Product.id == row["product_id"])
+            .values(rating_sum=row["actual_sum"], rating_count=row["actual_count"])
+        )
+    await db.commit()
+    return len(drifted)
@@ -1,22 +1,24 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
 from typing import List
 
 from app.modules.auth.models import User
 
 
-def get_user_by_id(db: Session, user_id: int) -> User | None:
-    return db.query(User).filter(User.id == user_id).first()
+async def get_user_by_id(db: AsyncSession, user_id: int) -> User | None:
+    return await db.get(User, user_id)
 
 
-def update_user(db: Session, user: User, full_name: str | None = None, bio: str | None = None) -> User:
+async def update_user(db: AsyncSession, user: User, full_name: str | None = None, bio: str | None = None) -> User:
     if full_name is not None:
         user.full_name = full_name
     if bio is not None:
         user.bio = bio
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    await db.refresh(user)
     return user
 
 
-def get_users(db: Session, skip: int = 0, limit: int = 10) -> List[User]:
-    return db.query(User).offset(skip).limit(limit).all()
\ No newline at end of file
+async def get_users(db: AsyncSession, skip: int = 0, limit: int = 10) -> List[User]:
+    result = await db.execute(select(User).offset(skip).limit(limit))
+    return result.scalars().all()
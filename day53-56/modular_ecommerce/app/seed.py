@@ -0,0 +1,96 @@
+"""
+Idempotent seeding of the admin user and the default permissions.
+
+Everything is a handful of set-based INSERT ... ON CONFLICT DO NOTHING
+statements, run in one transaction under a Postgres advisory lock so
+concurrent workers queue up instead of racing. Once a run commits it records
+SEED_VERSION in cache_versions; later runs (other workers, restarts) see the
+marker and stop after a single read. Bump SEED_VERSION whenever the seed
+data below changes.
+
+Run it as a release step and set SEED_ON_STARTUP=false to keep it off the
+workers' boot path entirely:
+    python -m app.seed
+"""
+
+import asyncio
+import logging
+
+from sqlalchemy import func, literal, select, true
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import Base, SessionLocal
+from app.modules.auth.cache_versions import get_cache_version
+from app.modules.auth.models import CacheVersion, Permission, User, role_permissions
+from app.modules.orders import models as order_models  # noqa: F401  (register tables for create_all)
+from app.modules.products import models as product_models  # noqa: F401
+from app.modules.auth.permission_cache import bump_permissions_version
+from app.modules.auth.service import hash_password_async
+from app.shared.dialect import dialect_insert
+
+SEED_VERSION = 1
+SEED_VERSION_KEY = "seed"
+# Arbitrary application-wide key for pg_advisory_xact_lock
+SEED_LOCK_ID = 5356_0001
+
+ADMIN_EMAIL = "admin@example.com"
+ADMIN_PASSWORD = "admin123"
+DEFAULT_PERMISSIONS = ["create:product", "edit:product", "delete:product", "manage:products", "manage:users"]
+
+
+async def _lock(db: AsyncSession) -> None:
+    # Held until the transaction ends. SQLite has no advisory locks, but it
+    # only ever allows one writer, and every insert below is conflict-safe.
+    if db.get_bind().dialect.name == "postgresql":
+        await db.execute(select(func.pg_advisory_xact_lock(SEED_LOCK_ID)))
+
+
+async def seed_database(db: AsyncSession) -> bool:
+    """Create missing tables and seed data. Returns False if this seed version already ran."""
+    await _lock(db)
+    await db.run_sync(lambda session: Base.metadata.create_all(session.connection()))
+    if await get_cache_version(db, SEED_VERSION_KEY) >= SEED_VERSION:
+        await db.commit()
+        return False
+
+    # Only pay for bcrypt when the admin is actually missing
+    if not await db.scalar(select(User.id).where(User.email == ADMIN_EMAIL)):
+        await db.execute(
+            dialect_insert(db, User)
+            .values(email=ADMIN_EMAIL, hashed_password=await hash_password_async(ADMIN_PASSWORD), role="admin", is_active=True, full_name="Admin")
+            .on_conflict_do_nothing(index_elements=[User.email])
+        )
+
+    await db.execute(
+        dialect_insert(db, Permission)
+        .values([{"name": name} for name in DEFAULT_PERMISSIONS])
+        .on_conflict_do_nothing(index_elements=[Permission.name])
+    )
+
+    # Admin gets every permission. SQLite needs a WHERE on the SELECT to
+    # parse the ON CONFLICT clause that follows it.
+    granted = await db.execute(
+        dialect_insert(db, role_permissions)
+        .from_select(["role", "permission_id"], select(literal("admin"), Permission.id).where(true()))
+        .on_conflict_do_nothing(index_elements=[role_permissions.c.role, role_permissions.c.permission_id])
+    )
+    if granted.rowcount:
+        await bump_permissions_version(db)
+
+    marker = dialect_insert(db, CacheVersion).values(name=SEED_VERSION_KEY, version=SEED_VERSION)
+    await db.execute(marker.on_conflict_do_update(index_elements=[CacheVersion.name], set_={"version": SEED_VERSION}))
+    await db.commit()
+    return True
+
+
+async def main() -> None:
+    async with SessionLocal() as db:
+        if await seed_database(db):
+            logging.info("Database seeded (seed version %s).", SEED_VERSION)
+        else:
+            logging.info("Seed version %s already applied, nothing to do.", SEED_VERSION)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
@@ -0,0 +1,86 @@
+"""
+Request-scoped batching loader for relationships.
+
+Services ask for related rows one key at a time (`await loader.load(key)`) or
+for a whole page at once (`load_many`). Keys requested in the same event-loop
+tick are collected and handed to the batch function together, which resolves
+them with one IN query; every result is cached for the rest of the request.
+
+Loaders live on the session (`db.info`), and the session is per request
+(`get_db`), so the cache never outlives the request that filled it.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, List, Set
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# (db, unique keys) -> {key: value}; keys missing from the result load as None
+BatchFn = Callable[[AsyncSession, List[Any]], Awaitable[Dict[Any, Any]]]
+
+
+class DataLoader:
+    def __init__(self, db: AsyncSession, batch_fn: BatchFn, lock: asyncio.Lock):
+        self.db = db
+        self.batch_fn = batch_fn
+        # Shared by every loader on the session: an AsyncSession runs one statement at a time
+        self._lock = lock
+        self._cache: Dict[Hashable, asyncio.Future] = {}
+        self._queue: List[Hashable] = []
+        # The event loop only holds weak references to tasks; keep ours alive until done
+        self._tasks: Set[asyncio.Task] = set()
+
+    def load(self, key: Hashable) -> "asyncio.Future[Any]":
+        future = self._cache.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self._cache[key] = loop.create_future()
+            self._queue.append(key)
+            if len(self._queue) == 1:
+                # First key of this tick; the batch runs once the caller yields
+                task = loop.create_task(self._dispatch())
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+        return future
+
+    async def load_many(self, keys: Iterable[Hashable]) -> List[Any]:
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def prime(self, key: Hashable, value: Any) -> None:
+        """Seed the cache with a value the caller already has."""
+        if key not in self._cache:
+            future = asyncio.get_running_loop().create_future()
+            future.set_result(value)
+            self._cache[key] = future
+
+    def clear(self) -> None:
+        """Forget cached values, e.g. after the request writes to the rows they came from."""
+        self._cache = {key: f for key, f in self._cache.items() if not f.done()}
+
+    async def _dispatch(self) -> None:
+        # One more turn of the loop so sibling tasks started alongside the
+        # first caller get to queue their keys too
+        await asyncio.sleep(0)
+        keys, self._queue = self._queue, []
+        try:
+            async with self._lock:
+                found = await self.batch_fn(self.db, keys)
+        except Exception as e:
+            for key in keys:
+                future = self._cache.pop(key)
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for key in keys:
+            future = self._cache[key]
+            if not future.done():
+                future.set_result(found.get(key))
+
+
+def get_loader(db: AsyncSession, batch_fn: BatchFn) -> DataLoader:
+    """The session's loader for batch_fn, created on first use."""
+    loaders = db.info.setdefault("dataloaders", {})
+    if batch_fn not in loaders:
+        lock = db.info.setdefault("dataloader_lock", asyncio.Lock())
+        loaders[batch_fn] = DataLoader(db, batch_fn, lock)
+    return loaders[batch_fn]
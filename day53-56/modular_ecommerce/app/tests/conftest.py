@@ -0,0 +1,51 @@
+import os
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "test-secret")
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base
+from app.modules.auth import models as auth_models  # noqa: F401  (register tables)
+from app.modules.orders import models as order_models  # noqa: F401
+from app.modules.products import models as product_models  # noqa: F401
+
+
+@pytest_asyncio.fixture
+async def engine():
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def db(engine):
+    async with async_sessionmaker(bind=engine, expire_on_commit=False)() as session:
+        yield session
+
+
+@pytest.fixture
+def count_queries():
+    """Call with a session to start recording every SQL statement its engine runs."""
+    def start(db):
+        statements = []
+
+        @event.listens_for(db.bind.sync_engine, "before_cursor_execute")
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        return statements
+    return start
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Show figures tests recorded with record_property (e.g. the stress test's throughput)."""
+    for report in terminalreporter.stats.get("passed", []):
+        for name, value in report.user_properties:
+            terminalreporter.write_line(f"{report.nodeid}: {name} = {value}")
@@ -0,0 +1,53 @@
+import pytest
+import pytest_asyncio
+
+from app.modules.admin.service import search_users
+from app.modules.auth.models import User
+from app.shared.exceptions import BadRequestException
+
+
+@pytest_asyncio.fixture
+async def users(db):
+    db.add_all([
+        User(email=f"{'staff' if i % 5 == 0 else 'member'}{i}@example.com", hashed_password="x", role="admin" if i % 5 == 0 else "user", is_active=i % 3 != 0)
+        for i in range(60)
+    ])
+    await db.commit()
+
+
+@pytest.mark.asyncio
+async def test_user_search_pages_by_cursor_with_filters(db, users):
+    seen, cursor = [], None
+    while True:
+        page, cursor = await search_users(db, limit=4, cursor=cursor, role="user", is_active=True)
+        seen.extend(page)
+        if not cursor:
+            break
+
+    expected = [i for i in range(60) if i % 5 and i % 3]
+    assert len(seen) == len(expected)
+    assert [u.id for u in seen] == sorted((u.id for u in seen), reverse=True)
+    assert all(u.role == "user" and u.is_active for u in seen)
+
+
+@pytest.mark.asyncio
+async def test_user_search_by_email_prefix(db, users):
+    page, cursor = await search_users(db, limit=100, email_prefix="staff")
+
+    assert len(page) == 12 and cursor is None
+    assert all(u.email.startswith("staff") for u in page)
+    assert (await search_users(db, email_prefix="staff%"))[0] == []
+
+
+@pytest.mark.asyncio
+async def test_email_prefix_pages_in_email_order(db, users):
+    seen, cursor = [], None
+    while True:
+        page, cursor = await search_users(db, limit=5, cursor=cursor, email_prefix="staff")
+        seen.extend(page)
+        if not cursor:
+            break
+
+    assert [u.email for u in seen] == sorted(f"staff{i}@example.com" for i in range(0, 60, 5))
+    with pytest.raises(BadRequestException):
+        await search_users(db, cursor=(await search_users(db, limit=1))[1], email_prefix="staff")
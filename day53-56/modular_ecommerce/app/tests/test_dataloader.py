@@ -0,0 +1,57 @@
+import asyncio
+
+import pytest
+
+from app.shared.dataloader import get_loader
+
+
+def recording_batch(calls):
+    async def double(db, keys):
+        calls.append(list(keys))
+        return {key: key * 2 for key in keys if key != 0}
+    return double
+
+
+@pytest.mark.asyncio
+async def test_loads_in_the_same_tick_share_one_batch(db):
+    calls = []
+    loader = get_loader(db, recording_batch(calls))
+
+    async def resolve(key):
+        return await loader.load(key)
+
+    results = await asyncio.gather(*(resolve(k) for k in (1, 2, 3, 2, 0)))
+
+    assert results == [2, 4, 6, 4, None]
+    assert calls == [[1, 2, 3, 0]]
+
+
+@pytest.mark.asyncio
+async def test_results_are_cached_per_session(db):
+    calls = []
+    batch = recording_batch(calls)
+
+    assert await get_loader(db, batch).load_many([1, 2]) == [2, 4]
+    assert await get_loader(db, batch).load_many([2, 1, 5]) == [4, 2, 10]
+    assert calls == [[1, 2], [5]]
+
+    get_loader(db, batch).clear()
+    await get_loader(db, batch).load(1)
+    assert calls[-1] == [1]
+
+
+@pytest.mark.asyncio
+async def test_batch_errors_reach_every_waiter_and_are_not_cached(db):
+    attempts = []
+
+    async def flaky(db, keys):
+        attempts.append(keys)
+        if len(attempts) == 1:
+            raise RuntimeError("database went away")
+        return {key: key for key in keys}
+
+    loader = get_loader(db, flaky)
+    first = await asyncio.gather(loader.load(1), loader.load(2), return_exceptions=True)
+
+    assert all(isinstance(r, RuntimeError) for r in first)
+    assert await loader.load_many([1, 2]) == [1, 2]
@@ -0,0 +1,47 @@
+from decimal import Decimal
+
+import pytest
+import pytest_asyncio
+
+from app.modules.auth.models import User
+from app.modules.orders.models import Order, OrderItem
+from app.modules.orders.service import get_user_orders, get_order_by_id
+from app.modules.products.models import Product
+
+# Orders + one IN query for all their items, whatever the page size
+MAX_HISTORY_QUERIES = 2
+
+
+@pytest_asyncio.fixture
+async def buyer(db):
+    user = User(email="buyer@example.com", hashed_password="x")
+    product = Product(name="Widget", description="", price=Decimal("5.00"), stock=1000)
+    db.add_all([user, product])
+    await db.flush()
+    for _ in range(50):
+        order = Order(user_id=user.id, total_price=Decimal("15.00"))
+        db.add(order)
+        await db.flush()
+        db.add_all([OrderItem(order_id=order.id, product_id=product.id, quantity=q, price_at_purchase=Decimal("5.00")) for q in (1, 2)])
+    await db.commit()
+    db.expunge_all()
+    return user
+
+
+@pytest.mark.asyncio
+async def test_order_history_runs_constant_number_of_queries(db, buyer, count_queries):
+    statements = count_queries(db)
+    orders = await get_user_orders(db, buyer.id, skip=0, limit=50)
+
+    assert len(orders) == 50
+    assert all(len(o.items) == 2 for o in orders)
+    assert len(statements) <= MAX_HISTORY_QUERIES, statements
+
+
+@pytest.mark.asyncio
+async def test_order_lookup_respects_owner(db, buyer):
+    order_id = (await get_user_orders(db, buyer.id, limit=1))[0].id
+
+    assert await get_order_by_id(db, order_id, buyer.id) is not None
+    assert await get_order_by_id(db, order_id, buyer.id + 1) is None
+    assert await get_order_by_id(db, order_id) is not None
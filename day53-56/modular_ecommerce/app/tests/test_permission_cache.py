@@ -0,0 +1,65 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+
+from app.modules.auth.dependencies import require_permission
+from app.modules.auth.models import Permission
+from app.modules.auth.permission_cache import PermissionCache, permission_cache
+from app.modules.auth.principal_cache import Principal
+from app.modules.auth.repository import grant_role_permission, revoke_role_permission
+from app.shared.exceptions import ForbiddenException
+
+EDITOR = Principal(id=1, email="editor@example.com", role="editor", is_active=True)
+
+
+@pytest_asyncio.fixture
+async def permission(db):
+    db.add(Permission(name="edit:product"))
+    await db.commit()
+    # The cache is process-wide; make it re-read this test's database
+    permission_cache.invalidate()
+    yield "edit:product"
+    permission_cache.invalidate()
+
+
+async def allowed(db, principal, name):
+    try:
+        await require_permission(name)(current_user=principal, db=db)
+        return True
+    except ForbiddenException:
+        return False
+
+
+@pytest.mark.asyncio
+async def test_grant_and_revoke_apply_at_once_in_this_process(db, permission):
+    assert not await allowed(db, EDITOR, permission)
+
+    assert await grant_role_permission(db, "editor", permission)
+    assert await allowed(db, EDITOR, permission)
+
+    assert await revoke_role_permission(db, "editor", permission)
+    assert not await allowed(db, EDITOR, permission)
+
+
+@pytest.mark.asyncio
+async def test_other_workers_pick_up_changes_after_the_check_interval(db, permission):
+    other_worker = PermissionCache(check_interval=0.05)
+    assert not await other_worker.has_permission(db, "editor", permission)
+
+    await grant_role_permission(db, "editor", permission)
+    # Still within the interval: the other worker has not re-checked the version yet
+    assert not await other_worker.has_permission(db, "editor", permission)
+
+    await asyncio.sleep(0.06)
+    assert await other_worker.has_permission(db, "editor", permission)
+
+    await revoke_role_permission(db, "editor", permission)
+    await asyncio.sleep(0.06)
+    assert not await other_worker.has_permission(db, "editor", permission)
+
+
+@pytest.mark.asyncio
+async def test_unknown_permission_is_not_granted(db, permission):
+    assert not await grant_role_permission(db, "editor", "no:such")
+    assert not await revoke_role_permission(db, "editor", "no:such")
@@ -0,0 +1,65 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.modules.admin.service import ban_user, update_user_role
+from app.modules.auth.models import User
+from app.modules.auth.principal_cache import Principal, PrincipalCache, bump_users_version, principal_cache
+
+ADMIN = Principal(id=0, email="root@example.com", role="admin", is_active=True)
+
+
+@pytest_asyncio.fixture
+async def users(db):
+    users = [User(email=f"user{i}@example.com", hashed_password="x") for i in range(3)]
+    db.add_all(users)
+    await db.commit()
+    return users
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_entries_are_evicted(db, users):
+    cache = PrincipalCache(ttl=60, check_interval=60, max_entries=2)
+    await cache.get(db, users[0].id)  # first lookup reads the users version
+    cache.put(users[0])
+    cache.put(users[1])
+    assert await cache.get(db, users[0].id) is not None  # now most recently used
+
+    cache.put(users[2])
+
+    assert await cache.get(db, users[1].id) is None
+    assert await cache.get(db, users[0].id) is not None
+    assert await cache.get(db, users[2].id) is not None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("change", [
+    lambda db, user: ban_user(db, user.id, ADMIN),
+    lambda db, user: update_user_role(db, user.id, "admin", ADMIN),
+])
+async def test_admin_changes_drop_the_cached_principal(db, users, change):
+    user = users[0]
+    await principal_cache.get(db, user.id)
+    principal_cache.put(user)
+    assert await principal_cache.get(db, user.id) is not None
+
+    await change(db, user)
+
+    assert await principal_cache.get(db, user.id) is None
+
+
+@pytest.mark.asyncio
+async def test_version_bump_from_another_session_clears_the_cache(db, engine, users):
+    cache = PrincipalCache(ttl=60, check_interval=0.05)
+    await cache.get(db, users[0].id)
+    for user in users:
+        cache.put(user)
+
+    async with async_sessionmaker(bind=engine)() as other:
+        await bump_users_version(other)
+        await other.commit()
+    await asyncio.sleep(0.06)
+
+    assert all([await cache.get(db, user.id) is None for user in users])
@@ -0,0 +1,82 @@
+from decimal import Decimal
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+
+from app.modules.auth.models import User
+from app.modules.products.models import Category, Product, Review
+from app.modules.products.schemas import ReviewCreate, ReviewUpdate
+from app.modules.products.service import get_products, get_reviews_for_product, create_review, update_review, delete_review, find_rating_drift
+
+# The listing must stay a constant number of statements, whatever the page size
+MAX_LISTING_QUERIES = 1
+
+
+@pytest_asyncio.fixture
+async def catalog(db):
+    user = User(email="reviewer@example.com", hashed_password="x")
+    categories = [Category(name=f"Category {i}") for i in range(5)]
+    db.add(user)
+    db.add_all(categories)
+    await db.flush()
+    products = [
+        Product(name=f"Product {i}", description="", price=Decimal("10.00") + i, stock=10, category_id=categories[i % 5].id if i % 7 else None)
+        for i in range(100)
+    ]
+    db.add_all(products)
+    await db.commit()
+    for p in products[::2]:
+        for rating in (3, 4, 5):
+            await create_review(db, p.id, user.id, ReviewCreate(rating=rating, comment=""))
+    db.expunge_all()
+    return products
+
+
+@pytest.mark.asyncio
+async def test_product_listing_runs_constant_number_of_queries(db, catalog, count_queries):
+    statements = count_queries(db)
+    result = await get_products(db, skip=0, limit=100)
+
+    assert len(result) == 100
+    assert len(statements) <= MAX_LISTING_QUERIES, statements
+
+
+@pytest.mark.asyncio
+async def test_product_listing_ratings_and_categories(db, catalog):
+    result = {p.id: p for p in await get_products(db, skip=0, limit=100)}
+
+    reviewed = result[catalog[0].id]
+    assert reviewed.avg_rating == pytest.approx(4.0)
+    assert reviewed.review_count == 3
+    assert reviewed.category is None
+
+    unreviewed = result[catalog[1].id]
+    assert unreviewed.avg_rating is None
+    assert unreviewed.review_count == 0
+    assert unreviewed.category.name == "Category 1"
+
+
+@pytest.mark.asyncio
+async def test_review_changes_keep_rating_totals_in_sync(db, catalog):
+    lowest = await db.scalar(select(Review.id).where(Review.product_id == catalog[0].id, Review.rating == 3))
+    await update_review(db, lowest, ReviewUpdate(rating=1))
+    highest = await db.scalar(select(Review.id).where(Review.product_id == catalog[0].id, Review.rating == 5))
+    await delete_review(db, highest)
+
+    product = await db.get(Product, catalog[0].id)
+    assert (product.rating_sum, product.rating_count) == (5, 2)
+    assert product.avg_rating == pytest.approx(2.5)
+    assert await find_rating_drift(db) == []
+
+
+@pytest.mark.asyncio
+async def test_reviews_are_paged_newest_first_by_cursor(db, catalog):
+    product_id = catalog[0].id
+    first = await get_reviews_for_product(db, product_id, limit=2)
+    second = await get_reviews_for_product(db, product_id, limit=2, cursor=first.next_cursor)
+
+    ids = [r.id for r in first.items + second.items]
+    assert len(first.items) == 2 and len(second.items) == 1
+    assert ids == sorted(ids, reverse=True)
+    assert second.next_cursor is None
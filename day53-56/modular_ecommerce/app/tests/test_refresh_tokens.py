@@ -0,0 +1,41 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select
+
+from app.modules.auth.models import RefreshToken, User
+from app.modules.auth.repository import create_refresh_token, get_refresh_token, get_refresh_token_stats, purge_refresh_tokens, revoke_refresh_token
+
+
+@pytest.mark.asyncio
+async def test_refresh_tokens_are_stored_as_digests(db):
+    user = User(email="tokens@example.com", hashed_password="x")
+    db.add(user)
+    await db.commit()
+    await create_refresh_token(db, "raw.jwt.value", user.id, datetime.utcnow() + timedelta(days=1))
+
+    stored = await db.scalar(select(RefreshToken.token_hash))
+    assert len(stored) == 64 and "raw.jwt.value" not in stored
+    assert (await get_refresh_token(db, "raw.jwt.value")).user_id == user.id
+    assert await revoke_refresh_token(db, "raw.jwt.value")
+    assert not await revoke_refresh_token(db, "unknown.jwt.value")
+
+
+@pytest.mark.asyncio
+async def test_purge_deletes_expired_and_revoked_in_batches(db):
+    user = User(email="purge@example.com", hashed_password="x")
+    db.add(user)
+    await db.flush()
+    now = datetime.utcnow()
+    db.add_all(
+        [RefreshToken(user_id=user.id, token_hash=f"expired-{i}", expires_at=now - timedelta(days=1)) for i in range(25)]
+        + [RefreshToken(user_id=user.id, token_hash=f"revoked-{i}", expires_at=now + timedelta(days=1), revoked=True) for i in range(5)]
+        + [RefreshToken(user_id=user.id, token_hash=f"active-{i}", expires_at=now + timedelta(days=1)) for i in range(7)]
+    )
+    await db.commit()
+    assert await get_refresh_token_stats(db, now) == {"total": 37, "active": 7, "purgeable": 30}
+
+    deleted, batches = await purge_refresh_tokens(db, batch_size=10, now=now)
+
+    assert (deleted, batches) == (30, 4)
+    assert await db.scalar(select(func.count(RefreshToken.id))) == 7
@@ -0,0 +1,66 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+
+from app.modules.admin.service import get_sales_analytics
+from app.modules.auth.models import User
+from app.modules.orders.models import ProductSalesDaily, SalesDaily
+from app.modules.orders.rollups import rebuild_rollups
+from app.modules.orders.schemas import OrderCreate, OrderItemCreate
+from app.modules.orders.service import checkout_order
+from app.modules.products.models import Product
+
+
+@pytest_asyncio.fixture
+async def sales(db):
+    user = User(email="shopper@example.com", hashed_password="x")
+    products = [Product(name=f"Gadget {i}", description="", price=Decimal("2.50") * (i + 1), stock=100) for i in range(6)]
+    db.add(user)
+    db.add_all(products)
+    await db.commit()
+    for n in range(10):
+        items = [OrderItemCreate(product_id=products[n % 6].id, quantity=n % 3 + 1), OrderItemCreate(product_id=products[0].id, quantity=1)]
+        await checkout_order(db, user.id, OrderCreate(items=items))
+    return products
+
+
+async def _snapshot(db):
+    daily = (await db.execute(select(SalesDaily.day, SalesDaily.order_count, SalesDaily.items_sold, SalesDaily.revenue))).all()
+    per_product = (await db.execute(
+        select(ProductSalesDaily.day, ProductSalesDaily.product_id, ProductSalesDaily.quantity, ProductSalesDaily.revenue)
+        .order_by(ProductSalesDaily.product_id)
+    )).all()
+    return daily, per_product
+
+
+@pytest.mark.asyncio
+async def test_checkout_updates_rollups_and_report(db, sales):
+    report = await get_sales_analytics(db)
+
+    assert report["total_orders"] == 10
+    assert report["total_revenue"] == pytest.approx(sum(
+        float(sales[n % 6].price) * (n % 3 + 1) + float(sales[0].price) for n in range(10)
+    ))
+    assert report["top_5_products"][0] == {"name": "Gadget 0", "total_sold": 12}
+    assert len(report["top_5_products"]) == 5
+
+
+@pytest.mark.asyncio
+async def test_report_date_range_excludes_other_days(db, sales):
+    tomorrow = datetime.utcnow().date() + timedelta(days=1)
+    report = await get_sales_analytics(db, start_date=tomorrow)
+
+    assert report["total_orders"] == 0
+    assert report["total_revenue"] == 0
+    assert report["top_5_products"] == []
+
+
+@pytest.mark.asyncio
+async def test_rebuild_matches_incremental_rollups(db, sales):
+    incremental = await _snapshot(db)
+    await rebuild_rollups(db)
+
+    assert await _snapshot(db) == incremental
@@ -0,0 +1,22 @@
+import pytest
+from sqlalchemy import func, select
+
+from app.modules.auth.models import Permission, User, role_permissions
+from app.modules.auth.permission_cache import get_permissions_version
+from app.seed import DEFAULT_PERMISSIONS, seed_database
+
+
+@pytest.mark.asyncio
+async def test_seed_is_idempotent_and_runs_once(db, count_queries):
+    assert await seed_database(db) is True
+    version = await get_permissions_version(db)
+
+    statements = count_queries(db)
+    assert await seed_database(db) is False
+    # Already seeded: table checks and the marker read, no writes
+    assert not [s for s in statements if s.lstrip().upper().startswith(("INSERT", "UPDATE"))], statements
+
+    assert await db.scalar(select(func.count(User.id)).where(User.role == "admin")) == 1
+    assert await db.scalar(select(func.count(Permission.id))) == len(DEFAULT_PERMISSIONS)
+    assert await db.scalar(select(func.count()).select_from(role_permissions).where(role_permissions.c.role == "admin")) == len(DEFAULT_PERMISSIONS)
+    assert await get_permissions_version(db) == version
@@ -0,0 +1,183 @@
+"""
+Throughput benchmark under many concurrent clients.
+
+Boots app.main with uvicorn against DATABASE_URL and drives a read-heavy,
+mostly authenticated request mix (product listing, product detail, order
+history, profile) from N concurrent httpx clients. Reports requests/sec and
+latency percentiles.
+
+With --baseline-ref the same load is also run against an older revision
+(checked out into a temporary git worktree), so the sync and async
+database layers can be compared on the same machine and database:
+
+    python -m benchmarks.concurrency_bench --clients 200 --duration 20
+    python -m benchmarks.concurrency_bench --clients 200 --baseline-ref <commit-before-async>
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+ADMIN = {"username": "admin@example.com", "password": "admin123"}
+BENCH_USER = {"email": "bench@example.com", "password": "bench123"}
+
+
+def start_server(source: Path, port: int, workers: int) -> subprocess.Popen:
+    command = [
+        sys.executable, "-m", "uvicorn", "app.main:app",
+        "--host", "127.0.0.1",
+        "--port", str(port),
+        "--workers", str(workers),
+        "--log-level", "warning",
+    ]
+    return subprocess.Popen(command, cwd=source, env=os.environ.copy())
+
+
+async def wait_until_up(base_url: str, server: subprocess.Popen, timeout: float = 30.0) -> None:
+    deadline = time.perf_counter() + timeout
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        while time.perf_counter() < deadline:
+            if server.poll() is not None:
+                raise SystemExit(f"Server exited with code {server.returncode} before starting")
+            try:
+                await client.get("/openapi.json")
+                return
+            except httpx.TransportError:
+                await asyncio.sleep(0.25)
+    raise SystemExit(f"Server at {base_url} did not start within {timeout}s")
+
+
+async def prepare(client: httpx.AsyncClient, products: int) -> tuple[dict, list[int]]:
+    """Make sure there is a bench user and some products; return auth headers and product ids."""
+    admin = await client.post("/auth/token", data=ADMIN)
+    admin.raise_for_status()
+    admin_headers = {"Authorization": f"Bearer {admin.json()['access_token']}"}
+
+    existing = (await client.get("/products/", params={"limit": 100})).json()
+    for i in range(len(existing), products):
+        body = {"name": f"Bench product {i}", "description": "benchmark", "price": 9.99, "stock": 1_000_000}
+        (await client.post("/products/", json=body, headers=admin_headers)).raise_for_status()
+    product_ids = [p["id"] for p in (await client.get("/products/", params={"limit": 100})).json()]
+
+    await client.post("/auth/register", json=BENCH_USER)
+    login = await client.post("/auth/token", data={"username": BENCH_USER["email"], "password": BENCH_USER["password"]})
+    login.raise_for_status()
+    headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+    if not (await client.get("/orders/", headers=headers)).json():
+        order = {"items": [{"product_id": pid, "quantity": 1} for pid in product_ids[:3]]}
+        (await client.post("/orders/", json=order, headers=headers)).raise_for_status()
+    return headers, product_ids
+
+
+async def run_load(base_url: str, clients: int, duration: float, products: int, seed: int) -> dict:
+    limits = httpx.Limits(max_connections=clients, max_keepalive_connections=clients)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60.0) as client:
+        headers, product_ids = await prepare(client, products)
+        rng = random.Random(seed)
+        requests = [
+            lambda: ("/products/", {"limit": 20}, None),
+            lambda: (f"/products/{rng.choice(product_ids)}", None, None),
+            lambda: ("/orders/", None, headers),
+            lambda: ("/users/me", None, headers),
+        ]
+        latencies: list[float] = []
+        errors = 0
+        deadline = time.perf_counter() + duration
+
+        async def worker() -> None:
+            nonlocal errors
+            while time.perf_counter() < deadline:
+                path, params, request_headers = rng.choice(requests)()
+                started = time.perf_counter()
+                try:
+                    response = await client.get(path, params=params, headers=request_headers)
+                    if response.status_code >= 400:
+                        errors += 1
+                except httpx.HTTPError:
+                    errors += 1
+                latencies.append((time.perf_counter() - started) * 1000)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(clients)))
+        elapsed = time.perf_counter() - started
+
+    cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+    return {
+        "requests": len(latencies),
+        "rps": len(latencies) / elapsed,
+        "p50_ms": cuts[49],
+        "p95_ms": cuts[94],
+        "p99_ms": cuts[98],
+        "errors": errors,
+    }
+
+
+def benchmark(label: str, source: Path, port: int, args: argparse.Namespace) -> dict:
+    server = start_server(source, port, args.workers)
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        asyncio.run(wait_until_up(base_url, server))
+        print(f"{label}: {args.clients} clients for {args.duration:.0f}s against {base_url}...")
+        result = asyncio.run(run_load(base_url, args.clients, args.duration, args.products, args.seed))
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+    return {"label": label, **result}
+
+
+def print_results(results: list[dict]) -> None:
+    print()
+    print(f"{'version':<22} {'requests':>9} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'errors':>7}")
+    print("-" * 80)
+    for r in results:
+        print(
+            f"{r['label']:<22} {r['requests']:>9} {r['rps']:>9.1f} {r['p50_ms']:>9.1f} "
+            f"{r['p95_ms']:>9.1f} {r['p99_ms']:>9.1f} {r['errors']:>7}"
+        )
+    if len(results) == 2 and results[0]["rps"]:
+        print(f"\nThroughput change: {(results[1]['rps'] / results[0]['rps'] - 1) * 100:+.1f}%")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark API throughput under concurrent clients.")
+    parser.add_argument("--clients", type=int, default=200, help="Concurrent clients")
+    parser.add_argument("--duration", type=float, default=20.0, help="Seconds of load per version")
+    parser.add_argument("--workers", type=int, default=1, help="Uvicorn worker processes")
+    parser.add_argument("--products", type=int, default=50, help="Products to make sure exist")
+    parser.add_argument("--port", type=int, default=8801, help="Port for the current tree")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for the request mix")
+    parser.add_argument("--baseline-ref", help="Git revision to benchmark first, for comparison")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    results = []
+    if args.baseline_ref:
+        with tempfile.TemporaryDirectory() as tmp:
+            worktree = Path(tmp) / "baseline"
+            subprocess.run(["git", "worktree", "add", "--detach", str(worktree), args.baseline_ref], cwd=PROJECT_ROOT, check=True)
+            try:
+                app_dir = worktree / PROJECT_ROOT.relative_to(
+                    subprocess.run(["git", "rev-parse", "--show-toplevel"], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True).stdout.strip()
+                )
+                results.append(benchmark(f"baseline {args.baseline_ref[:12]}", app_dir, args.port + 1, args))
+            finally:
+                subprocess.run(["git", "worktree", "remove", "--force", str(worktree)], cwd=PROJECT_ROOT, check=True)
+    results.append(benchmark("current", PROJECT_ROOT, args.port, args))
+    print_results(results)
+
+
+if __name__ == "__main__":
+    main()